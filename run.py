@@ -7,8 +7,13 @@ import os
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from main import MainApp
-
 if __name__ == "__main__":
+    # python run.py --startup-report: list the slowest imports instead of starting
+    if "--startup-report" in sys.argv:
+        from utils.startup_report import print_startup_report
+        print_startup_report()
+        sys.exit(0)
+
+    from main import MainApp
     app = MainApp()
     app.run()
@@ -0,0 +1,154 @@
+import json
+import os
+import numpy as np
+
+CONF_PATH = os.path.join("src", "ExploreTab", "Configuration.JSON")
+# sigmoid(x) ~= Phi(x * sqrt(pi / 8)) (probit approximation of the logistic)
+_PROBIT_SCALE = np.sqrt(np.pi / 8.0)
+# Constant of the closed-form expected entropy (Houlsby et al., BALD)
+_BALD_C = np.sqrt(np.pi * np.log(2.0) / 2.0)
+
+
+def tournament_config():
+    try:
+        with open(CONF_PATH, "r", encoding="utf-8") as f:
+            return json.load(f).get("Batch 1 Tournament", {}) or {}
+    except Exception:
+        return {}
+
+
+# ---------------------------
+# Expected information gain of a comparison
+# ---------------------------
+def _binary_entropy(p):
+    p = np.clip(p, 1e-12, 1.0 - 1e-12)
+    return -(p * np.log2(p) + (1.0 - p) * np.log2(1.0 - p))
+
+
+def expected_information_gain(mean_diff, var_diff):
+    """Mutual information (bits) between the outcome of i vs j and the scores.
+
+    mean_diff / var_diff are the posterior mean and variance of f_i - f_j;
+    the outcome is Bernoulli(sigmoid(f_i - f_j)). Uses the probit
+    approximation, for which both entropies have a closed form.
+    """
+    from scipy.special import ndtr
+
+    m = _PROBIT_SCALE * np.asarray(mean_diff)
+    s2 = _PROBIT_SCALE ** 2 * np.asarray(var_diff)
+    marginal = _binary_entropy(ndtr(m / np.sqrt(1.0 + s2)))
+    conditional = _BALD_C / np.sqrt(s2 + _BALD_C ** 2) * np.exp(-m ** 2 / (2.0 * (s2 + _BALD_C ** 2)))
+    return marginal - conditional
+
+
+# ---------------------------
+# Active pairing scheduler
+# ---------------------------
+class ActivePairingScheduler:
+    """Chooses the next head-to-head match by expected information gain.
+
+    After every pick the Bradley-Terry scores are refitted (warm start) and
+    the Laplace posterior covariance is used to score all pairs at once.
+    The match with the largest expected information gain is shown next.
+    Scheduling stops when
+      - max_matches picks were made (default: n - 1, the bracket's count),
+      - or, after min_matches picks (default: n // 2), the best match is
+        worth less than min_information_gain bits,
+      - or, after min_matches picks, the ranking is expected to order at
+        least a fraction `confidence` of all design pairs correctly.
+    """
+
+    def __init__(self, num_designs, max_matches=None, min_matches=None, confidence=0.9,
+                 min_information_gain=0.02, seed=None):
+        from ExploreTab.Extra.LatentMetric import LatentRatingEngine
+
+        self.num_designs = int(num_designs)
+        self.max_matches = int(max_matches) if max_matches is not None else max(self.num_designs - 1, 0)
+        self.min_matches = int(min_matches) if min_matches is not None else self.num_designs // 2
+        self.confidence = confidence
+        self.min_information_gain = min_information_gain
+        self.engine = LatentRatingEngine(self.num_designs)
+        self.rng = np.random.RandomState(seed)
+        self.matches = []
+        self.stop_reason = None
+        self._pairs = np.triu_indices(self.num_designs, k=1)
+
+    @classmethod
+    def from_config(cls, num_designs, conf=None):
+        conf = tournament_config() if conf is None else conf
+        return cls(
+            num_designs,
+            max_matches=conf.get("max_matches"),
+            min_matches=conf.get("min_matches"),
+            confidence=float(conf.get("confidence", 0.9)),
+            min_information_gain=float(conf.get("min_information_gain", 0.02)),
+            seed=conf.get("seed"),
+        )
+
+    def _posterior(self):
+        from scipy.linalg import cho_factor, cho_solve
+
+        H = self.engine.precision_matrix()
+        cov = cho_solve(cho_factor(H, lower=True, check_finite=False), np.eye(self.num_designs), check_finite=False)
+        return self.engine.scores, cov
+
+    def pair_scores(self):
+        """(i, j, information gain) for every unordered pair i < j."""
+        mean, cov = self._posterior()
+        i, j = self._pairs
+        var_diff = np.diag(cov)[i] + np.diag(cov)[j] - 2.0 * cov[i, j]
+        return i, j, expected_information_gain(mean[i] - mean[j], var_diff)
+
+    def ranking_confidence(self):
+        """Expected fraction of design pairs the current ranking orders correctly.
+
+        For every pair the ranking is right with probability
+        max(P(f_i > f_j), P(f_j > f_i)) under the posterior; 0.5 means the
+        ranking is a guess, 1.0 that it is certain.
+        """
+        from scipy.special import ndtr
+
+        mean, cov = self._posterior()
+        i, j = self._pairs
+        var_diff = np.diag(cov)[i] + np.diag(cov)[j] - 2.0 * cov[i, j]
+        return float(np.mean(ndtr(np.abs(mean[i] - mean[j]) / np.sqrt(np.maximum(var_diff, 1e-12)))))
+
+    def record(self, winner, loser):
+        self.engine.add_comparison(int(winner), int(loser))
+
+    def preview_next_match(self, winner, loser):
+        """The match next_match() would return after record(winner, loser), without changing any state."""
+        import copy
+
+        preview = copy.deepcopy(self)
+        preview.record(winner, loser)
+        return preview.next_match()
+
+    def next_match(self):
+        """The next match as {"match_id", "a_index", "b_index", "information_gain"}, or None when done."""
+        played = len(self.matches)
+        if self.num_designs < 2 or played >= self.max_matches:
+            self.stop_reason = "max_matches"
+            return None
+        i, j, gain = self.pair_scores()
+        if self.matches:
+            # Never show the same pair twice in a row
+            last = self.matches[-1]
+            a, b = sorted((last["a_index"], last["b_index"]))
+            gain = np.where((i == a) & (j == b), -np.inf, gain)
+        best_gain = float(np.max(gain))
+        if played >= self.min_matches:
+            if best_gain < self.min_information_gain:
+                self.stop_reason = "min_information_gain"
+                return None
+            if self.ranking_confidence() >= self.confidence:
+                self.stop_reason = "confidence"
+                return None
+        # Random tie-break (all pairs tie before the first pick)
+        best = self.rng.choice(np.flatnonzero(gain >= best_gain - 1e-12))
+        a, b = int(i[best]), int(j[best])
+        if self.rng.rand() < 0.5:
+            a, b = b, a
+        match = {"match_id": played + 1, "a_index": a, "b_index": b, "information_gain": best_gain}
+        self.matches.append(match)
+        return match
@@ -0,0 +1,133 @@
+# Deferred report artifacts (plots)
+# Plots are written by a separate process after the result they belong to has
+# been returned, so rendering never adds to the latency the user sees. Every
+# artifact is cached on a hash of its input data: if the output file was
+# already written for the same data it is not rendered again.
+# Config ("Artifacts" section of Configuration.JSON):
+#     "enabled": false     skip all plots
+#     "<kind>": false      skip one kind, e.g. "uncertainty_plot"
+
+import atexit
+import hashlib
+import importlib
+import json
+import os
+import threading
+
+import numpy as np
+
+CONF_PATH = os.path.join("src", "ExploreTab", "Configuration.JSON")
+# output path -> data hash of the inputs it was rendered from
+INDEX_PATH = os.path.join("src", "ExploreTab", "tmp", "artifacts.json")
+
+_pool = None
+# Guards _pool and _in_flight; artifacts are submitted from BackgroundJobs
+# worker threads as well as the main thread
+_lock = threading.RLock()
+# output path -> (input hash, Future) of renders that may still be running
+_in_flight = {}
+
+
+def _artifacts_config():
+    try:
+        with open(CONF_PATH, "r", encoding="utf-8") as f:
+            return json.load(f).get("Artifacts", {}) or {}
+    except Exception:
+        return {}
+
+
+def artifact_enabled(kind):
+    conf = _artifacts_config()
+    return bool(conf.get("enabled", True)) and bool(conf.get(kind, True))
+
+
+def data_hash(*inputs):
+    """sha1 over arrays, bytes, strings and files (given as ("file", path))."""
+    h = hashlib.sha1()
+    for item in inputs:
+        if isinstance(item, tuple) and len(item) == 2 and item[0] == "file":
+            with open(item[1], "rb") as f:
+                h.update(f.read())
+        elif isinstance(item, np.ndarray):
+            arr = np.ascontiguousarray(item)
+            h.update(str((arr.dtype.str, arr.shape)).encode("utf-8"))
+            h.update(arr.tobytes())
+        elif isinstance(item, bytes):
+            h.update(item)
+        else:
+            h.update(repr(item).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _read_index():
+    try:
+        with open(INDEX_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def is_cached(output_path, input_hash):
+    return os.path.exists(output_path) and _read_index().get(os.path.abspath(output_path)) == input_hash
+
+
+def _render(target, args, kwargs, output_path, input_hash):
+    """Runs in the artifact process: call module:function, then record the input hash."""
+    import matplotlib
+    matplotlib.use("Agg")
+
+    module_name, func_name = target.split(":")
+    func = getattr(importlib.import_module(module_name), func_name)
+    func(*args, **kwargs)
+
+    index = _read_index()
+    index[os.path.abspath(output_path)] = input_hash
+    os.makedirs(os.path.dirname(INDEX_PATH), exist_ok=True)
+    tmp_path = INDEX_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, INDEX_PATH)
+    return output_path
+
+
+def _get_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # One worker: renders run in order and the index has a single writer
+            _pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            # Let pending plots finish when the app exits
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def submit_artifact(kind, target, args=(), kwargs=None, output_path=None, input_hash=None):
+    """Render target ("module:function") in the artifact process.
+
+    Returns a Future, or None when the kind is disabled or output_path is
+    already up to date for input_hash.
+    """
+    if not artifact_enabled(kind):
+        print(f"[Artifacts] {kind} disabled by config")
+        return None
+    key = os.path.abspath(output_path) if output_path else None
+    # Check and submit under one lock, so the same render is not queued twice
+    with _lock:
+        if input_hash is not None and key:
+            pending = _in_flight.get(key)
+            if pending and pending[0] == input_hash and not pending[1].done():
+                return pending[1]
+            if is_cached(output_path, input_hash):
+                print(f"[Artifacts] {kind} up to date: {output_path}")
+                return None
+        try:
+            future = _get_pool().submit(_render, target, tuple(args), dict(kwargs or {}), output_path, input_hash)
+            if key:
+                _in_flight[key] = (input_hash, future)
+            return future
+        except Exception as e:
+            print(f"[Artifacts] could not schedule {kind}: {e}")
+            return None
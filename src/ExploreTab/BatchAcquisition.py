@@ -0,0 +1,396 @@
+import functools
+import importlib
+import json
+import os
+import time
+import numpy as np
+
+ACQUISITIONS = ("ucb", "ei", "max_variance")
+BATCH_SCHEMES = ("local_penalization", "kriging_believer")
+
+# Slider parameters that only take integer values
+INTEGER_PARAMS = ("Segment Count",)
+
+
+def load_slider_config(object_type):
+    """(name, (min, max), default) per slider; looked up once per object type."""
+    return _slider_config((object_type or "Vase").lower())
+
+
+@functools.lru_cache(maxsize=None)
+def _slider_config(ot_lower):
+    try:
+        mod = importlib.import_module(f"geometry.{ot_lower}.config")
+    except ModuleNotFoundError:
+        mod = importlib.import_module(f"src.geometry.{ot_lower}.config")
+    return tuple(getattr(mod, f"{ot_lower}SliderConfig")())
+
+
+# ---------------------------
+# Design space (normalized [0, 1]^d <-> slider values)
+# ---------------------------
+class DesignSpace:
+    """Maps normalized design vectors to slider parameters, like load_data() does."""
+
+    def __init__(self, object_type="Vase"):
+        self.object_type = object_type or "Vase"
+        slider = load_slider_config(self.object_type)
+        self.names = [name for name, _rng, _default in slider]
+        self.lower = np.array([rng[0] for _name, rng, _default in slider], dtype=float)
+        self.upper = np.array([rng[1] for _name, rng, _default in slider], dtype=float)
+        self.integer_mask = np.array([name in INTEGER_PARAMS for name in self.names])
+        self.dims = len(self.names)
+
+    def to_values(self, U):
+        """(n, d) normalized -> (n, d) slider values, integer sliders rounded."""
+        values = self.lower + np.asarray(U, dtype=float) * (self.upper - self.lower)
+        values[:, self.integer_mask] = np.round(values[:, self.integer_mask])
+        return values
+
+    def to_normalized(self, values):
+        return (np.asarray(values, dtype=float) - self.lower) / (self.upper - self.lower)
+
+    def snap(self, U):
+        """Move integer sliders to the nearest valid value (in normalized space)."""
+        return self.to_normalized(self.to_values(U))
+
+    def to_params(self, u):
+        values = self.to_values(np.atleast_2d(u))[0]
+        return {
+            name: (int(v) if is_int else float(v))
+            for name, v, is_int in zip(self.names, values, self.integer_mask)
+        }
+
+
+def vase_feasible(space, U):
+    """True where the design has no overhang (vectorized overhang check)."""
+    from geometry.vase.geometry import overhangMask, vaseOverhangMap
+
+    values = space.to_values(U)
+    column = {name: values[:, i] for i, name in enumerate(space.names)}
+    maps = vaseOverhangMap(
+        segment_count=column["Segment Count"],
+        object_width=column["Object Width"],
+        twist_angle=column["Twist Angle"],
+        twist_groove_depth=column["Twist Groove Depth"],
+        vertical_wave_freq=column["Vertical Wave Frequency"],
+        vertical_wave_depth=column["Vertical Wave Depth"],
+    )
+    return ~overhangMask(maps)
+
+
+# Feasibility filters per object type (object types without one accept everything)
+FEASIBILITY_CHECKS = {
+    "vase": vase_feasible,
+}
+
+
+# ---------------------------
+# Acquisition functions (vectorized over candidates)
+# ---------------------------
+def acquisition_values(kind, mean, std, best_y, ucb_beta=2.0, ei_xi=0.01):
+    from scipy.stats import norm
+
+    if kind == "ucb":
+        return mean + ucb_beta * std
+    if kind == "ei":
+        safe_std = np.maximum(std, 1e-12)
+        z = (mean - best_y - ei_xi) / safe_std
+        return (mean - best_y - ei_xi) * norm.cdf(z) + safe_std * norm.pdf(z)
+    if kind == "max_variance":
+        return std
+    raise ValueError(f"Unknown acquisition {kind!r}; expected one of {ACQUISITIONS}")
+
+
+def _softplus(x):
+    return np.logaddexp(0.0, x)
+
+
+# ---------------------------
+# Batch acquisition
+# ---------------------------
+class BatchAcquisition:
+    """Proposes k diverse designs from a trained GP surrogate.
+
+    Scores a scrambled Sobol set of candidates with UCB, EI or max-variance,
+    then picks designs one at a time:
+      - local_penalization: the acquisition is multiplied by a penalty around
+        every pick, sized from a Lipschitz estimate of the mean (works with
+        any model that has predict(X, return_std=True)),
+      - kriging_believer: every pick is added as an observation at its
+        predicted mean, which shrinks the posterior std around it (needs an
+        exact GaussianProcessRegressor; falls back to local penalization).
+    Candidates are checked for feasibility (overhangs for vases) in ranked
+    chunks, so only the shortlist pays for the check. The best candidates
+    are then refined with a few L-BFGS-B starts over the continuous sliders.
+    """
+
+    def __init__(
+        self,
+        model,
+        object_type="Vase",
+        acquisition="ucb",
+        batch_scheme="local_penalization",
+        n_candidates=4096,
+        n_refine_starts=4,
+        refine_iterations=20,
+        check_chunk=64,
+        ucb_beta=2.0,
+        ei_xi=0.01,
+        seed=None,
+    ):
+        if acquisition not in ACQUISITIONS:
+            raise ValueError(f"Unknown acquisition {acquisition!r}; expected one of {ACQUISITIONS}")
+        if batch_scheme not in BATCH_SCHEMES:
+            raise ValueError(f"Unknown batch scheme {batch_scheme!r}; expected one of {BATCH_SCHEMES}")
+        if batch_scheme == "kriging_believer" and not hasattr(model, "L_"):
+            print("[BatchAcquisition] kriging believer needs an exact GP; using local penalization")
+            batch_scheme = "local_penalization"
+
+        self.model = model
+        self.space = DesignSpace(object_type)
+        self.acquisition = acquisition
+        self.batch_scheme = batch_scheme
+        self.n_candidates = n_candidates
+        self.n_refine_starts = n_refine_starts
+        self.refine_iterations = refine_iterations
+        self.check_chunk = check_chunk
+        self.ucb_beta = ucb_beta
+        self.ei_xi = ei_xi
+        self.seed = seed
+        self._feasibility_check = FEASIBILITY_CHECKS.get(self.space.object_type.lower())
+        self._exact = all(hasattr(model, attr) for attr in ("L_", "alpha_", "X_train_", "_y_train_std"))
+        self._picks = []
+        self._believer = None
+
+    # ---- candidates ----
+    def sobol_candidates(self):
+        from scipy.stats import qmc
+
+        sampler = qmc.Sobol(d=self.space.dims, scramble=True, seed=self.seed)
+        m = int(np.ceil(np.log2(max(2, self.n_candidates))))
+        return self.space.snap(sampler.random_base2(m))
+
+    def feasible(self, U):
+        if self._feasibility_check is None:
+            return np.ones(len(U), dtype=bool)
+        return self._feasibility_check(self.space, U)
+
+    # ---- posterior under the batch scheme ----
+    def _posterior(self, U):
+        """Predictive mean and std at U, plus L^-1 k(X_train, U) for exact GPs (else None).
+
+        For an exact GaussianProcessRegressor this is the same computation as
+        predict(return_std=True), without its per-call validation overhead.
+        """
+        if not self._exact:
+            mean, std = self.model.predict(U, return_std=True)
+            return mean, std, None
+        from scipy.linalg import solve_triangular
+
+        model = self.model
+        K = model.kernel_(model.X_train_, U)
+        v = solve_triangular(model.L_, K, lower=True, check_finite=False)
+        mean = K.T @ model.alpha_ * model._y_train_std + model._y_train_mean
+        var = model.kernel_.diag(U) - np.sum(v * v, axis=0)
+        std = np.sqrt(np.maximum(var, 0.0)) * model._y_train_std
+        return mean, std, v
+
+    def _set_believer_picks(self, picks):
+        """Cache what the kriging believer needs about the picks: S, L^-1 k(X_train, S), cov(S, S)^-1."""
+        if not picks:
+            self._believer = None
+            return
+        S = np.asarray(picks)
+        _mean, _std, v_S = self._posterior(S)
+        kernel = self.model.kernel_
+        noise = float(kernel.k2.noise_level)
+        # kernel(A, B) with B given leaves out the white noise term
+        cov_SS = kernel(S, S) - v_S.T @ v_S + noise * np.eye(len(S))
+        self._believer = (S, v_S, np.linalg.inv(cov_SS))
+
+    def _believer_std(self, U, std, v_U):
+        """Posterior std at U after observing the picks (at their predicted mean)."""
+        if self._believer is None:
+            return std
+        S, v_S, cov_SS_inv = self._believer
+        cov_US = self.model.kernel_(U, S) - v_U.T @ v_S
+        reduction = np.sum(cov_US @ cov_SS_inv * cov_US, axis=1)
+        var = std ** 2 - reduction * float(self.model._y_train_std) ** 2
+        return np.sqrt(np.maximum(var, 1e-12))
+
+    # ---- scoring ----
+    def _score(self, U, pick_stats):
+        """Batch-aware acquisition score of U (higher is better), given the picks so far."""
+        mean, std, v_U = self._posterior(U)
+        if self.batch_scheme == "kriging_believer":
+            std = self._believer_std(U, std, v_U)
+            best = max([self._best_y] + [m for m, _s in pick_stats])
+            return acquisition_values(self.acquisition, mean, std, best, self.ucb_beta, self.ei_xi)
+
+        values = acquisition_values(self.acquisition, mean, std, self._best_y, self.ucb_beta, self.ei_xi)
+        # Softplus of the standardized acquisition keeps the score positive for the penalties
+        score = _softplus((values - self._acq_ref) / self._acq_scale)
+        if pick_stats:
+            from scipy.stats import norm
+
+            S = np.asarray(self._picks)
+            dist = np.linalg.norm(U[:, None, :] - S[None, :, :], axis=-1)
+            pick_mean = np.array([m for m, _s in pick_stats])
+            pick_std = np.maximum(np.array([s for _m, s in pick_stats]), 1e-9)
+            z = (self._lipschitz * dist - self._max_mean + pick_mean) / pick_std
+            score = score * np.prod(norm.cdf(z), axis=1)
+        return score
+
+    def _estimate_lipschitz(self, candidates, n_points=256, step=1e-4):
+        """Largest gradient norm of the posterior mean over a subset of the candidates."""
+        subset = candidates[: min(n_points, len(candidates))]
+        base = self.model.predict(subset)
+        grads = np.empty_like(subset)
+        for d in range(self.space.dims):
+            shifted = subset.copy()
+            shifted[:, d] = np.minimum(shifted[:, d] + step, 1.0)
+            delta = np.maximum(shifted[:, d] - subset[:, d], 1e-12)
+            grads[:, d] = (self.model.predict(shifted) - base) / delta
+        lipschitz = float(np.max(np.linalg.norm(grads, axis=1)))
+        return lipschitz if lipschitz > 1e-7 else 1.0
+
+    # ---- refinement ----
+    def _refine(self, u_start, pick_stats, step=1e-4):
+        """L-BFGS-B over the continuous sliders from u_start; the integer sliders stay fixed."""
+        from scipy.optimize import minimize
+
+        free = np.flatnonzero(~self.space.integer_mask)
+        if free.size == 0:
+            return u_start
+        eye = np.eye(free.size) * step
+
+        def objective(x):
+            # Value and forward-difference gradient from one batched prediction
+            points = np.repeat(u_start[None, :], free.size + 1, axis=0)
+            points[:, free] = np.clip(np.vstack([x, x + eye]), 0.0, 1.0)
+            scores = -self._score(points, pick_stats)
+            return scores[0], (scores[1:] - scores[0]) / step
+
+        res = minimize(
+            objective,
+            u_start[free],
+            jac=True,
+            method="L-BFGS-B",
+            bounds=[(0.0, 1.0)] * free.size,
+            options={"maxiter": self.refine_iterations},
+        )
+        refined = u_start.copy()
+        refined[free] = np.clip(res.x, 0.0, 1.0)
+        return refined
+
+    # ---- main entry ----
+    def propose(self, k, X_train=None, y_train=None):
+        """Return k designs as (U, details): U is (k, d) normalized, details one dict per design."""
+        start = time.perf_counter()
+        candidates = self.sobol_candidates()
+        if X_train is None:
+            X_train = getattr(self.model, "X_train_", np.empty((0, self.space.dims)))
+        if y_train is None:
+            if hasattr(self.model, "y_train_"):
+                y_train = self.model.y_train_ * self.model._y_train_std + self.model._y_train_mean
+            else:
+                y_train = self.model.predict(X_train) if len(X_train) else np.zeros(1)
+
+        mean, std, _v = self._posterior(candidates)
+        self._best_y = float(np.max(y_train))
+        self._max_mean = max(self._best_y, float(np.max(mean)))
+        values = acquisition_values(self.acquisition, mean, std, self._best_y, self.ucb_beta, self.ei_xi)
+        self._acq_ref = float(np.median(values))
+        self._acq_scale = float(np.std(values)) or 1.0
+        self._lipschitz = self._estimate_lipschitz(candidates) if self.batch_scheme == "local_penalization" else None
+
+        # Feasibility: None = not checked yet
+        feasible = np.full(len(candidates), None, dtype=object)
+        available = np.ones(len(candidates), dtype=bool)
+        picks, pick_stats, details = [], [], []
+        self._picks = picks
+        self._set_believer_picks(picks)
+
+        for _ in range(k):
+            scores = self._score(candidates, pick_stats)
+            scores[~available] = -np.inf
+            order = np.argsort(-scores)
+
+            # Walk the ranking in chunks until enough feasible candidates are known
+            starts = []
+            for pos in range(0, len(order), self.check_chunk):
+                chunk = order[pos:pos + self.check_chunk]
+                chunk = chunk[available[chunk]]
+                unchecked = chunk[feasible[chunk] == None]  # noqa: E711 (object array)
+                if unchecked.size:
+                    feasible[unchecked] = self.feasible(candidates[unchecked])
+                starts.extend(int(i) for i in chunk if feasible[i])
+                if len(starts) >= self.n_refine_starts:
+                    break
+            if not starts:
+                print(f"[BatchAcquisition] no feasible candidates left after {len(picks)} picks")
+                break
+            starts = starts[: self.n_refine_starts]
+
+            # Multi-start refinement; keep a refined point only if it is still feasible and better
+            best_u = candidates[starts[0]]
+            best_score = float(scores[starts[0]])
+            for idx in starts:
+                refined = self.space.snap(self._refine(candidates[idx], pick_stats)[None, :])
+                refined_score = float(self._score(refined, pick_stats)[0])
+                if refined_score > best_score and self.feasible(refined)[0]:
+                    best_u, best_score = refined[0], refined_score
+            # Every start was refined around already; later picks use other candidates
+            available[starts] = False
+
+            m, s, _v = self._posterior(best_u[None, :])
+            picks.append(best_u)
+            pick_stats.append((float(m[0]), float(s[0])))
+            if self.batch_scheme == "kriging_believer":
+                self._set_believer_picks(picks)
+            details.append({"mean": float(m[0]), "std": float(s[0]), "score": best_score})
+
+        elapsed = (time.perf_counter() - start) * 1000.0
+        print(f"[BatchAcquisition] {len(picks)} designs from {len(candidates)} candidates "
+              f"({self.acquisition}, {self.batch_scheme}) in {elapsed:.0f} ms")
+        return np.asarray(picks).reshape(-1, self.space.dims), details
+
+    def propose_designs(self, k, name_prefix="P", X_train=None, y_train=None):
+        """k proposals in the Designs.txt format (Rating None, to be filled in by the user)."""
+        U, details = self.propose(k, X_train, y_train)
+        designs = []
+        for i, (u, info) in enumerate(zip(U, details)):
+            designs.append({
+                "Name": f"{name_prefix}{i + 1}",
+                "object_type": self.space.object_type,
+                "Rating": None,
+                "parameters": self.space.to_params(u),
+                "Acquisition": info,
+            })
+        return designs
+
+
+def write_proposals(designs, out_path):
+    directory = os.path.dirname(out_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(designs, f, indent=2)
+    print(f"[BatchAcquisition] wrote {len(designs)} proposals to {out_path}")
+
+
+def detect_object_type(data_path):
+    """Object type of the first design in data_path that has one (as load_data() does)."""
+    from ExploreTab.TrainingCache import get_training_cache
+
+    return get_training_cache(data_path).object_type or "Vase"
+
+
+def propose_next_designs(model, data_path, k, out_path=None, **options):
+    """Propose k designs for the object type in data_path; optionally write them to out_path."""
+    acquisition = BatchAcquisition(model, object_type=detect_object_type(data_path), **options)
+    designs = acquisition.propose_designs(k)
+    if out_path:
+        write_proposals(designs, out_path)
+    return designs
@@ -1,12 +1,13 @@
 import json
 import numpy as np
 import itertools
-from sklearn.gaussian_process import GaussianProcessRegressor
-from sklearn.gaussian_process.kernels import RBF, ConstantKernel as C, WhiteKernel
-import importlib
 import sys
 import os
 import traceback
+import time
+
+# sklearn and matplotlib are slow to import, so they are imported inside the
+# functions that use them (see utils/preload.py for the background preload)
 
 # ---------------------------
 # 1) PARAMETER RANGES (from geometry.<object_type>.config)
@@ -16,14 +17,6 @@ import traceback
 
 
 
-import matplotlib.pyplot as plt
-import numpy as np
-import matplotlib.pyplot as plt
-import numpy as np
-
-
-import time
-
 def log_training_run(
     log_path: str,
     num_samples: int,
@@ -32,6 +25,7 @@ def log_training_run(
     r2_train: float,
     coverage_cells: int,
     coverage_pct: int,
+    map_summary: dict = None,
 ):
     mean_std = float(np.mean(grid_std))
     median_std = float(np.median(grid_std))
@@ -52,14 +46,26 @@ def log_training_run(
         f.write(f"  Median std: {median_std:.6f}\n")
         f.write(f"  Min    std: {min_std:.6f}\n")
         f.write(f"  Max    std: {max_std:.6f}\n")
-
-
-def plot_uncertainty_and_occupancy(grid_norm, grid_std, X_train_norm):
+        if map_summary:
+            f.write(f"Uncertainty map ({map_summary['method']}, {map_summary['n_points']} points):\n")
+            quantiles = ", ".join(f"q{q}={v:.4f}" for q, v in map_summary["std_quantiles"].items())
+            f.write(f"  Std quantiles: {quantiles}\n")
+            for level, stats in map_summary["levels"].items():
+                f.write(
+                    f"  {level} levels: coverage {stats['occupied']}/{stats['cells']} cells = "
+                    f"{stats['coverage_pct']:.2f}%, max cell std {stats['max_cell_std']:.4f}\n"
+                )
+
+
+def plot_uncertainty_and_occupancy(grid_norm, grid_std, X_train_norm, output_path="uncertainty_and_occupancy.png"):
     """
     grid_norm: shape (64,6), values 0.25/0.75
     grid_std:  shape (64,), predictive std for each grid point
     X_train_norm: shape (n,6), training points normalized to [0,1]
     """
+    import matplotlib
+    matplotlib.use("Agg")  # only saved to file, and may run off the main thread
+    import matplotlib.pyplot as plt
 
     # ------------------------------
     # Uncertainty heatmap (8x8)
@@ -131,7 +137,7 @@ def plot_uncertainty_and_occupancy(grid_norm, grid_std, X_train_norm):
     )
 
     plt.tight_layout()
-    fig.savefig("uncertainty_and_occupancy.png", dpi=200, bbox_inches="tight")
+    fig.savefig(output_path, dpi=200, bbox_inches="tight")
     plt.close(fig)
     return coverage_cells, coverage_pct
 
@@ -140,54 +146,19 @@ def plot_uncertainty_and_occupancy(grid_norm, grid_std, X_train_norm):
 # 2) LOAD + NORMALIZE DATA
 # ---------------------------
 def load_data(filepath):
+    """Normalized (X, y) of the rated designs in filepath.
+
+    Served from the columnar training cache (ExploreTab/TrainingCache.py):
+    an unchanged file is not parsed again and appended designs are added
+    to the cached arrays.
+    """
+    from ExploreTab.TrainingCache import get_training_cache
+
     print(f"[BayesTrain] load_data: filepath={os.path.abspath(filepath)}")
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    X, y = [], []
-
-    # Detect object type from first valid item
-    ot = None
-    for obj in data:
-        t = obj.get("object_type")
-        if t:
-            ot = t
-            break
-    ot_lower = (ot or "Vase").lower()
-    print(f"[BayesTrain] detected object_type={ot_lower}")
-
-    # Load slider config for this object type
-    try:
-        mod = importlib.import_module(f"geometry.{ot_lower}.config")
-        print("[BayesTrain] using import path: geometry")
-    except ModuleNotFoundError:
-        mod = importlib.import_module(f"src.geometry.{ot_lower}.config")
-        print("[BayesTrain] using import path: src.geometry")
-    slider = getattr(mod, f"{ot_lower}SliderConfig")()
-    ordered_keys = [name for name, _rng, _default in slider]
-    bounds = {name: rng for name, rng, _default in slider}
-    print(f"[BayesTrain] slider keys: {ordered_keys}")
-
-    for obj in data:
-        if obj.get("object_type", "").lower() != ot_lower:
-            continue
-
-        rating = obj.get("Rating")
-        if rating is None:
-            continue
-
-        params = obj["parameters"]
-        row = []
-        for key in ordered_keys:
-            mn, mx = bounds[key]
-            v = params[key]
-            row.append((v - mn) / (mx - mn))  # normalize to [0, 1]
-
-        X.append(row)
-        y.append(rating)
-
-    X_arr = np.array(X, dtype=float)
-    y_arr = np.array(y, dtype=float)
+    cache = get_training_cache(filepath)
+    X_arr, y_arr = cache.load()
+    status = cache.status
+    print(f"[BayesTrain] detected object_type={(cache.object_type or 'Vase').lower()}, training cache: {status}")
     print(f"[BayesTrain] dataset sizes: X={X_arr.shape}, y={y_arr.shape}")
     if y_arr.size > 0:
         print(f"[BayesTrain] y stats: min={float(np.min(y_arr)):.4f}, max={float(np.max(y_arr)):.4f}, mean={float(np.mean(y_arr)):.4f}")
@@ -196,38 +167,285 @@ def load_data(filepath):
     return X_arr, y_arr
 
 
+def load_history(object_type, source="batch1"):
+    """(X, y) of the designs of object_type rated in earlier Explore sessions.
+
+    An indexed query on the design database (storage/design_db.py),
+    normalized with the same slider bounds as load_data().
+    """
+    from ExploreTab.BatchAcquisition import load_slider_config
+    from storage.design_db import get_design_db
+
+    bounds = {name: rng for name, rng, _default in load_slider_config(object_type)}
+    X, y = get_design_db().training_matrix(object_type, source=source, bounds=bounds)
+    print(f"[BayesTrain] history: {len(y)} rated {object_type} designs from earlier sessions")
+    return X, y
+
+
+def training_data(data_path, history=None):
+    """load_data(data_path), preceded by the (X, y) rows in history if given."""
+    X, y = load_data(data_path)
+    if history is None or len(history[1]) == 0:
+        return X, y
+    X_hist, y_hist = history
+    if len(y) == 0:
+        return np.asarray(X_hist, dtype=float), np.asarray(y_hist, dtype=float)
+    return np.vstack([X_hist, X]), np.concatenate([y_hist, y])
+
+
 # ---------------------------
 # 3) TRAIN BAYESIAN MODEL
 # ---------------------------
-def train_bayesian_gp(X, y):
-    kernel = (
+N_RESTARTS_OPTIMIZER = 5
+RANDOM_STATE = 0
+
+# Process pool for the optimizer restarts; created on first use and reused
+# across rounds, since each worker pays the sklearn import once
+_restart_pool = None
+
+
+def _make_kernel():
+    from sklearn.gaussian_process.kernels import RBF, ConstantKernel as C, WhiteKernel
+
+    return (
         C(1.0, (1e-3, 1e3)) *
         RBF(length_scale=np.ones(6), length_scale_bounds=(1e-2, 2)) +
         WhiteKernel(noise_level=1e-2, noise_level_bounds=(1e-6, 1e0))
     )
 
+
+def _fixed_start_optimizer(theta_start):
+    """sklearn optimizer callable that starts L-BFGS-B from theta_start exactly.
+
+    Same call as sklearn's built-in "fmin_l_bfgs_b" optimizer, but ignoring
+    the kernel's own theta, which round-trips through exp/log.
+    """
+    def optimizer(obj_func, initial_theta, bounds):
+        import scipy.optimize
+
+        res = scipy.optimize.minimize(obj_func, theta_start, method="L-BFGS-B", jac=True, bounds=bounds)
+        return res.x, res.fun
+    return optimizer
+
+
+def _optimize_from_start(X, y, kernel, theta_start):
+    """One optimizer restart: returns (theta_opt, negative log-marginal-likelihood)."""
+    from sklearn.gaussian_process import GaussianProcessRegressor
+
     model = GaussianProcessRegressor(
         kernel=kernel,
         normalize_y=True,
-        n_restarts_optimizer=5,
-        random_state=0
+        optimizer=_fixed_start_optimizer(theta_start),
+        n_restarts_optimizer=0,
     )
+    model.fit(X, y)
+    return model.kernel_.theta, -model.log_marginal_likelihood_value_
+
+
+def fitted_gp(kernel, X_train, y_train, y_mean, y_std, L, alpha, log_marginal_likelihood):
+    """GaussianProcessRegressor built from precomputed fit results.
+
+    Sets the attributes GaussianProcessRegressor.fit() sets (normalize_y=True,
+    y_train already normalized), so predict()/score() work without refitting.
+    """
+    from sklearn.gaussian_process import GaussianProcessRegressor
+
+    model = GaussianProcessRegressor(kernel=kernel, normalize_y=True, optimizer=None)
+    model.kernel_ = kernel
+    model.n_features_in_ = X_train.shape[1]
+    model.X_train_ = X_train
+    model.y_train_ = y_train
+    model._y_train_mean = y_mean
+    model._y_train_std = y_std
+    model.L_ = L
+    model.alpha_ = alpha
+    model.log_marginal_likelihood_value_ = float(log_marginal_likelihood)
+    return model
 
+
+def _initial_thetas(kernel, n_restarts, random_state):
+    """Start points in the order sklearn uses: the kernel's theta, then uniform draws in log-bounds."""
+    from sklearn.utils import check_random_state
+
+    rng = check_random_state(random_state)
+    bounds = kernel.bounds
+    thetas = [kernel.theta]
+    for _ in range(n_restarts):
+        thetas.append(rng.uniform(bounds[:, 0], bounds[:, 1]))
+    return thetas
+
+
+def _get_restart_pool(max_workers):
+    global _restart_pool
+    if _restart_pool is None:
+        import atexit
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # spawn: never fork the Panda3D process and its threads
+        _restart_pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        atexit.register(_restart_pool.shutdown)
+    return _restart_pool
+
+
+def _bayesian_config():
+    """The "Bayesian" section of Configuration.JSON ({} if it cannot be read)."""
+    try:
+        conf_path = os.path.join("src", "ExploreTab", "Configuration.JSON")
+        with open(conf_path, "r", encoding="utf-8") as f:
+            conf = json.load(f)
+        return conf.get("Bayesian", {}) or {}
+    except Exception:
+        return {}
+
+
+def _parallel_restarts_enabled():
+    """Read "parallel_restarts" from the Bayesian section of Configuration.JSON (default on)."""
+    return bool(_bayesian_config().get("parallel_restarts", True))
+
+
+def train_bayesian_gp(X, y, parallel=None, theta0=None):
+    """Fit the GP, running the optimizer restarts in a process pool.
+
+    Uses the same start points, optimizer and selection rule as sklearn's
+    serial n_restarts_optimizer, so the result is identical for the fixed
+    RANDOM_STATE. Falls back to running the restarts in-process.
+    theta0 (log-hyperparameters, e.g. the previous optimum) replaces the
+    kernel's default as the first start point.
+    """
+    from sklearn.gaussian_process import GaussianProcessRegressor
+
+    if parallel is None:
+        parallel = _parallel_restarts_enabled()
+    kernel = _make_kernel()
+    starts = _initial_thetas(kernel, N_RESTARTS_OPTIMIZER, RANDOM_STATE)
+    if theta0 is not None and np.shape(theta0) == starts[0].shape:
+        bounds = kernel.bounds
+        starts[0] = np.clip(np.asarray(theta0, dtype=float), bounds[:, 0], bounds[:, 1])
+
+    optima = None
+    workers = min(len(starts), os.cpu_count() or 1)
+    if parallel and workers > 1:
+        try:
+            pool = _get_restart_pool(workers)
+            futures = [pool.submit(_optimize_from_start, X, y, kernel, theta) for theta in starts]
+            optima = [f.result() for f in futures]
+        except Exception as e:
+            print(f"[BayesTrain] parallel restarts failed, running serially: {e}")
+            optima = None
+    if optima is None:
+        optima = [_optimize_from_start(X, y, kernel, theta) for theta in starts]
+
+    # Best log-marginal-likelihood; ties go to the earliest start, like sklearn
+    best = int(np.argmin([fun for _theta, fun in optima]))
+    best_theta, best_fun = optima[best]
+
+    # Final fit at the chosen hyperparameters (no further optimization)
+    model = GaussianProcessRegressor(
+        kernel=kernel,
+        normalize_y=True,
+        optimizer=lambda obj_func, initial_theta, bounds: (best_theta, best_fun),
+        n_restarts_optimizer=0,
+    )
     model.fit(X, y)
+    # Leave the settings the serial fit would have (and keep the model picklable)
+    model.set_params(optimizer="fmin_l_bfgs_b", n_restarts_optimizer=N_RESTARTS_OPTIMIZER, random_state=RANDOM_STATE)
     print("Trained kernel:", model.kernel_)
     return model
 
 
-def run_bayes_train(data_path: str):
+# Above this many samples backend "auto" switches to the sparse GP
+SPARSE_GP_THRESHOLD = 2000
+
+
+def select_backend(num_samples, backend=None):
+    """ "exact" or "sparse"; backend None reads "backend" from the Bayesian config (default "auto")."""
+    if backend is None:
+        backend = _bayesian_config().get("backend", "auto")
+    backend = str(backend).lower()
+    if backend == "auto":
+        threshold = _bayesian_config().get("sparse_threshold", SPARSE_GP_THRESHOLD)
+        return "sparse" if num_samples > threshold else "exact"
+    if backend not in ("exact", "sparse"):
+        print(f"[BayesTrain] unknown backend {backend!r}, using exact GP")
+        return "exact"
+    return backend
+
+
+def train_sparse_gp(X, y):
+    from ExploreTab.SparseGP import SparseGPRegressor
+
+    bayes_conf = _bayesian_config()
+    model = SparseGPRegressor(
+        n_inducing=bayes_conf.get("n_inducing", 300),
+        hyper_subset=bayes_conf.get("hyper_subset", 300),
+        random_state=RANDOM_STATE,
+    )
+    model.fit(X, y)
+    print(f"[BayesTrain] sparse GP: {X.shape[0]} samples, {model.inducing_points_.shape[0]} inducing points")
+    return model
+
+
+def propose_designs(model, data_path, n_proposals, proposals_path=None):
+    """Next n_proposals designs for a trained model, with the acquisition settings from the config."""
+    from ExploreTab.BatchAcquisition import propose_next_designs
+
+    bayes_conf = _bayesian_config()
+    return propose_next_designs(
+        model,
+        data_path,
+        n_proposals,
+        out_path=proposals_path,
+        acquisition=bayes_conf.get("acquisition", "ucb"),
+        batch_scheme=bayes_conf.get("batch_scheme", "local_penalization"),
+        n_candidates=bayes_conf.get("n_candidates", 4096),
+    )
+
+
+def run_bayes_train(data_path: str, backend=None, n_proposals=0, proposals_path=None, history=None):
+    """Train the surrogate on data_path; backend is "exact", "sparse" or "auto" (None: from config).
+
+    history is an optional (X, y) of earlier rated designs (see
+    load_history()) trained on together with data_path. With n_proposals > 0
+    the next designs are proposed with the batch acquisition engine, returned
+    in the summary's "proposals" (in the Designs.txt format) and written to
+    proposals_path (if given).
+    """
     print(f"[BayesTrain] run_bayes_train: start, cwd={os.getcwd()}")
     print(f"[BayesTrain] data_path={os.path.abspath(data_path)}")
     # Load and normalize data
-    X, y = load_data(data_path)
+    X, y = training_data(data_path, history)
     if len(y) == 0:
         print("[BayesTrain] ERROR: zero samples; aborting training")
         raise ValueError("No samples available for training")
-    # Train model
-    model = train_bayesian_gp(X, y)
+    # Reuse the stored model when the training data has not changed
+    from ExploreTab.ModelStore import ModelStore, model_store_root, training_data_hash
+
+    backend = select_backend(len(y), backend)
+    print(f"[BayesTrain] backend={backend}")
+    store = ModelStore(model_store_root(data_path))
+    data_hash = training_data_hash(X, y, str(_make_kernel()))
+    # The store and the incremental updates only handle the exact GP
+    model = store.load(data_hash) if backend == "exact" else None
+    model_reused = model is not None
+    bayes_conf = _bayesian_config()
+    if model_reused:
+        print(f"[BayesTrain] training data unchanged, using stored model {data_hash[:12]}")
+    elif backend == "sparse":
+        model = train_sparse_gp(X, y)
+    elif bayes_conf.get("incremental", True):
+        # Train incrementally from the previous run's state
+        from ExploreTab.IncrementalGP import IncrementalGP, incremental_state_path
+        from ExploreTab.TrainingCache import get_training_cache
+
+        gp_manager = IncrementalGP(
+            incremental_state_path(get_training_cache(data_path).object_type),
+            full_refit_every=bayes_conf.get("full_refit_every", 4),
+        )
+        gp_manager.load()
+        model = gp_manager.update(X, y)
+    else:
+        model = train_bayesian_gp(X, y)
     # Training metrics
     y_pred, y_std = model.predict(X, return_std=True)
     r2_train = model.score(X, y)
@@ -235,8 +453,32 @@ def run_bayes_train(data_path: str):
     # 64-point grid in normalized space
     grid_norm = np.asarray(list(itertools.product([0.25, 0.75], repeat=6)), dtype=float)
     _, grid_std = model.predict(grid_norm, return_std=True)
-    # Plot/save and compute coverage
-    coverage_cells, coverage_pct = plot_uncertainty_and_occupancy(grid_norm, grid_std, X)
+    # Coverage of the 64 cells (the plot itself is rendered later, see below)
+    from ExploreTab.UncertaintyMap import coverage
+
+    coverage_cells, _total_cells, _pct = coverage(X, 2)
+    coverage_pct = int(round(100.0 * coverage_cells / 64.0))
+    # High-resolution uncertainty map (quantiles and coverage at several granularities)
+    map_summary = None
+    map_conf = bayes_conf.get("uncertainty_map", {})
+    if map_conf.get("enabled", True):
+        try:
+            from ExploreTab.UncertaintyMap import uncertainty_map
+
+            _points, _map_std, map_summary = uncertainty_map(
+                model,
+                X,
+                method=map_conf.get("method", "sobol"),
+                n_points=map_conf.get("n_points", 65536),
+                grid_levels=map_conf.get("grid_levels", 8),
+                chunk_size=map_conf.get("chunk_size", 8192),
+                seed=RANDOM_STATE,
+                levels=tuple(map_conf.get("levels", (2, 3, 4))),
+            )
+            print(f"[BayesTrain] uncertainty map: {map_summary['n_points']} points, "
+                  f"std quantiles {map_summary['std_quantiles']}")
+        except Exception as e:
+            print(f"[BayesTrain] uncertainty map failed: {e}")
     # Log
     log_path = "logger.txt"
     abs_log_path = os.path.abspath(log_path)
@@ -249,6 +491,7 @@ def run_bayes_train(data_path: str):
         r2_train=r2_train,
         coverage_cells=coverage_cells,
         coverage_pct=coverage_pct,
+        map_summary=map_summary,
     )
     print(f"\nLogged training run to {abs_log_path} ✅")
     # Summary
@@ -257,7 +500,7 @@ def run_bayes_train(data_path: str):
     print("Median std:", np.median(grid_std))
     print("Min std:", np.min(grid_std))
     print("Max std:", np.max(grid_std))
-    return {
+    summary = {
         "r2_train": float(r2_train),
         "coverage_cells": int(coverage_cells),
         "coverage_pct": int(coverage_pct),
@@ -266,7 +509,35 @@ def run_bayes_train(data_path: str):
         "grid_std_median": float(np.median(grid_std)),
         "grid_std_min": float(np.min(grid_std)),
         "grid_std_max": float(np.max(grid_std)),
+        "uncertainty_map": map_summary,
     }
+    if backend == "exact" and not model_reused:
+        try:
+            store.save(data_hash, model, summary=summary)
+        except Exception as e:
+            print(f"[BayesTrain] could not store model: {e}")
+    if n_proposals:
+        try:
+            designs = propose_designs(model, data_path, n_proposals, proposals_path)
+            summary["proposals"] = designs
+        except Exception as e:
+            print(f"[BayesTrain] proposing designs failed: {e}")
+    # Plot in the artifact process, after this function has returned its result
+    from ExploreTab.Artifacts import data_hash as artifact_hash, submit_artifact
+
+    plot_path = os.path.abspath("uncertainty_and_occupancy.png")
+    submit_artifact(
+        "uncertainty_plot",
+        "ExploreTab.BayesTrain:plot_uncertainty_and_occupancy",
+        args=(grid_norm, grid_std, X),
+        kwargs={"output_path": plot_path},
+        output_path=plot_path,
+        input_hash=artifact_hash(grid_norm, grid_std, X),
+    )
+    summary["data_hash"] = data_hash
+    summary["model_reused"] = model_reused
+    summary["backend"] = backend
+    return summary
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+import ast
+import json
+import os
+import numpy as np
+
+# Pairwise comparison log: JSON Lines, one record per pick, e.g.
+#   {"winner": 3, "loser": 9, "match_id": 2, "round": 1}
+# Appending a pick writes one line; nothing is ever executed when reading.
+LOG_FILENAME = "designsRatings.jsonl"
+
+
+def comparison_log_path(tmp_dir=os.path.join("src", "ExploreTab", "tmp")):
+    return os.path.join(tmp_dir, LOG_FILENAME)
+
+
+# ---------------------------
+# Writing
+# ---------------------------
+def append_comparison(path, winner, loser, **fields):
+    """Append one comparison record (extra fields, e.g. match_id/round, are kept)."""
+    record = {"winner": int(winner), "loser": int(loser)}
+    record.update(fields)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def write_comparisons(path, comparisons):
+    """Write a whole log from (winner, loser) pairs, replacing the file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for w, l in comparisons:
+            f.write(json.dumps({"winner": int(w), "loser": int(l)}, separators=(",", ":")) + "\n")
+    os.replace(tmp_path, path)
+
+
+# ---------------------------
+# Reading
+# ---------------------------
+def iter_comparisons(path):
+    """Stream (winner, loser) pairs from a log; malformed lines (e.g. a cut-off last line) are skipped."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                yield int(record["winner"]), int(record["loser"])
+            except (ValueError, KeyError, TypeError):
+                continue
+
+
+def read_comparisons(path):
+    """All (winner, loser) pairs of a log as an (n, 2) int array.
+
+    The lines are parsed as one JSON array, which is much faster than one
+    json.loads per line; falls back to the streaming reader if a line is bad.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    try:
+        records = json.loads("[" + ",".join(lines) + "]")
+        pairs = [(r["winner"], r["loser"]) for r in records]
+    except (ValueError, KeyError, TypeError):
+        pairs = list(iter_comparisons(path))
+    return np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+
+
+def read_legacy_comparisons(path):
+    """Pairs from the old "comparisons = [(w,l), ...]" Python-source files, without exec()."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    _name, _eq, value = text.partition("=")
+    pairs = ast.literal_eval(value.strip()) if value.strip() else []
+    return np.asarray([(int(w), int(l)) for w, l in pairs], dtype=np.int64).reshape(-1, 2)
+
+
+def load_comparisons(path):
+    """(n, 2) array of (winner, loser) pairs from a JSON Lines log or a legacy ratings file."""
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(64).lstrip()
+    if head.startswith("comparisons"):
+        return read_legacy_comparisons(path)
+    return read_comparisons(path)
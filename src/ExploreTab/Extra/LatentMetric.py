@@ -2,8 +2,174 @@ import json
 import os
 import numpy as np
 from ExploreTab.BayesTrain import run_bayes_train
+from ExploreTab.ComparisonLog import LOG_FILENAME, load_comparisons
 
-def compute_latent_values(designs_file, ratings_file):
+# ---------------------------
+# BRADLEY-TERRY LATENT RATINGS
+# ---------------------------
+class LatentRatingEngine:
+    """Bradley-Terry ratings fitted by MAP on a sparse comparison matrix.
+
+    P(w beats l) = sigmoid(f_w - f_l), with a N(0, 1/prior_precision) prior
+    on every f so that tournaments (where the winners are perfectly
+    separated) still have a finite optimum. Repeated (w, l) pairs are
+    aggregated into one weighted row, so the cost grows with the number of
+    distinct pairs, not with the number of comparisons. Each fit is a few
+    Newton steps (conjugate gradient on the sparse Hessian) started from
+    the current scores, so adding comparisons only costs a short update.
+    """
+
+    def __init__(self, num_designs, prior_precision=1.0, tol=1e-8, max_iter=50):
+        self.num_designs = int(num_designs)
+        self.prior_precision = prior_precision
+        self.tol = tol
+        self.max_iter = max_iter
+        self.scores = np.zeros(self.num_designs)
+        self.num_comparisons = 0     # comparisons passed to add_comparisons (incl. skipped ones)
+        self._seen = []              # blocks of those comparisons, in order (see has_seen)
+        # One row per distinct (winner, loser) pair
+        self._pair_rows = {}
+        self._winners = np.zeros(0, dtype=np.int64)
+        self._losers = np.zeros(0, dtype=np.int64)
+        self._counts = np.zeros(0)
+        self._matrix = None          # cached (A, A^T) for the current pairs
+
+    def reset(self, num_designs=None):
+        """Forget every comparison (and optionally resize); scores return to the prior mean."""
+        self.__init__(
+            self.num_designs if num_designs is None else num_designs,
+            prior_precision=self.prior_precision,
+            tol=self.tol,
+            max_iter=self.max_iter,
+        )
+
+    def add_designs(self, count):
+        """Grow the design set; new designs start at the prior mean (0)."""
+        self.num_designs += int(count)
+        self.scores = np.concatenate([self.scores, np.zeros(int(count))])
+        self._matrix = None
+
+    def add_comparisons(self, comparisons, refit=True):
+        """Record (winner, loser) pairs and update the scores from the previous fit."""
+        if not isinstance(comparisons, np.ndarray):
+            comparisons = list(comparisons)
+        pairs = np.asarray(comparisons, dtype=np.int64).reshape(-1, 2)
+        self.num_comparisons += len(pairs)
+        self._seen.append(pairs.copy())
+        valid = (
+            (pairs[:, 0] != pairs[:, 1])
+            & (pairs >= 0).all(axis=1)
+            & (pairs < self.num_designs).all(axis=1)
+        )
+        rows, new_pairs = [], []
+        for w, l in pairs[valid].tolist():
+            row = self._pair_rows.get((w, l))
+            if row is None:
+                row = self._pair_rows[(w, l)] = len(self._pair_rows)
+                new_pairs.append((w, l))
+            rows.append(row)
+        if new_pairs:
+            new_pairs = np.array(new_pairs, dtype=np.int64)
+            self._winners = np.concatenate([self._winners, new_pairs[:, 0]])
+            self._losers = np.concatenate([self._losers, new_pairs[:, 1]])
+            self._counts = np.concatenate([self._counts, np.zeros(len(new_pairs))])
+            self._matrix = None
+        np.add.at(self._counts, np.array(rows, dtype=np.int64), 1.0)
+        if refit:
+            self.fit()
+        return self.scores
+
+    def add_comparison(self, winner, loser):
+        return self.add_comparisons([(winner, loser)])
+
+    def has_seen(self, comparisons):
+        """True if comparisons starts with exactly the comparisons added so far, in the same order."""
+        pairs = np.asarray(comparisons, dtype=np.int64).reshape(-1, 2)[: self.num_comparisons]
+        if len(pairs) != self.num_comparisons:
+            return False
+        seen = np.concatenate(self._seen) if self._seen else np.zeros((0, 2), dtype=np.int64)
+        return np.array_equal(pairs, seen)
+
+    def _comparison_matrix(self):
+        """Sparse (pairs x designs) matrix with +1 at the winner and -1 at the loser, and its transpose."""
+        if self._matrix is None:
+            from scipy import sparse
+
+            n_pairs = len(self._counts)
+            rows = np.repeat(np.arange(n_pairs), 2)
+            cols = np.column_stack([self._winners, self._losers]).reshape(-1)
+            vals = np.tile([1.0, -1.0], n_pairs)
+            A = sparse.csr_matrix((vals, (rows, cols)), shape=(n_pairs, self.num_designs))
+            self._matrix = (A, A.T.tocsr())
+        return self._matrix
+
+    def fit(self):
+        """Newton iterations on the log-posterior, warm-started from the current scores.
+
+        The Hessian A^T W A + prior is only used through products with A and
+        A^T (conjugate gradient with a Jacobi preconditioner), never formed.
+        """
+        from scipy.sparse.linalg import cg, LinearOperator
+        from scipy.special import expit
+
+        if len(self._counts) == 0:
+            return self.scores
+        A, AT = self._comparison_matrix()
+        n = self.num_designs
+        lam = self.prior_precision
+        f = self.scores
+        for _ in range(self.max_iter):
+            p = expit(A @ f)                               # P(winner beats loser)
+            grad = AT @ (self._counts * (1.0 - p)) - lam * f
+            weights = self._counts * p * (1.0 - p)
+            diag = (
+                np.bincount(self._winners, weights, minlength=n)
+                + np.bincount(self._losers, weights, minlength=n)
+                + lam
+            )
+            hessian = LinearOperator((n, n), matvec=lambda v: AT @ (weights * (A @ v)) + lam * v)
+            precond = LinearOperator((n, n), matvec=lambda v: v / diag)
+            step, _info = cg(hessian, grad, M=precond)
+            f = f + step
+            if np.max(np.abs(step)) < self.tol:
+                break
+        self.scores = f
+        return f
+
+    def precision_matrix(self):
+        """Dense Hessian of the negative log-posterior at the current scores.
+
+        Its inverse is the Laplace approximation of the posterior covariance
+        of the scores (used to pick informative comparisons).
+        """
+        from scipy.special import expit
+
+        n = self.num_designs
+        H = self.prior_precision * np.eye(n)
+        if len(self._counts) == 0:
+            return H
+        p = expit(self.scores[self._winners] - self.scores[self._losers])
+        weights = self._counts * p * (1.0 - p)
+        np.add.at(H, (self._winners, self._winners), weights)
+        np.add.at(H, (self._losers, self._losers), weights)
+        np.add.at(H, (self._winners, self._losers), -weights)
+        np.add.at(H, (self._losers, self._winners), -weights)
+        return H
+
+    def centered_scores(self):
+        return self.scores - np.mean(self.scores)
+
+
+def compute_latent_values(designs_file, ratings_file, engine=None):
+    """Latent ratings for every design in designs_file from the comparisons in ratings_file.
+
+    Pass an existing LatentRatingEngine to warm-start from its scores; only
+    comparisons it has not seen yet are added. That assumes both files only
+    grew since: if the log does not start with the comparisons the engine
+    has seen (e.g. the tmp folder was cleared and a new tournament was
+    recorded) or the design list got shorter, the engine is reset and
+    refitted from scratch.
+    """
     # ---- Load designs (to get number + names) ----
     with open(designs_file, "r") as f:
         designs = json.load(f)
@@ -11,29 +177,25 @@ def compute_latent_values(designs_file, ratings_file):
     num_designs = len(designs)
     names = [d["Name"] for d in designs]
 
-    # ---- Load comparisons from designsRatings.txt ----
-    # The file contains: comparisons = [(w,l), ...]
-    with open(ratings_file, "r") as f:
-        text = f.read()
-
-    ns = {}
-    exec(text, ns)                     # pulls out variable 'comparisons'
-    comparisons = ns["comparisons"]
-
-    # ---- Build A and b for least-squares ----
-    M = len(comparisons)
-    A = np.zeros((M, num_designs))
-    b = np.ones(M)
-
-    for i, (w, l) in enumerate(comparisons):
-        A[i, w] =  1.0
-        A[i, l] = -1.0
-
-    # ---- Solve A f = b ----
-    f, *_ = np.linalg.lstsq(A, b, rcond=None)
+    # ---- Load comparisons (designsRatings.jsonl, or a legacy designsRatings.txt) ----
+    comparisons = load_comparisons(ratings_file)
+
+    # ---- Bradley-Terry fit on the sparse comparison matrix ----
+    if engine is None:
+        engine = LatentRatingEngine(num_designs)
+        new_comparisons = comparisons
+    elif num_designs < engine.num_designs or not engine.has_seen(comparisons):
+        print("[LatentMetric] comparison log or design list was reset; refitting from scratch")
+        engine.reset(num_designs)
+        new_comparisons = comparisons
+    else:
+        if num_designs > engine.num_designs:
+            engine.add_designs(num_designs - engine.num_designs)
+        new_comparisons = comparisons[engine.num_comparisons:]
+    engine.add_comparisons(new_comparisons)
 
     # ---- Center scores ----
-    f = f - np.mean(f)
+    f = engine.centered_scores()
 
     return names, f
 
@@ -41,8 +203,8 @@ def compute_latent_values(designs_file, ratings_file):
 # ---------------------------
 # UPDATE designs.txt RATINGS
 # ---------------------------
-def update_designs_ratings(designs_file, ratings_file, *, decimals=3):
-    names, scores = compute_latent_values(designs_file, ratings_file)
+def update_designs_ratings(designs_file, ratings_file, *, decimals=3, engine=None):
+    names, scores = compute_latent_values(designs_file, ratings_file, engine=engine)
     name_to_score = {n: float(s) for n, s in zip(names, scores)}
 
     with open(designs_file, "r") as f:
@@ -69,7 +231,9 @@ if __name__ == "__main__":
     this_dir = os.path.dirname(__file__)
     tmp_dir = os.path.abspath(os.path.join(this_dir, "..", "tmp"))
     designs_path = os.path.join(tmp_dir, "designs.txt")
-    ratings_path = os.path.join(tmp_dir, "designsRatings.txt")
+    ratings_path = os.path.join(tmp_dir, LOG_FILENAME)
+    if not os.path.exists(ratings_path):
+        ratings_path = os.path.join(tmp_dir, "designsRatings.txt")
 
     print(f"[LatentMetric] tmp_dir={tmp_dir}")
     print(f"[LatentMetric] designs_path={designs_path}")
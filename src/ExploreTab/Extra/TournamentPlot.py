@@ -1,7 +1,6 @@
 import json
 import sys
 from collections import defaultdict
-import matplotlib.pyplot as plt
 
 
 def plot_tournament(designs_path: str, results_path: str, *, horizontal_compression: float = 0.6, output_path: str | None = None) -> None:
@@ -82,6 +81,10 @@ def plot_tournament(designs_path: str, results_path: str, *, horizontal_compress
     # -------------------------------
     # 4. Plot bracket-style layout
     # -------------------------------
+    import matplotlib
+    matplotlib.use("Agg")  # only saved to file, and may run off the main thread
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(14, 8))
 
     # Evenly space base positions within margins, centered around 0.5
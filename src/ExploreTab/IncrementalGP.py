@@ -0,0 +1,163 @@
+import os
+import numpy as np
+
+# The GP state is kept in src/tmp next to the design database, not in the
+# Explore tmp folder that is cleared for every session. Training runs once
+# per session on the earlier sessions' history followed by the new ratings,
+# so the next session's rows extend the stored factor.
+STATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tmp")
+
+
+# ---------------------------
+# Incremental GP model manager
+# ---------------------------
+class IncrementalGP:
+    """Keeps the fitted GP between training runs and updates it incrementally.
+
+    Each training run (one per Explore session) only adds the new session's
+    ratings to the earlier history, so instead of refitting with random
+    restarts every time:
+      - the kernel hyperparameters are kept between full refits,
+      - the Cholesky factor of K + alpha*I is extended block-wise with the
+        new rows (rank-k update, O(n^2 k) instead of O(n^3)),
+      - every full_refit_every updates (or when earlier rows changed) the
+        hyperparameters are re-optimized, with the previous optimum as the
+        first start point.
+    Ratings of existing rows may change between runs (they are re-estimated
+    from all comparisons); the factor only depends on X, so only the
+    weights are recomputed.
+    """
+
+    def __init__(self, state_path, full_refit_every=4, parallel=None):
+        self.state_path = state_path
+        self.full_refit_every = max(1, int(full_refit_every))
+        self.parallel = parallel
+
+        self.theta = None          # log-hyperparameters of the kernel
+        self.X_train = None
+        self.L = None              # lower Cholesky factor of K(X_train) + alpha*I
+        self.updates_since_refit = 0
+        self.last_update = None    # "full" or "incremental"
+
+    # ---- persistence ----
+    def load(self):
+        """Load the saved state; returns False when there is none or it is unreadable."""
+        if not os.path.exists(self.state_path):
+            return False
+        try:
+            with np.load(self.state_path) as state:
+                self.theta = state["theta"]
+                self.X_train = state["X_train"]
+                self.L = state["L"]
+                self.updates_since_refit = int(state["updates_since_refit"])
+            return True
+        except Exception as e:
+            print(f"[IncrementalGP] Could not load {self.state_path}: {e}")
+            self.theta = self.X_train = self.L = None
+            return False
+
+    def save(self):
+        try:
+            directory = os.path.dirname(self.state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            np.savez(
+                self.state_path,
+                theta=self.theta,
+                X_train=self.X_train,
+                L=self.L,
+                updates_since_refit=self.updates_since_refit,
+            )
+        except Exception as e:
+            print(f"[IncrementalGP] Could not save {self.state_path}: {e}")
+
+    # ---- updates ----
+    def _can_extend(self, X):
+        if self.theta is None or self.X_train is None or self.L is None:
+            return False
+        n_old = self.X_train.shape[0]
+        if X.ndim != 2 or X.shape[1] != self.X_train.shape[1] or X.shape[0] < n_old:
+            return False
+        # Earlier rows must be unchanged and in the same order
+        return np.array_equal(X[:n_old], self.X_train)
+
+    def update(self, X, y):
+        """Return a fitted GaussianProcessRegressor for (X, y), reusing the saved state."""
+        from ExploreTab.BayesTrain import train_bayesian_gp, _make_kernel
+
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        if self._can_extend(X) and self.updates_since_refit + 1 < self.full_refit_every:
+            try:
+                kernel = _make_kernel().clone_with_theta(self.theta)
+                model = self._extend(X, y, kernel)
+                self.updates_since_refit += 1
+                self.last_update = "incremental"
+                print(f"[IncrementalGP] incremental update: {X.shape[0]} samples, kept kernel {model.kernel_}")
+                self.save()
+                return model
+            except np.linalg.LinAlgError as e:
+                print(f"[IncrementalGP] Factor update failed ({e}); refitting")
+
+        # Full refit, warm-started from the previous optimum when there is one
+        model = train_bayesian_gp(X, y, parallel=self.parallel, theta0=self.theta)
+        self.theta = model.kernel_.theta.copy()
+        self.X_train = model.X_train_.copy()
+        self.L = model.L_.copy()
+        self.updates_since_refit = 0
+        self.last_update = "full"
+        self.save()
+        return model
+
+    def _extend(self, X, y, kernel):
+        """Extend the stored factor with the rows of X past X_train and build the model."""
+        from scipy.linalg import cholesky, solve_triangular
+
+        n_old = self.X_train.shape[0]
+        X_new = X[n_old:]
+        alpha = _GPR_ALPHA
+        if X_new.shape[0] > 0:
+            # [[L11, 0], [L21, L22]] with L21 = B^T L11^-T and L22 L22^T = C - L21 L21^T
+            B = kernel(self.X_train, X_new)
+            C = kernel(X_new)
+            C[np.diag_indices_from(C)] += alpha
+            L21 = solve_triangular(self.L, B, lower=True, check_finite=False).T
+            L22 = cholesky(C - L21 @ L21.T, lower=True, check_finite=False)
+            k = X_new.shape[0]
+            L = np.zeros((n_old + k, n_old + k))
+            L[:n_old, :n_old] = self.L
+            L[n_old:, :n_old] = L21
+            L[n_old:, n_old:] = L22
+            self.L = L
+            self.X_train = X.copy()
+        return _model_from_factor(kernel, self.X_train, y, self.L)
+
+
+# GaussianProcessRegressor's default alpha (value added to the kernel diagonal)
+_GPR_ALPHA = 1e-10
+
+
+def _model_from_factor(kernel, X, y, L):
+    """GaussianProcessRegressor with fixed kernel and a precomputed factor.
+
+    Normalizes y like GaussianProcessRegressor.fit() with normalize_y=True
+    and no optimizer, so predict()/score() work unchanged.
+    """
+    from scipy.linalg import cho_solve
+    from ExploreTab.BayesTrain import fitted_gp
+
+    y_mean = np.mean(y, axis=0)
+    y_std = np.std(y, axis=0)
+    if y_std == 0.0:
+        y_std = 1.0
+    y_norm = (y - y_mean) / y_std
+    weights = cho_solve((L, True), y_norm, check_finite=False)
+    # log p(y|X) = -1/2 y^T alpha - sum(log diag L) - n/2 log(2 pi)
+    lml = -0.5 * y_norm @ weights - np.log(np.diag(L)).sum() - 0.5 * len(y) * np.log(2 * np.pi)
+    return fitted_gp(kernel, X, y_norm, y_mean, y_std, L, weights, lml)
+
+
+def incremental_state_path(object_type=None):
+    """One state per object type (the sliders and their bounds differ)."""
+    return os.path.join(STATE_DIR, f"gp_state_{(object_type or 'Vase').lower()}.npz")
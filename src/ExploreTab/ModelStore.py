@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import numpy as np
+
+# Arrays of a fitted GP, one .npy file each so they can be memory-mapped
+MODEL_ARRAYS = ("theta", "X_train", "y_train", "L", "alpha")
+
+
+def training_data_hash(X, y, kernel_repr=""):
+    """sha1 of the training arrays (and the kernel definition they are fitted with)."""
+    h = hashlib.sha1()
+    for arr in (X, y):
+        arr = np.ascontiguousarray(arr, dtype=float)
+        h.update(str(arr.shape).encode("utf-8"))
+        h.update(arr.tobytes())
+    h.update(kernel_repr.encode("utf-8"))
+    return h.hexdigest()
+
+
+# ---------------------------
+# Persistent store of trained GP models
+# ---------------------------
+class ModelStore:
+    """Trained GP models on disk, keyed by the hash of their training data.
+
+    Layout (one directory per model):
+        <root>/<data_hash>/theta.npy, X_train.npy, y_train.npy, L.npy, alpha.npy
+        <root>/<data_hash>/meta.json   (kernel, y normalization, lml, summary stats)
+        <root>/latest.json             (hash of the most recently trained model)
+    load() memory-maps the arrays by default, so getting predictions from a
+    stored model costs no training and almost no I/O up front.
+    """
+
+    def __init__(self, root, max_models=5):
+        self.root = root
+        self.max_models = max_models
+
+    def _model_dir(self, data_hash):
+        return os.path.join(self.root, data_hash)
+
+    def has(self, data_hash):
+        return os.path.exists(os.path.join(self._model_dir(data_hash), "meta.json"))
+
+    def save(self, data_hash, model, summary=None):
+        """Write model's fitted state under data_hash and mark it as the latest model."""
+        os.makedirs(self.root, exist_ok=True)
+        arrays = {
+            "theta": model.kernel_.theta,
+            "X_train": model.X_train_,
+            "y_train": model.y_train_,
+            "L": model.L_,
+            "alpha": model.alpha_,
+        }
+        meta = {
+            "data_hash": data_hash,
+            "kernel": str(model.kernel_),
+            "y_train_mean": float(model._y_train_mean),
+            "y_train_std": float(model._y_train_std),
+            "log_marginal_likelihood": float(model.log_marginal_likelihood_value_),
+            "num_samples": int(model.X_train_.shape[0]),
+            "saved_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "summary": summary or {},
+        }
+
+        # Write into a temporary directory and rename it, so readers never see half a model
+        final_dir = self._model_dir(data_hash)
+        tmp_dir = final_dir + f".tmp{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        for name in MODEL_ARRAYS:
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), np.ascontiguousarray(arrays[name], dtype=float))
+        with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        shutil.rmtree(final_dir, ignore_errors=True)
+        os.replace(tmp_dir, final_dir)
+
+        self._write_latest(data_hash)
+        self._prune(keep=data_hash)
+
+    def load_meta(self, data_hash):
+        with open(os.path.join(self._model_dir(data_hash), "meta.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def load(self, data_hash, mmap=True):
+        """GaussianProcessRegressor for data_hash (None if not stored)."""
+        from ExploreTab.BayesTrain import _make_kernel, fitted_gp
+
+        if not self.has(data_hash):
+            return None
+        try:
+            meta = self.load_meta(data_hash)
+            mode = "r" if mmap else None
+            arrays = {
+                name: np.load(os.path.join(self._model_dir(data_hash), f"{name}.npy"), mmap_mode=mode)
+                for name in MODEL_ARRAYS
+            }
+            kernel = _make_kernel().clone_with_theta(np.array(arrays["theta"]))
+            return fitted_gp(
+                kernel,
+                arrays["X_train"],
+                arrays["y_train"],
+                meta["y_train_mean"],
+                meta["y_train_std"],
+                arrays["L"],
+                arrays["alpha"],
+                meta["log_marginal_likelihood"],
+            )
+        except Exception as e:
+            print(f"[ModelStore] Could not load model {data_hash}: {e}")
+            return None
+
+    def latest_hash(self):
+        try:
+            with open(os.path.join(self.root, "latest.json"), "r", encoding="utf-8") as f:
+                return json.load(f).get("data_hash")
+        except Exception:
+            return None
+
+    def load_latest(self, mmap=True):
+        """Most recently trained model, or None."""
+        data_hash = self.latest_hash()
+        return self.load(data_hash, mmap=mmap) if data_hash else None
+
+    def _write_latest(self, data_hash):
+        with open(os.path.join(self.root, "latest.json"), "w", encoding="utf-8") as f:
+            json.dump({"data_hash": data_hash}, f)
+
+    def _prune(self, keep):
+        """Remove the oldest models beyond max_models."""
+        if not self.max_models:
+            return
+        entries = []
+        for name in os.listdir(self.root):
+            path = self._model_dir(name)
+            if os.path.isdir(path) and name != keep and os.path.exists(os.path.join(path, "meta.json")):
+                entries.append((os.path.getmtime(path), path))
+        entries.sort(reverse=True)
+        for _mtime, path in entries[max(0, self.max_models - 1):]:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def model_store_root(data_path):
+    """Models are stored next to the training data (src/ExploreTab/tmp/models)."""
+    return os.path.join(os.path.dirname(os.path.abspath(data_path)), "models")
+
+
+def load_trained_model(data_path=os.path.join("src", "ExploreTab", "tmp", "designs.txt"), mmap=True, history=None):
+    """GP that run_bayes_train fitted on the current contents of data_path (and history), without retraining.
+
+    None if the training data changed since the last run (or nothing was stored yet).
+    """
+    from ExploreTab.BayesTrain import _make_kernel, training_data
+
+    X, y = training_data(data_path, history)
+    if len(y) == 0:
+        return None
+    return ModelStore(model_store_root(data_path)).load(training_data_hash(X, y, str(_make_kernel())), mmap=mmap)
@@ -0,0 +1,100 @@
+import numpy as np
+
+
+# ---------------------------
+# Sparse (inducing-point) GP surrogate
+# ---------------------------
+class SparseGPRegressor:
+    """Inducing-point GP (DTC approximation) for large rating histories.
+
+    Exact GP training is O(n^3). Here the hyperparameters are fitted with the
+    exact GP on a random subset of at most hyper_subset points, and the
+    posterior is then computed with m inducing points, which costs
+    O(n m^2) time and O(m^2) memory (the n x m cross-kernel is processed in
+    chunks). predict() has the same interface as GaussianProcessRegressor:
+    mean, optionally with the std (which includes the fitted noise level).
+    """
+
+    def __init__(self, n_inducing=300, hyper_subset=300, chunk_size=4096, random_state=0):
+        self.n_inducing = n_inducing
+        self.hyper_subset = hyper_subset
+        self.chunk_size = chunk_size
+        self.random_state = random_state
+
+    def fit(self, X, y, parallel=None):
+        from scipy.linalg import cholesky, solve_triangular
+        from ExploreTab.BayesTrain import train_bayesian_gp
+
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        n = X.shape[0]
+        rng = np.random.RandomState(self.random_state)
+
+        # Hyperparameters from an exact fit on a subset
+        subset = np.sort(rng.choice(n, self.hyper_subset, replace=False)) if n > self.hyper_subset else np.arange(n)
+        exact = train_bayesian_gp(X[subset], y[subset], parallel=parallel)
+        self.kernel_ = exact.kernel_
+        # kernel_ = C * RBF + WhiteKernel: the signal part and the noise variance
+        self._signal_kernel = self.kernel_.k1
+        self._noise = max(float(self.kernel_.k2.noise_level), 1e-6)
+
+        # Same target normalization as normalize_y=True
+        self._y_train_mean = float(np.mean(y))
+        self._y_train_std = float(np.std(y)) or 1.0
+        y_norm = (y - self._y_train_mean) / self._y_train_std
+
+        # Inducing points: a random subset of the training inputs
+        m = min(self.n_inducing, n)
+        self.inducing_points_ = X[np.sort(rng.choice(n, m, replace=False))]
+        Kmm = self._signal_kernel(self.inducing_points_)
+        Kmm[np.diag_indices_from(Kmm)] += 1e-8 * np.mean(np.diag(Kmm))
+        self._Lm = cholesky(Kmm, lower=True, check_finite=False)
+
+        # B = I + V V^T / noise and V y with V = Lm^-1 Kmn, accumulated in chunks
+        B = np.eye(m)
+        Vy = np.zeros(m)
+        for start in range(0, n, self.chunk_size):
+            stop = min(start + self.chunk_size, n)
+            V = solve_triangular(
+                self._Lm, self._signal_kernel(self.inducing_points_, X[start:stop]), lower=True, check_finite=False
+            )
+            B += (V @ V.T) / self._noise
+            Vy += V @ y_norm[start:stop]
+        self._LB = cholesky(B, lower=True, check_finite=False)
+        self._c = solve_triangular(self._LB, Vy, lower=True, check_finite=False) / self._noise
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def predict(self, X, return_std=False):
+        from scipy.linalg import solve_triangular
+
+        X = np.asarray(X, dtype=float)
+        mean = np.empty(X.shape[0])
+        std = np.empty(X.shape[0]) if return_std else None
+        for start in range(0, X.shape[0], self.chunk_size):
+            stop = min(start + self.chunk_size, X.shape[0])
+            A = solve_triangular(
+                self._Lm, self._signal_kernel(self.inducing_points_, X[start:stop]), lower=True, check_finite=False
+            )
+            W = solve_triangular(self._LB, A, lower=True, check_finite=False)
+            mean[start:stop] = W.T @ self._c
+            if return_std:
+                var = (
+                    self._signal_kernel.diag(X[start:stop])
+                    - np.sum(A * A, axis=0)
+                    + np.sum(W * W, axis=0)
+                    + self._noise
+                )
+                std[start:stop] = np.sqrt(np.maximum(var, 0.0))
+
+        mean = mean * self._y_train_std + self._y_train_mean
+        if return_std:
+            return mean, std * self._y_train_std
+        return mean
+
+    def score(self, X, y):
+        """R^2 of the predictions, like GaussianProcessRegressor.score()."""
+        y = np.asarray(y, dtype=float)
+        residual = np.sum((y - self.predict(X)) ** 2)
+        total = np.sum((y - np.mean(y)) ** 2)
+        return 1.0 - residual / total if total > 0 else 0.0
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import numpy as np
+
+CACHE_SUFFIX = ".train.npz"
+# A file written this close to when its signature was taken can change again
+# without changing mtime (coarse timestamps, e.g. 2 s on FAT); such
+# signatures are verified by hash before they are trusted (like git's
+# "racily clean" check)
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def training_cache_path(data_path):
+    return os.path.abspath(data_path) + CACHE_SUFFIX
+
+
+def _sha1(raw):
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _file_signature(path):
+    # ctime and inode also change when a rewrite restores the old mtime (os.utime)
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size, st.st_ctime_ns, st.st_ino
+
+
+# ---------------------------
+# Columnar training matrix
+# ---------------------------
+def _detect_object_type(data):
+    for obj in data:
+        t = obj.get("object_type")
+        if t:
+            return t
+    return None
+
+
+def _slider_bounds(object_type):
+    from ExploreTab.BatchAcquisition import load_slider_config
+
+    slider = load_slider_config(object_type)
+    keys = [name for name, _rng, _default in slider]
+    low = np.array([rng[0] for _name, rng, _default in slider], dtype=float)
+    high = np.array([rng[1] for _name, rng, _default in slider], dtype=float)
+    return keys, low, high
+
+
+def _columns(data, ot_lower, keys, low, high):
+    """Normalized (X, y) of the rated designs of one object type, in file order."""
+    rated = [
+        obj for obj in data
+        if obj.get("object_type", "").lower() == ot_lower and obj.get("Rating") is not None
+    ]
+    values = np.array([[obj["parameters"][key] for key in keys] for obj in rated], dtype=float)
+    X = (values.reshape(len(rated), len(keys)) - low) / (high - low)  # normalize to [0, 1]
+    y = np.array([obj["Rating"] for obj in rated], dtype=float)
+    return np.ascontiguousarray(X), y
+
+
+class TrainingMatrixCache:
+    """Normalized training matrix of one design list, kept between retrains.
+
+    The (X, y) arrays built from the JSON list are cached in memory and in
+    <file>.train.npz together with the file's stat signature (mtime, size,
+    ctime, inode), its SHA-1 and the slider bounds used. load() then
+      - returns the cached arrays if the file is untouched (no read, no
+        parse; a signature taken within RACY_WINDOW_NS of the file's mtime
+        is first confirmed by hash),
+      - or if only its signature changed (same SHA-1),
+      - parses only the new entries if the list was extended (the old
+        contents up to the closing bracket are unchanged), e.g. after a
+        DesignStore compaction appended designs,
+      - and rebuilds the arrays (vectorized) otherwise, e.g. when ratings
+        were rewritten.
+    """
+
+    def __init__(self, data_path):
+        self.data_path = data_path
+        self.cache_path = training_cache_path(data_path)
+        self._lock = threading.Lock()
+        self._state = None
+        self.status = None       # how the last load() got its arrays, for the log
+
+    # ---- persistence ----
+    def _load_disk(self):
+        if not os.path.exists(self.cache_path):
+            return None
+        try:
+            with np.load(self.cache_path) as npz:
+                state = {name: npz[name] for name in npz.files}
+            return {
+                "signature": tuple(int(v) for v in state["signature"]),
+                "checked_ns": int(state["checked_ns"]) if "checked_ns" in state else 0,
+                "file_hash": str(state["file_hash"]),
+                "prefix_len": int(state["prefix_len"]),
+                "prefix_hash": str(state["prefix_hash"]),
+                "object_type": str(state["object_type"]) or None,
+                "num_items": int(state["num_items"]),
+                "low": state["low"],
+                "high": state["high"],
+                "X": state["X"],
+                "y": state["y"],
+            }
+        except Exception as e:
+            print(f"[TrainingCache] Could not load {self.cache_path}: {e}")
+            return None
+
+    def _save_disk(self, state):
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    signature=np.array(state["signature"], dtype=np.int64),
+                    checked_ns=np.int64(state["checked_ns"]),
+                    file_hash=state["file_hash"],
+                    prefix_len=state["prefix_len"],
+                    prefix_hash=state["prefix_hash"],
+                    object_type=state["object_type"] or "",
+                    num_items=state["num_items"],
+                    low=state["low"],
+                    high=state["high"],
+                    X=state["X"],
+                    y=state["y"],
+                )
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"[TrainingCache] Could not save {self.cache_path}: {e}")
+
+    # ---- building ----
+    def _new_state(self, raw, signature, object_type, num_items, low, high, X, y):
+        # Contents before the closing bracket (and the whitespace ahead of it)
+        prefix_len = len(raw[:raw.rstrip().rfind(b"]")].rstrip())
+        return {
+            "signature": signature,
+            "file_hash": _sha1(raw),
+            "prefix_len": prefix_len,
+            "prefix_hash": _sha1(raw[:prefix_len]),
+            "object_type": object_type,
+            "num_items": num_items,
+            "low": low,
+            "high": high,
+            "X": X,
+            "y": y,
+        }
+
+    def _rebuild(self, raw, signature):
+        data = json.loads(raw) if raw.strip() else []
+        object_type = _detect_object_type(data)
+        keys, low, high = _slider_bounds(object_type)
+        X, y = _columns(data, (object_type or "Vase").lower(), keys, low, high)
+        return self._new_state(raw, signature, object_type, len(data), low, high, X, y)
+
+    def _extend(self, state, raw, signature):
+        """State for raw if it only appends entries to the cached list, else None."""
+        prefix_len = state["prefix_len"]
+        if state["object_type"] is None or state["num_items"] == 0 or prefix_len <= 0 or len(raw) <= prefix_len:
+            return None
+        if _sha1(raw[:prefix_len]) != state["prefix_hash"]:
+            return None
+        tail = raw[prefix_len:].lstrip()
+        if not tail.startswith(b","):
+            return None
+        try:
+            new_items = json.loads(b"[" + tail[1:])
+        except ValueError:
+            return None
+        X_new, y_new = _columns(new_items, state["object_type"].lower(), *_slider_bounds(state["object_type"]))
+        return self._new_state(
+            raw, signature, state["object_type"], state["num_items"] + len(new_items),
+            state["low"], state["high"], np.concatenate([state["X"], X_new]), np.concatenate([state["y"], y_new]),
+        )
+
+    @staticmethod
+    def _trusted(state, signature):
+        """True if state matches signature and the signature is old enough to rely on."""
+        return state["signature"] == signature and state["checked_ns"] - signature[0] >= RACY_WINDOW_NS
+
+    def _refresh(self):
+        """Bring the cached arrays up to date with the file; returns how that was done."""
+        signature = _file_signature(self.data_path)
+        state = self._state
+        if state is not None and self._trusted(state, signature):
+            return "cached"
+        if state is None:
+            state = self._load_disk()
+            if state is not None and self._trusted(state, signature) and self._bounds_current(state):
+                self._state = state
+                return "loaded from disk"
+        if state is not None and not self._bounds_current(state):
+            state = None
+        # Taken before the read: a write after this point has a later mtime
+        checked_ns = time.time_ns()
+        with open(self.data_path, "rb") as f:
+            raw = f.read()
+        num_items = state["num_items"] if state is not None else 0
+        if state is not None and _sha1(raw) == state["file_hash"]:
+            state, status = dict(state, signature=signature), "unchanged"
+        else:
+            new_state = self._extend(state, raw, signature) if state is not None else None
+            if new_state is None:
+                state, status = self._rebuild(raw, signature), "rebuilt"
+            else:
+                state, status = new_state, f"appended {new_state['num_items'] - num_items} entries"
+        state["checked_ns"] = checked_ns
+        self._state = state
+        self._save_disk(state)
+        return status
+
+    def _bounds_current(self, state):
+        """False when the slider config changed since the arrays were normalized."""
+        _keys, low, high = _slider_bounds(state["object_type"])
+        return (
+            low.shape == state["low"].shape
+            and np.array_equal(low, state["low"])
+            and np.array_equal(high, state["high"])
+        )
+
+    # ---- public ----
+    def load(self):
+        """(X, y) like BayesTrain.load_data(); the returned arrays are copies."""
+        with self._lock:
+            self.status = self._refresh()
+            X, y = self._state["X"], self._state["y"]
+            # load_data() returned a flat empty array when nothing was rated
+            return (X.copy() if len(y) else np.array([], dtype=float)), y.copy()
+
+    @property
+    def object_type(self):
+        """Object type of the list (as written in the file), or None if no entry has one."""
+        with self._lock:
+            self._refresh()
+            return self._state["object_type"]
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_training_cache(data_path):
+    """Process-wide cache for a design list, so retrains in one session share it."""
+    key = os.path.abspath(data_path)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = TrainingMatrixCache(data_path)
+        return cache
@@ -0,0 +1,140 @@
+import os
+import numpy as np
+
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+
+# ---------------------------
+# Evaluation points (normalized [0, 1]^d), produced chunk by chunk
+# ---------------------------
+def grid_chunks(levels, dims, chunk_size):
+    """Cell centers of a levels^dims grid, in chunks of at most chunk_size points."""
+    total = levels ** dims
+    centers = (np.arange(levels) + 0.5) / levels
+    for start in range(0, total, chunk_size):
+        index = np.arange(start, min(start + chunk_size, total))
+        digits = np.unravel_index(index, (levels,) * dims)
+        yield np.column_stack([centers[d] for d in digits])
+
+
+def sobol_chunks(n_points, dims, chunk_size, seed=0):
+    """n_points scrambled Sobol points (rounded up to a power of two), in chunks."""
+    from scipy.stats import qmc
+
+    sampler = qmc.Sobol(d=dims, scramble=True, seed=seed)
+    total = 1 << int(np.ceil(np.log2(max(2, n_points))))
+    for start in range(0, total, chunk_size):
+        yield sampler.random(min(chunk_size, total - start))
+
+
+# ---------------------------
+# Chunked, parallel prediction
+# ---------------------------
+def predict_std_chunked(model, chunks, workers=None, max_in_flight=None):
+    """Predictive std for every point of every chunk, as (points, std).
+
+    Chunks are predicted on a thread pool (the heavy parts are BLAS calls,
+    which release the GIL). At most max_in_flight chunks are queued at a
+    time, which bounds the prediction temporaries (the chunk-by-training
+    kernel matrices) by the chunk size. The results themselves are kept for
+    every point, as float32: (dims + 1) * 4 bytes per point, e.g. 1.8 MB
+    for 65536 points and 6 sliders.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+
+    def _predict(chunk):
+        _mean, std = model.predict(chunk, return_std=True)
+        return chunk.astype(np.float32), std.astype(np.float32)
+
+    points, stds, pending = [], [], []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="uncertainty-map") as pool:
+        for chunk in chunks:
+            pending.append(pool.submit(_predict, chunk))
+            if len(pending) >= max_in_flight:
+                p, s = pending.pop(0).result()
+                points.append(p)
+                stds.append(s)
+        for future in pending:
+            p, s = future.result()
+            points.append(p)
+            stds.append(s)
+    return np.concatenate(points), np.concatenate(stds)
+
+
+# ---------------------------
+# Summaries
+# ---------------------------
+def cell_index(points, levels):
+    """Index of the levels^d cell every point falls into.
+
+    Cell boundaries belong to the lower cell, like the "> 0.5" binning of
+    plot_uncertainty_and_occupancy() at 2 levels.
+    """
+    bins = np.clip(np.ceil(np.asarray(points) * levels).astype(np.int64) - 1, 0, levels - 1)
+    return np.ravel_multi_index(bins.T, (levels,) * bins.shape[1])
+
+
+def coverage(X_train, levels):
+    """Occupied cells of a levels^d partition: (occupied, total, percent)."""
+    total = levels ** X_train.shape[1]
+    occupied = int(np.unique(cell_index(X_train, levels)).size) if len(X_train) else 0
+    return occupied, total, 100.0 * occupied / total
+
+
+def cell_std(points, std, levels):
+    """Mean predictive std per cell of a levels^d partition (NaN for empty cells)."""
+    cells = cell_index(points, levels)
+    total = levels ** points.shape[1]
+    sums = np.bincount(cells, weights=std, minlength=total)
+    counts = np.bincount(cells, minlength=total)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def summarize_uncertainty(points, std, X_train, quantiles=DEFAULT_QUANTILES, levels=(2, 3, 4), std_threshold=None):
+    """Quantiles of the std over the map, and coverage / cell std at each granularity.
+
+    std_threshold (optional) adds the fraction of the space whose std is below it.
+    """
+    summary = {
+        "n_points": int(std.size),
+        "std_mean": float(np.mean(std)),
+        "std_quantiles": {f"{q:g}": float(v) for q, v in zip(quantiles, np.quantile(std, quantiles))},
+        "levels": {},
+    }
+    if std_threshold is not None:
+        summary["fraction_below_threshold"] = float(np.mean(std < std_threshold))
+        summary["std_threshold"] = float(std_threshold)
+    for level in levels:
+        occupied, total, pct = coverage(X_train, level)
+        per_cell = cell_std(points, std, level)
+        summary["levels"][str(level)] = {
+            "cells": total,
+            "occupied": occupied,
+            "coverage_pct": pct,
+            "max_cell_std": float(np.nanmax(per_cell)),
+            "median_cell_std": float(np.nanmedian(per_cell)),
+        }
+    return summary
+
+
+def uncertainty_map(model, X_train, method="sobol", n_points=65536, grid_levels=8, chunk_size=8192,
+                    workers=None, seed=0, **summary_options):
+    """Predict the std on a high-resolution map and summarize it.
+
+    method "sobol" uses n_points Sobol points, "grid" the cell centers of a
+    grid_levels^d grid (8 levels, 6 sliders: 262144 points).
+    Returns (points, std, summary).
+    """
+    dims = X_train.shape[1]
+    if method == "grid":
+        chunks = grid_chunks(grid_levels, dims, chunk_size)
+    else:
+        chunks = sobol_chunks(n_points, dims, chunk_size, seed=seed)
+    points, std = predict_std_chunked(model, chunks, workers=workers)
+    summary = summarize_uncertainty(points, std, X_train, **summary_options)
+    summary["method"] = method
+    return points, std, summary
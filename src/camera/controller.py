@@ -1,5 +1,5 @@
 from direct.task import Task
-from panda3d.core import Vec3
+from panda3d.core import ClockObject, Vec3
 import math
 
 
@@ -28,6 +28,22 @@ class OrbitCamera:
         self._pitch_sensitivity = 1.2
         self._zoom_step = 1.1          # scroll multiplier
 
+        # Smoothing: zoom eases toward _goal_distance, released drags keep
+        # spinning with _yaw_velocity/_pitch_velocity (radians per second)
+        self._goal_distance = self._distance
+        self._yaw_velocity = 0.0
+        self._pitch_velocity = 0.0
+        self._inertia = True
+        self._inertia_damping = 6.0    # 1/s, higher stops sooner
+        self._zoom_smoothing = 12.0    # 1/s, higher reaches the goal sooner
+        self._max_update_rate = 120.0  # camera updates per second at most
+        self._time_since_update = 0.0
+
+        # The motion task only runs while dragging or easing
+        self._task_mgr = None
+        self._task_name = "orbit-mouse-task"
+        self._task_running = False
+
         # place camera initially
         self._update_camera()
 
@@ -35,8 +51,32 @@ class OrbitCamera:
         self._register_events()
 
     def setup_task(self, task_mgr):
-        """Setup the per-frame task to read mouse while dragging."""
-        task_mgr.add(self._mouse_task, "orbit-mouse-task", sort=10)
+        """Remember the task manager; the motion task is added on demand."""
+        self._task_mgr = task_mgr
+
+    def _ensure_task(self):
+        """Start the motion task if it is not running already."""
+        if self._task_running:
+            return
+        if self._task_mgr is None:
+            # No task manager yet: jump straight to the goal
+            self._distance = self._goal_distance
+            self._update_camera()
+            return
+        self._task_running = True
+        self._time_since_update = 0.0
+        self._task_mgr.add(self._mouse_task, self._task_name, sort=10)
+
+    def _stop_task(self):
+        if self._task_running and self._task_mgr is not None:
+            self._task_mgr.remove(self._task_name)
+        self._task_running = False
+
+    def _stop_motion(self):
+        """Cancel easing and inertia."""
+        self._goal_distance = self._distance
+        self._yaw_velocity = 0.0
+        self._pitch_velocity = 0.0
 
     def _register_events(self):
         """Bind mouse events for orbit controls."""
@@ -60,20 +100,35 @@ class OrbitCamera:
             m = self.mouse_watcher.getMouse()  # (-1..1, -1..1)
             self._last_mouse = (m.getX(), m.getY())
             self._dragging = True
+            # Grabbing the model stops any leftover spin
+            self._yaw_velocity = 0.0
+            self._pitch_velocity = 0.0
+            self._ensure_task()
 
     def _end_drag(self):
         self._dragging = False
         self._last_mouse = None
+        if not self._inertia:
+            self._yaw_velocity = 0.0
+            self._pitch_velocity = 0.0
+        # The task stops itself once inertia and zoom have settled
 
     def _zoom_in(self):
-        self._distance = max(self._min_dist, self._distance / self._zoom_step)
-        self._update_camera()
+        self._goal_distance = max(self._min_dist, self._goal_distance / self._zoom_step)
+        self._ensure_task()
 
     def _zoom_out(self):
-        self._distance = min(self._max_dist, self._distance * self._zoom_step)
-        self._update_camera()
+        self._goal_distance = min(self._max_dist, self._goal_distance * self._zoom_step)
+        self._ensure_task()
 
     def _mouse_task(self, task: Task):
+        # Bound the update rate; skipped time is applied on the next update
+        self._time_since_update += ClockObject.getGlobalClock().getDt()
+        if self._time_since_update < 1.0 / self._max_update_rate:
+            return Task.cont
+        dt = min(self._time_since_update, 0.1)
+        self._time_since_update = 0.0
+
         if self._dragging and self.mouse_watcher.hasMouse():
             m = self.mouse_watcher.getMouse()
             x, y = m.getX(), m.getY()
@@ -81,12 +136,47 @@ class OrbitCamera:
                 dx = x - self._last_mouse[0]
                 dy = y - self._last_mouse[1]
                 # convert to radians; screen units are ~[-1,1]
-                self._yaw   -= math.radians(dx * 180 * self._yaw_sensitivity)
-                self._pitch -= math.radians(dy * 180 * self._pitch_sensitivity)
-                # clamp pitch to avoid flipping
-                self._pitch = max(self._min_pitch, min(self._max_pitch, self._pitch))
-                self._update_camera()
+                d_yaw = -math.radians(dx * 180 * self._yaw_sensitivity)
+                d_pitch = -math.radians(dy * 180 * self._pitch_sensitivity)
+                self._yaw += d_yaw
+                self._pitch += d_pitch
+                # Smoothed drag velocity, carried on as inertia after release
+                blend = min(1.0, dt * 20.0)
+                self._yaw_velocity += (d_yaw / dt - self._yaw_velocity) * blend
+                self._pitch_velocity += (d_pitch / dt - self._pitch_velocity) * blend
             self._last_mouse = (x, y)
+        elif not self._dragging:
+            # Inertia: keep spinning with exponentially decaying velocity
+            self._yaw += self._yaw_velocity * dt
+            self._pitch += self._pitch_velocity * dt
+            decay = math.exp(-self._inertia_damping * dt)
+            self._yaw_velocity *= decay
+            self._pitch_velocity *= decay
+            if abs(self._yaw_velocity) < 1e-3 and abs(self._pitch_velocity) < 1e-3:
+                self._yaw_velocity = 0.0
+                self._pitch_velocity = 0.0
+
+        # clamp pitch to avoid flipping
+        self._pitch = max(self._min_pitch, min(self._max_pitch, self._pitch))
+        if self._pitch in (self._min_pitch, self._max_pitch):
+            self._pitch_velocity = 0.0
+
+        # Ease zoom toward the goal distance
+        self._distance += (self._goal_distance - self._distance) * (1.0 - math.exp(-self._zoom_smoothing * dt))
+        if abs(self._goal_distance - self._distance) < 1e-3:
+            self._distance = self._goal_distance
+
+        self._update_camera()
+
+        settled = (
+            not self._dragging
+            and self._yaw_velocity == 0.0
+            and self._pitch_velocity == 0.0
+            and self._distance == self._goal_distance
+        )
+        if settled:
+            self._task_running = False
+            return Task.done
         return Task.cont
 
     def _update_camera(self):
@@ -104,6 +194,8 @@ class OrbitCamera:
         """Disable mouse controls for the camera."""
         self._dragging = False
         self._last_mouse = None
+        self._stop_motion()
+        self._stop_task()
         self._unregister_events()
 
     def enable_controls(self):
@@ -111,11 +203,14 @@ class OrbitCamera:
         # Controls are enabled by default, just ensure dragging is reset
         self._dragging = False
         self._last_mouse = None
+        self._stop_motion()
+        self._stop_task()
         self._register_events()
 
     def set_target(self, target_pos):
         """Set a new target position for the camera to orbit around."""
         self._target = target_pos
+        self._stop_motion()
         self._update_camera()
 
     def get_target(self):
@@ -127,5 +222,7 @@ class OrbitCamera:
         self._distance = config["distance"]
         self._yaw = config["yaw"]
         self._pitch = config["pitch"]
+        # Jump straight to the configured view
+        self._stop_motion()
         # Target is now set separately, not in config
         self._update_camera()
\ No newline at end of file
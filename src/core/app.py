@@ -5,11 +5,10 @@ from direct.showbase.ShowBase import ShowBase
 from panda3d.core import GeomNode
 
 # Importing geometry from the new organized structure
+# (only what the builder view needs at startup; Table and Explore modules are
+# imported where they are used)
 from geometry.vase.geometry import vaseGeometry
-from geometry.table.geometry import tableGeometry
-from ExploreTab.Camera.exploreVaseCamera import vaseExploreCameraRound1Config
 from geometry.vase.config import vaseSliderConfig, vaseDefaults
-from geometry.table.config import tableSliderConfig, tableDefaults
 from rendering.lighting import setup_lights
 
 # Script that builds sliders and handles cha   nges
@@ -54,6 +53,12 @@ class MainApp(ShowBase):
         # Setup the UI
         self._setup_ui()
 
+        # Only redraw when something changed (see rendering/on_demand.py)
+        self._setup_on_demand_rendering()
+
+        # Use idle frames after startup to prepare meshes and the Explore stack
+        self._setup_warmup()
+
     ## Functions that need to be called for the initial setup
 
     # Rebuild the cylinder with current parameters
@@ -66,6 +71,7 @@ class MainApp(ShowBase):
         # Build new geometry with current parameters based on selected object type
         selected_type = getattr(self, 'current_object_type', 'Vace')
         if selected_type == 'Table':
+            from geometry.table.geometry import tableGeometry
             result = tableGeometry(
                 segment_count=int(self.current_params["Segment Count"]),
                 object_width=self.current_params["Object Width"],
@@ -81,9 +87,14 @@ class MainApp(ShowBase):
                 twist_angle=self.current_params["Twist Angle"],
                 twist_groove_depth=self.current_params["Twist Groove Depth"],
                 vertical_wave_freq=self.current_params["Vertical Wave Frequency"],
-                vertical_wave_depth=self.current_params["Vertical Wave Depth"]
+                vertical_wave_depth=self.current_params["Vertical Wave Depth"],
+                return_overhang_map=True
             )
-        if isinstance(result, tuple) and len(result) == 4:
+        # Per-face overhang angles (degrees, negative = overhang) when the builder provides them
+        overhang_map = None
+        if isinstance(result, tuple) and len(result) == 5:
+            object_type, geom, material, has_overhang, overhang_map = result
+        elif isinstance(result, tuple) and len(result) == 4:
             object_type, geom, material, has_overhang = result
         elif isinstance(result, tuple) and len(result) == 3:
             object_type, geom, material = result
@@ -113,13 +124,16 @@ class MainApp(ShowBase):
 
         # Store current object type for favorites saving
         self.current_object_type = object_type
+        # Keep the overhang map around so the UI can query severity
+        self.current_overhang_map = overhang_map
+        self.mark_scene_dirty()
         
         # Display overhang status (only print when overhang occurs)
         if has_overhang:
             print("WARNING: Overhang detected! Some areas exceed the maximum overhang angle.")
             # Show persistent overhang warning in UI
             if hasattr(self, 'parametric_controls') and hasattr(self.parametric_controls, 'show_overhang_warning'):
-                self.parametric_controls.show_overhang_warning()
+                self.parametric_controls.show_overhang_warning(severity=self.get_overhang_severity())
         else:
             # Hide overhang warning in UI without printing
             if hasattr(self, 'parametric_controls') and hasattr(self.parametric_controls, 'hide_overhang_warning'):
@@ -127,6 +141,37 @@ class MainApp(ShowBase):
 
         # (Removed) Do not update metrics here; update only on slider release
 
+    def get_overhang_severity(self):
+        """Worst overhang angle (degrees) of the current object, or None if unknown."""
+        overhang_map = getattr(self, 'current_overhang_map', None)
+        if overhang_map is None or overhang_map.size == 0:
+            return None
+        return float(-overhang_map.min())
+
+    def _setup_on_demand_rendering(self):
+        """Install the dirty-flag renderer unless disabled with on-demand-rendering #f."""
+        from rendering.on_demand import OnDemandRenderer, on_demand_rendering
+        self.on_demand_renderer = OnDemandRenderer(self)
+        if on_demand_rendering.getValue():
+            self.on_demand_renderer.install()
+
+    def _setup_warmup(self):
+        """Queue the startup warm-up jobs (see core/warmup.py)."""
+        from core.warmup import WarmupScheduler, prebuild_default_meshes, precompute_vase_topology, start_explore_preload
+        self.warmup = WarmupScheduler(self)
+        self.warmup.add_job("default meshes", prebuild_default_meshes())
+        self.warmup.add_job("vase topology", precompute_vase_topology())
+        self.warmup.add_job("explore imports", start_explore_preload)
+        # Warm-up work alone does not need a redraw
+        if getattr(self, 'on_demand_renderer', None) is not None:
+            self.on_demand_renderer.idle_task_names.add(WarmupScheduler.task_name)
+        self.warmup.start()
+
+    def mark_scene_dirty(self):
+        """Request a redraw after the scene changed outside of user input."""
+        if getattr(self, 'on_demand_renderer', None) is not None:
+            self.on_demand_renderer.mark_dirty()
+
     def _setup_camera_orbit(self):
         """Setup the orbit camera controller."""
         self.camera_controller = OrbitCamera(self, self.cam, self.mouseWatcherNode)
@@ -258,42 +303,14 @@ class MainApp(ShowBase):
         self._rebuild_cylinder()
 
     def _create_object_with_params(self, params, object_type="Vace", position=(0, 0, 0), scale=1.0):
-        """Create a single object with given parameters at specified position."""
-        # Build geometry with parameters based on object type
-        if object_type == 'Table':
-            from geometry.table.geometry import tableGeometry
-            result = tableGeometry(
-                segment_count=int(params["Segment Count"]),
-                object_width=params["Object Width"],
-                twist_angle=params["Twist Angle"],
-                twist_groove_depth=params["Twist Groove Depth"],
-                vertical_wave_freq=params["Vertical Wave Frequency"],
-                vertical_wave_depth=params["Vertical Wave Depth"]
-            )
-        else:
-            from geometry.vase.geometry import vaseGeometry
-            result = vaseGeometry(
-                segment_count=int(params["Segment Count"]),
-                object_width=params["Object Width"],
-                twist_angle=params["Twist Angle"],
-                twist_groove_depth=params["Twist Groove Depth"],
-                vertical_wave_freq=params["Vertical Wave Frequency"],
-                vertical_wave_depth=params["Vertical Wave Depth"]
-            )
-        
-        if isinstance(result, tuple) and len(result) == 4:
-            actual_object_type, geom, material, has_overhang = result
-        elif isinstance(result, tuple) and len(result) == 3:
-            actual_object_type, geom, material = result
-            has_overhang = False
-        elif isinstance(result, tuple) and len(result) == 2:
-            actual_object_type, geom = result
-            material = None
-            has_overhang = False
-        else:
-            actual_object_type, geom = object_type, result
-            material = None
-            has_overhang = False
+        """Create a single object with given parameters at specified position.
+
+        Meshes come from the shared geom registry, so designs with the same
+        (quantized) parameters reuse one Geom instead of being rebuilt.
+        """
+        from geometry.registry import get_geom_registry
+        node, entry = get_geom_registry().make_node(params, object_type)
+        has_overhang = entry.has_overhang
 
         # Handle overhang warning display for this rebuild
         if has_overhang:
@@ -303,19 +320,11 @@ class MainApp(ShowBase):
             if hasattr(self, 'parametric_controls') and hasattr(self.parametric_controls, 'hide_overhang_warning'):
                 self.parametric_controls.hide_overhang_warning()
 
-        # Create a new geometry node
-        node = GeomNode(f"favorite_object_{actual_object_type}")
-        node.addGeom(geom)
-        
-        # Apply material if provided
-        if material:
-            from panda3d.core import MaterialAttrib
-            node.set_attrib(MaterialAttrib.make(material))
-
         # Attach the node to the render at specified position
         object_np = self.render.attachNewNode(node)
         object_np.setPos(position)
         object_np.setScale(scale)
+        self.mark_scene_dirty()
         
         return object_np
 
@@ -389,6 +398,9 @@ class MainApp(ShowBase):
             obj_np = self._create_object_with_params(params, object_type, position=(x, 0, z), scale=1.0)
             self.favorite_objects.append(obj_np)
 
+        # The Round 1 grid never moves, so batch it into a few Geoms
+        self.favorite_objects = self._make_design_grid(self.favorite_objects, static=True)
+
         # Show round instruction label at top
         try:
             from direct.gui.OnscreenText import OnscreenText
@@ -612,12 +624,8 @@ class MainApp(ShowBase):
                 pass
         
         
-        # Stop RoundFinal rotation animation if running
-        if hasattr(self, 'taskMgr'):
-            try:
-                self.taskMgr.remove("roundfinal-rotation-task")
-            except Exception:
-                pass
+        # Stop RoundFinal rotation animation if running and drop the grid root
+        self._remove_design_grid()
         
         # Hide Next button if present
         if hasattr(self, 'next_button') and self.next_button is not None:
@@ -658,23 +666,18 @@ class MainApp(ShowBase):
     def _on_design_rated(self, design_index, rating):
         """Callback when a design is rated. Updates the Round1Designs.txt file."""
         try:
-            import json
             import os
             
             # Path to the designs file
             designs_path = os.path.join("src", "ExploreTab", "Bayesian", "Designs.txt")
             
-            # Read current designs
-            with open(designs_path, 'r', encoding='utf-8') as f:
-                designs = json.load(f)
+            # Current designs (shared store: one log append per rating)
+            from storage.design_store import get_design_store
+            store = get_design_store(designs_path)
             
             # Update the rating for the specific design
-            if 0 <= design_index < len(designs):
-                designs[design_index]["Rating"] = rating
-                
-                # Write back to file
-                with open(designs_path, 'w', encoding='utf-8') as f:
-                    json.dump(designs, f, indent=2)
+            if 0 <= design_index < len(store):
+                store.update(design_index, Rating=rating)
                 
                 
                 # Track that this design has been rated
@@ -723,7 +726,6 @@ class MainApp(ShowBase):
     def _display_roundreassure_designs(self):
         """Display RoundReassure designs (last 3 designs from Designs.txt)."""
         try:
-            import json
             import os
             
             # Read all designs from Designs.txt
@@ -731,8 +733,8 @@ class MainApp(ShowBase):
             if not os.path.exists(designs_path):
                 return
             
-            with open(designs_path, 'r', encoding='utf-8') as f:
-                all_designs = json.load(f)
+            from storage.design_store import get_design_store
+            all_designs = get_design_store(designs_path).items()
             
             # Get the last 3 designs (the new Round Reassure designs)
             designs = all_designs[-3:] if len(all_designs) >= 3 else all_designs
@@ -760,6 +762,7 @@ class MainApp(ShowBase):
                 object_type = design.get("object_type", "Vase")
                 obj_np = self._create_object_with_params(params, object_type, position=(x, 0, z), scale=1.0)
                 self.favorite_objects.append(obj_np)
+            self.favorite_objects = self._make_design_grid(self.favorite_objects, static=True)
             
             # Add Round Reassure header text with coverage percentage
             coverage = getattr(self, 'roundreassure_coverage', None)
@@ -842,7 +845,6 @@ class MainApp(ShowBase):
     def _display_roundfill_designs(self):
         """Display RoundFill designs (last 6 designs from Designs.txt) in 3x2 grid layout."""
         try:
-            import json
             import os
             
             # Read all designs from Designs.txt
@@ -850,8 +852,8 @@ class MainApp(ShowBase):
             if not os.path.exists(designs_path):
                 return
             
-            with open(designs_path, 'r', encoding='utf-8') as f:
-                all_designs = json.load(f)
+            from storage.design_store import get_design_store
+            all_designs = get_design_store(designs_path).items()
             
             # Get the last 6 designs (the new Round Fill designs)
             designs = all_designs[-6:] if len(all_designs) >= 6 else all_designs
@@ -892,6 +894,7 @@ class MainApp(ShowBase):
                 object_type = design.get("object_type", "Vase")
                 obj_np = self._create_object_with_params(params, object_type, position=(x, 0, z), scale=object_scale)
                 self.favorite_objects.append(obj_np)
+            self.favorite_objects = self._make_design_grid(self.favorite_objects, static=True)
             
             # Create star rating components for RoundFill designs
             try:
@@ -947,7 +950,6 @@ class MainApp(ShowBase):
     def _display_roundfinal_designs(self):
         """Display the RoundFinal designs (final recommendations)."""
         try:
-            import json
             import os
             
             # Read the last designs from Designs.txt
@@ -957,8 +959,8 @@ class MainApp(ShowBase):
                 print(f"Designs file not found: {designs_path}")
                 return
             
-            with open(designs_path, 'r', encoding='utf-8') as f:
-                all_designs = json.load(f)
+            from storage.design_store import get_design_store
+            all_designs = get_design_store(designs_path).items()
             
             # Get the last 6 designs (final recommendations)
             designs = all_designs[-6:] if len(all_designs) >= 6 else all_designs
@@ -1001,6 +1003,7 @@ class MainApp(ShowBase):
                 self.favorite_objects.append(obj_np)
                 
                 print(f"Displayed RoundFinal design {i+1}: {design.get('parameters', {})}")
+            self.favorite_objects = self._make_design_grid(self.favorite_objects, static=False)
             
             # Start rotation animation for all RoundFinal objects
             self._start_roundfinal_rotation_animation()
@@ -1041,15 +1044,14 @@ class MainApp(ShowBase):
     def _on_roundfill_rated(self, design_index, rating):
         """Callback when a RoundFill design is rated. Updates the Designs.txt file."""
         try:
-            import json
             import os
             
             # Path to the Designs.txt file
             designs_path = os.path.join("src", "ExploreTab", "Bayesian", "Designs.txt")
             
             # Read all designs
-            with open(designs_path, 'r', encoding='utf-8') as f:
-                all_designs = json.load(f)
+            from storage.design_store import get_design_store
+            all_designs = get_design_store(designs_path).items()
             
             # Calculate the actual index in the full designs list
             # Round Fill designs are the last 6, so we need to map the display index to the actual index
@@ -1057,11 +1059,7 @@ class MainApp(ShowBase):
                 # Get the last 6 designs and update the rating
                 actual_index = len(all_designs) - 6 + design_index
                 if 0 <= actual_index < len(all_designs):
-                    all_designs[actual_index]["Rating"] = rating
-                    
-                    # Write back to file
-                    with open(designs_path, 'w', encoding='utf-8') as f:
-                        json.dump(all_designs, f, indent=2)
+                    get_design_store(designs_path).update(actual_index, Rating=rating)
                 
                 # Track that this design has been rated
                 if not hasattr(self, 'rated_roundfill_designs'):
@@ -1111,15 +1109,14 @@ class MainApp(ShowBase):
     def _on_roundreassure_rated(self, design_index, rating):
         """Callback when a RoundReassure design is rated. Updates the Designs.txt file."""
         try:
-            import json
             import os
             
             # Path to the Designs.txt file
             designs_path = os.path.join("src", "ExploreTab", "Bayesian", "Designs.txt")
             
             # Read all designs
-            with open(designs_path, 'r', encoding='utf-8') as f:
-                all_designs = json.load(f)
+            from storage.design_store import get_design_store
+            all_designs = get_design_store(designs_path).items()
             
             # Calculate the actual index in the full designs list
             # Round Reassure designs are the last 3, so we need to map the display index to the actual index
@@ -1127,11 +1124,7 @@ class MainApp(ShowBase):
                 # Get the last 3 designs and update the rating
                 actual_index = len(all_designs) - 3 + design_index
                 if 0 <= actual_index < len(all_designs):
-                    all_designs[actual_index]["Rating"] = rating
-                    
-                    # Write back to file
-                    with open(designs_path, 'w', encoding='utf-8') as f:
-                        json.dump(all_designs, f, indent=2)
+                    get_design_store(designs_path).update(actual_index, Rating=rating)
                 
                 
                 # Track that this design has been rated
@@ -1177,18 +1170,9 @@ class MainApp(ShowBase):
                     }
                     training_designs.append(training_design)
             
-            # Read existing AllDesigns or create new
-            all_designs = []
-            if os.path.exists(alldesigns_path):
-                with open(alldesigns_path, 'r', encoding='utf-8') as f:
-                    all_designs = json.load(f)
-            
-            # Append new designs
-            all_designs.extend(training_designs)
-            
-            # Write back to AllDesigns.txt
-            with open(alldesigns_path, 'w', encoding='utf-8') as f:
-                json.dump(all_designs, f, indent=2)
+            # Append new designs to AllDesigns (compacted before training)
+            from storage.design_store import get_design_store
+            get_design_store(alldesigns_path).extend(training_designs)
             
             
         except Exception as e:
@@ -1271,7 +1255,9 @@ class MainApp(ShowBase):
             sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'ExploreTab', 'Bayesian'))
             from src.ExploreTab.Bayesian.RoundFinal import RoundFinal
             
-            # Call RoundFinal
+            # RoundFinal reads the plain JSON list
+            from storage.design_store import get_design_store
+            get_design_store(designs_path).compact()
             roundfinal_result = RoundFinal(designs_path, object_type)
             
             # Clear the screen of current objects
@@ -1301,41 +1287,52 @@ class MainApp(ShowBase):
         # Get the current favorite object
         self.rotating_object = self.favorite_objects[self.current_favorite_index]
         
-        # Start rotation task
-        self.taskMgr.add(self._rotation_task, "favorite-rotation-task")
+        # Start rotation interval (1 degree per frame at 60 fps)
+        from rendering.grid_view import spin_interval
+        self.rotation_interval = spin_interval(self.rotating_object, 1.0, name="favorite-rotation")
 
     def _stop_rotation_animation(self):
         """Stop the rotation animation."""
-        self.taskMgr.remove("favorite-rotation-task")
+        if getattr(self, 'rotation_interval', None) is not None:
+            self.rotation_interval.pause()
+        self.rotation_interval = None
         self.rotating_object = None
 
-    def _rotation_task(self, task):
-        """Task that rotates the selected favorite object slowly."""
-        if hasattr(self, 'rotating_object') and self.rotating_object:
-            # Rotate 1 degree per frame (adjust speed as needed)
-            self.rotating_object.setH(self.rotating_object.getH() + 1)
-        return task.cont
+    def _make_design_grid(self, objects, static=True):
+        """Group grid objects under one shared root node.
+
+        Static grids are flattened into a few batched Geoms, so the returned
+        list is just the grid root; otherwise the objects are returned as is.
+        """
+        from rendering.grid_view import GridView
+        self._remove_design_grid()
+        self.design_grid = GridView(self.render)
+        for obj_np in objects:
+            self.design_grid.add(obj_np)
+        if static:
+            self.design_grid.flatten()
+            return [self.design_grid.root]
+        return objects
+
+    def _remove_design_grid(self):
+        """Stop and remove the current design grid, if any."""
+        if getattr(self, 'design_grid', None) is not None:
+            self.design_grid.remove()
+        self.design_grid = None
 
     def _start_roundfinal_rotation_animation(self):
         """Start rotation animation for all RoundFinal objects."""
         if not hasattr(self, 'favorite_objects') or not self.favorite_objects:
             return
         
-        # Start rotation task for RoundFinal objects
-        self.taskMgr.add(self._roundfinal_rotation_task, "roundfinal-rotation-task")
+        # Rotate all objects 0.5 degrees per frame at 60 fps (very slow)
+        if getattr(self, 'design_grid', None) is not None:
+            self.design_grid.spin(0.5)
 
     def _stop_roundfinal_rotation_animation(self):
         """Stop the RoundFinal rotation animation."""
-        self.taskMgr.remove("roundfinal-rotation-task")
-
-    def _roundfinal_rotation_task(self, task):
-        """Task that rotates all RoundFinal objects slowly."""
-        if hasattr(self, 'favorite_objects') and self.favorite_objects:
-            # Rotate all objects 0.5 degrees per frame (very slow)
-            for obj in self.favorite_objects:
-                if obj:
-                    obj.setH(obj.getH() + 0.5)
-        return task.cont
+        if getattr(self, 'design_grid', None) is not None:
+            self.design_grid.stop_spin()
 
     def _highlight_favorite(self, favorite_index):
         """Focus camera on a different favorite object."""
@@ -1358,38 +1355,61 @@ class MainApp(ShowBase):
             with open(designs_path, "r", encoding="utf-8") as f:
                 self.tournament_designs = json.load(f)
             # Build initial matches in-memory (no file)
-            # Read config for shuffle/seed
+            # Read config for mode/shuffle/seed
             try:
                 conf_path = os.path.join("src", "ExploreTab", "Configuration.JSON")
                 with open(conf_path, "r", encoding="utf-8") as cf:
                     conf = json.load(cf)
                 tconf = conf.get("Batch 1 Tournament", {})
+                mode = tconf.get("mode", "bracket")
                 shuffle = bool(tconf.get("shuffle", True))
                 seed = tconf.get("seed", None)
             except Exception:
-                shuffle, seed = True, None
-            idx = list(range(len(self.tournament_designs)))
-            rnd = random.Random(seed)
-            if shuffle:
-                rnd.shuffle(idx)
-            # Handle bye (odd count): carry last forward
-            self.tournament_next_indices = []
-            if len(idx) % 2 == 1:
-                self.tournament_next_indices.append(idx.pop())
-            # Pair remaining indices
-            matches = []
-            for i in range(0, len(idx), 2):
-                a = idx[i]
-                b = idx[i + 1]
-                matches.append({
-                    "match_id": len(matches) + 1,
-                    "a_index": a,
-                    "b_index": b
-                })
-            self.tournament_matches = matches
+                tconf, mode, shuffle, seed = {}, "bracket", True, None
+            self.tournament_scheduler = None
+            if mode == "active":
+                # Matches are chosen one at a time by expected information gain
+                try:
+                    from ExploreTab.ActivePairing import ActivePairingScheduler
+                    self.tournament_scheduler = ActivePairingScheduler.from_config(len(self.tournament_designs), tconf)
+                    first = self.tournament_scheduler.next_match()
+                    self.tournament_matches = [first] if first is not None else []
+                    self.tournament_next_indices = []
+                except Exception as e:
+                    print(f"[Tournament] Active pairing unavailable, using bracket: {e}")
+                    self.tournament_scheduler = None
+            if self.tournament_scheduler is None:
+                idx = list(range(len(self.tournament_designs)))
+                rnd = random.Random(seed)
+                if shuffle:
+                    rnd.shuffle(idx)
+                # Handle bye (odd count): carry last forward
+                self.tournament_next_indices = []
+                if len(idx) % 2 == 1:
+                    self.tournament_next_indices.append(idx.pop())
+                # Pair remaining indices
+                matches = []
+                for i in range(0, len(idx), 2):
+                    a = idx[i]
+                    b = idx[i + 1]
+                    matches.append({
+                        "match_id": len(matches) + 1,
+                        "a_index": a,
+                        "b_index": b
+                    })
+                self.tournament_matches = matches
             # Init round and index
             self.tournament_round = 1
             self.tournament_idx = 0
+            # Build the round's meshes in the background, in match order
+            try:
+                self._get_geom_prefetcher().prefetch(
+                    self.tournament_designs[i]
+                    for m in self.tournament_matches
+                    for i in (m["a_index"], m["b_index"])
+                )
+            except Exception as e:
+                print(f"[Tournament] Prefetch error: {e}")
             # Apply vase explore camera config and lock controls
             try:
                 from ExploreTab.Camera.exploreVaseCamera import vaseExploreCameraRound1Config
@@ -1408,9 +1428,9 @@ class MainApp(ShowBase):
     def _clear_tournament_ui(self):
         """Remove tournament objects, labels, and buttons from the scene."""
         try:
-            # Stop rotation task
+            # Stop rotation intervals
             try:
-                self.taskMgr.remove("tournament-rotation-task")
+                self._stop_tournament_rotation()
             except Exception:
                 pass
             # Remove objects
@@ -1472,6 +1492,10 @@ class MainApp(ShowBase):
             layout = vaseTournamentLayout()
             # Store spin speed for rotation task
             self.tournament_spin_speed = layout.get("spin_speed", 0.8)
+            # Meshes prefetched while the previous match was shown
+            prefetcher = self._get_geom_prefetcher()
+            prefetcher.ensure(a["parameters"], a.get("object_type", "Vase"))
+            prefetcher.ensure(b["parameters"], b.get("object_type", "Vase"))
             a_np = self._create_object_with_params(
                 a["parameters"], a.get("object_type", "Vase"),
                 position=layout["left"], scale=layout.get("scale", 1.0)
@@ -1538,14 +1562,18 @@ class MainApp(ShowBase):
                 self.tournament_buttons[1].bind(DGG.EXIT, lambda _evt: self._tint_object(self.tournament_objects[1], False))
             except Exception:
                 pass
+
+            # Prefetch whichever match follows either pick
+            self._prefetch_next_tournament_match(a_idx, b_idx)
         except Exception as e:
             print(f"[Tournament] Display error: {e}")
 
     def _on_tournament_pick(self, match, winner_index):
         """Record pick to results file and advance to next match."""
         try:
-            import os, json
+            import os
             a_index, b_index = match["a_index"], match["b_index"]
+            loser_index = b_index if winner_index == a_index else a_index
             winner_name = self.tournament_designs[winner_index].get("Name", "")
             record = {
                 "match_id": match["match_id"],
@@ -1555,77 +1583,50 @@ class MainApp(ShowBase):
                 "winner_name": winner_name,
                 "round": getattr(self, "tournament_round", 1)
             }
+            # Appended to the results log; the JSON file is compacted when the tournament ends
+            from storage.design_store import get_design_store
             out_path = os.path.join("src", "ExploreTab", "tmp", "Batch1TournamentResults.txt")
-            results = []
-            if os.path.exists(out_path):
-                try:
-                    with open(out_path, "r", encoding="utf-8") as f:
-                        results = json.load(f)
-                except Exception:
-                    results = []
-            results.append(record)
-            with open(out_path, "w", encoding="utf-8") as f:
-                json.dump(results, f, indent=2)
+            get_design_store(out_path).append(record)
+            # One line per pick in the comparison log used for the latent ratings
+            try:
+                from ExploreTab.ComparisonLog import append_comparison, comparison_log_path
+                append_comparison(
+                    comparison_log_path(), winner_index, loser_index,
+                    match_id=record["match_id"], round=record["round"],
+                )
+            except Exception as e:
+                print(f"[Tournament] Comparison log error: {e}")
             # Accumulate winner for next round
             if not hasattr(self, "tournament_next_indices") or self.tournament_next_indices is None:
                 self.tournament_next_indices = []
             self.tournament_next_indices.append(winner_index)
             # Advance to next match in current round or build next round
             self.tournament_idx += 1
+            scheduler = getattr(self, "tournament_scheduler", None)
+            if scheduler is not None:
+                # Active pairing: refit the ratings and ask for the most informative match
+                scheduler.record(winner_index, loser_index)
+                next_match = scheduler.next_match()
+                if next_match is not None:
+                    self.tournament_matches.append(next_match)
+                    self._show_batch1_tournament_match()
+                    return
+                print(f"[Tournament] Finished after {len(scheduler.matches)} matches ({scheduler.stop_reason})")
+                # Finish below exactly like the last match of a bracket
+                self.tournament_next_indices = [winner_index]
             if self.tournament_idx >= len(self.tournament_matches):
                 # End of current round
                 winners = list(self.tournament_next_indices)
                 # If only one winner remains, tournament is finished
                 if len(winners) <= 1:
-                    # Generate final tournament plot (after all rounds complete)
-                    try:
-                        from ExploreTab.Extra.TournamentPlot import plot_tournament
-                        designs_path = os.path.join("src", "ExploreTab", "tmp", "designs.txt")
-                        results_path = os.path.join("src", "ExploreTab", "tmp", "Batch1TournamentResults.txt")
-                        # Also write simplified pairwise comparisons
-                        try:
-                            with open(results_path, "r", encoding="utf-8") as rf:
-                                _matches = json.load(rf)
-                            comparisons_list = []
-                            for m in _matches:
-                                a_i = m.get("a_index")
-                                b_i = m.get("b_index")
-                                w_i = m.get("winner_index")
-                                if w_i is None or a_i is None or b_i is None:
-                                    continue
-                                loser = b_i if w_i == a_i else a_i
-                                comparisons_list.append((int(w_i), int(loser)))
-                            ratings_path = os.path.join("src", "ExploreTab", "tmp", "designsRatings.txt")
-                            with open(ratings_path, "w", encoding="utf-8") as wf:
-                                wf.write("comparisons = [\n")
-                                for w_i, l_i in comparisons_list:
-                                    wf.write(f"    ({w_i},{l_i}),\n")
-                                wf.write("]\n")
-                        except Exception:
-                            pass
-                        images_dir = os.path.join("src", "ExploreTab", "Images")
-                        try:
-                            os.makedirs(images_dir, exist_ok=True)
-                        except Exception:
-                            pass
-                        output_png = os.path.join(images_dir, "TournamentResults.png")
-                        plot_tournament(designs_path, results_path, output_path=output_png)
-                        # Update designs.txt with latent ratings computed from pairwise results
-                        try:
-                            from ExploreTab.Extra.LatentMetric import update_designs_ratings
-                            update_designs_ratings(designs_path, ratings_path)
-                            # Train Bayesian model on updated designs
-                            try:
-                                from ExploreTab.BayesTrain import run_bayes_train
-                                print("[Explore] Training Bayesian model...")
-                                run_bayes_train(designs_path)
-                                print("[Explore] Training complete.")
-                            except Exception as e:
-                                print(f"[Explore] Training failed: {e}")
-                        except Exception:
-                            pass
-                    except Exception:
-                        pass
+                    self._get_geom_prefetcher().cancel()
+                    # The plot and the ratings read the results file as a whole
+                    get_design_store(out_path).compact()
+                    # Plot, update ratings and train in the background; the overlay
+                    # below keeps animating and Round 2 waits for this future
+                    self._post_tournament_future = self._get_background_jobs().submit(
+                        "post-tournament training", self._run_post_tournament_training
+                    )
 
                     # Show post-tournament instruction overlay (3s window with fade in/out)
                     try:
@@ -1794,11 +1795,18 @@ class MainApp(ShowBase):
                         pre_blank = 1.5   # seconds of blank screen before showing text
                         hold_after_fadein = 1.2  # seconds to hold after fade-in completes
 
+                        # Keep the text up until training has finished, then fade out
+                        def _post_wait_for_training(task):
+                            future = getattr(self, "_post_tournament_future", None)
+                            if future is not None and not future.done():
+                                return task.again
+                            return _post_start_fade_out(task)
+
                         def _post_begin_fade_in(task):
                             # Start fade-in now
                             base.taskMgr.add(_post_fade_in, "post-tournament-fade-in")
-                            # Schedule fade-out start after fade-in + hold
-                            base.taskMgr.doMethodLater(1.2 + hold_after_fadein, _post_start_fade_out, "post-tournament-hold")
+                            # Schedule fade-out start after fade-in + hold (or training, if longer)
+                            base.taskMgr.doMethodLater(1.2 + hold_after_fadein, _post_wait_for_training, "post-tournament-hold")
                             return task.done
 
                         # Start the fade-in after the pre-blank delay
@@ -1840,26 +1848,187 @@ class MainApp(ShowBase):
         except Exception as e:
             print(f"[Tournament] Record error: {e}")
 
+    def _run_post_tournament_training(self):
+        """Plot the bracket, update latent ratings and train the GP (worker thread, no Panda3D calls)."""
+        import os, json
+        # Generate final tournament plot (after all rounds complete)
+        try:
+            designs_path = os.path.join("src", "ExploreTab", "tmp", "designs.txt")
+            results_path = os.path.join("src", "ExploreTab", "tmp", "Batch1TournamentResults.txt")
+            # Pairwise comparisons were appended to the log on every pick; rebuild
+            # the log from the results file only if it is missing
+            from ExploreTab.ComparisonLog import comparison_log_path, write_comparisons
+            ratings_path = comparison_log_path()
+            try:
+                if not os.path.exists(ratings_path):
+                    with open(results_path, "r", encoding="utf-8") as rf:
+                        _matches = json.load(rf)
+                    comparisons_list = []
+                    for m in _matches:
+                        a_i = m.get("a_index")
+                        b_i = m.get("b_index")
+                        w_i = m.get("winner_index")
+                        if w_i is None or a_i is None or b_i is None:
+                            continue
+                        loser = b_i if w_i == a_i else a_i
+                        comparisons_list.append((int(w_i), int(loser)))
+                    write_comparisons(ratings_path, comparisons_list)
+            except Exception:
+                pass
+            images_dir = os.path.join("src", "ExploreTab", "Images")
+            try:
+                os.makedirs(images_dir, exist_ok=True)
+            except Exception:
+                pass
+            output_png = os.path.join(images_dir, "TournamentResults.png")
+            # Active pairing (None for a bracket)
+            scheduler = getattr(self, "tournament_scheduler", None)
+            # Update designs.txt with latent ratings computed from pairwise results;
+            # active pairing already fitted them pick by pick, so its engine is reused
+            try:
+                from ExploreTab.Extra.LatentMetric import update_designs_ratings
+                update_designs_ratings(designs_path, ratings_path, engine=scheduler.engine if scheduler else None)
+                ratings_updated = True
+            except Exception:
+                ratings_updated = False
+            # Rendered in the artifact process from the updated files (hashed
+            # after the update, so the key matches what is plotted); skipped if
+            # the bracket did not change. Active pairing has no rounds to draw.
+            try:
+                from ExploreTab.Artifacts import data_hash, submit_artifact
+                if scheduler is None:
+                    submit_artifact(
+                        "tournament_plot",
+                        "ExploreTab.Extra.TournamentPlot:plot_tournament",
+                        args=(os.path.abspath(designs_path), os.path.abspath(results_path)),
+                        kwargs={"output_path": os.path.abspath(output_png)},
+                        output_path=output_png,
+                        input_hash=data_hash(("file", designs_path), ("file", results_path)),
+                    )
+            except Exception as e:
+                print(f"[Explore] Tournament plot not scheduled: {e}")
+            if ratings_updated:
+                # Train Bayesian model on updated designs and propose the Round 2 designs
+                try:
+                    self._compact_explore_designs()
+                    from ExploreTab.BayesTrain import _bayesian_config, load_history, propose_designs, run_bayes_train
+                    from ExploreTab.ModelStore import load_trained_model
+                    bayes_conf = _bayesian_config()
+                    n_proposals = int(bayes_conf.get("n_proposals", 6))
+                    # Designs rated in earlier sessions (this one is recorded below)
+                    history = None
+                    if bayes_conf.get("train_on_history", True):
+                        try:
+                            from ExploreTab.BatchAcquisition import detect_object_type
+                            history = load_history(detect_object_type(designs_path))
+                        except Exception as e:
+                            print(f"[Explore] Design history not loaded: {e}")
+                    model = load_trained_model(designs_path, history=history)
+                    if model is not None:
+                        # Same ratings as the stored model: predict with it instead of retraining
+                        print("[Explore] Ratings unchanged, using the stored model.")
+                        proposals = propose_designs(model, designs_path, n_proposals)
+                    else:
+                        print("[Explore] Training Bayesian model...")
+                        summary = run_bayes_train(designs_path, n_proposals=n_proposals, history=history)
+                        proposals = summary.get("proposals", [])
+                        print("[Explore] Training complete.")
+                    self._append_proposals_to_designs(proposals)
+                except Exception as e:
+                    print(f"[Explore] Training failed: {e}")
+            # Keep the rated batch and its comparisons in the design database
+            try:
+                from storage.design_db import get_design_db
+                from ExploreTab.ComparisonLog import load_comparisons
+                with open(designs_path, "r", encoding="utf-8") as f:
+                    rated_designs = json.load(f)
+                db = get_design_db()
+                session_id = db.start_session(
+                    "Batch 1 Tournament", rated_designs[0].get("object_type") if rated_designs else None
+                )
+                ids = db.add_designs(rated_designs, session_id=session_id, source="batch1")
+                db.add_comparisons(
+                    [(ids[w], ids[l]) for w, l in load_comparisons(ratings_path) if 0 <= w < len(ids) and 0 <= l < len(ids)],
+                    session_id=session_id,
+                )
+            except Exception as e:
+                print(f"[Explore] Design database not updated: {e}")
+        except Exception:
+            pass
+
+    def _compact_explore_designs(self):
+        """Write out the rating logs of Designs.txt and AllDesigns.txt for the json.load readers."""
+        import os
+        from storage.design_store import LOG_SUFFIX, get_design_store
+        bayesian_path = os.path.join("src", "ExploreTab", "Bayesian")
+        for path in (os.path.join(bayesian_path, "Designs.txt"), os.path.join(bayesian_path, "tmp_explore", "AllDesigns.txt")):
+            if os.path.exists(path) or os.path.exists(path + LOG_SUFFIX):
+                get_design_store(path).compact()
+
+    def _append_proposals_to_designs(self, proposals):
+        """Queue the proposed designs as the next round: RoundFill shows the last 6 designs of Designs.txt."""
+        if not proposals:
+            return
+        import os
+        designs_path = os.path.join("src", "ExploreTab", "Bayesian", "Designs.txt")
+        from storage.design_store import get_design_store
+        store = get_design_store(designs_path)
+        store.extend(proposals)
+        # The Round scripts read Designs.txt with json.load
+        store.compact()
+        print(f"[Explore] Added {len(proposals)} proposed designs to {designs_path}")
+
+    def _prefetch_next_tournament_match(self, a_idx, b_idx):
+        """Queue the meshes of the next match for both possible outcomes of the current one.
+
+        Bracket matches are queued when the tournament starts, and later rounds
+        only contain designs that were already shown; with active pairing the
+        next match depends on the pick, so both candidates are prefetched.
+        """
+        scheduler = getattr(self, "tournament_scheduler", None)
+        if scheduler is None:
+            return
+        try:
+            designs = []
+            for winner, loser in ((a_idx, b_idx), (b_idx, a_idx)):
+                nxt = scheduler.preview_next_match(winner, loser)
+                if nxt is not None:
+                    designs += [self.tournament_designs[nxt["a_index"]], self.tournament_designs[nxt["b_index"]]]
+            self._get_geom_prefetcher().prefetch(designs)
+        except Exception as e:
+            print(f"[Tournament] Prefetch error: {e}")
+
+    def _get_geom_prefetcher(self):
+        """Background mesh builder feeding the shared geom registry (see geometry/prefetch.py)."""
+        if getattr(self, 'geom_prefetcher', None) is None:
+            from geometry.prefetch import GeomPrefetcher
+            self.geom_prefetcher = GeomPrefetcher(self)
+        return self.geom_prefetcher
+
+    def _get_background_jobs(self):
+        """Job runner for work that must not block the main loop (see core/jobs.py)."""
+        if getattr(self, 'background_jobs', None) is None:
+            from core.jobs import BackgroundJobs
+            self.background_jobs = BackgroundJobs(self)
+        return self.background_jobs
+
     def _start_tournament_rotation(self):
         """Start rotation animation for tournament objects."""
         if not hasattr(self, 'tournament_objects') or not self.tournament_objects:
             return
-        self.taskMgr.add(self._tournament_rotation_task, "tournament-rotation-task")
-
-    def _tournament_rotation_task(self, task):
-        """Rotate both tournament objects each frame."""
-        try:
-            speed = getattr(self, 'tournament_spin_speed', 0.8)
-            if hasattr(self, 'tournament_objects'):
-                for obj in self.tournament_objects:
-                    try:
-                        if obj:
-                            obj.setH(obj.getH() + speed)
-                    except Exception:
-                        pass
-        except Exception:
-            pass
-        return task.cont
+        self._stop_tournament_rotation()
+        from rendering.grid_view import spin_interval
+        speed = getattr(self, 'tournament_spin_speed', 0.8)
+        self.tournament_rotation_intervals = [
+            spin_interval(obj, speed, name=f"tournament-rotation-{i}")
+            for i, obj in enumerate(self.tournament_objects) if obj
+        ]
+
+    def _stop_tournament_rotation(self):
+        """Stop the tournament rotation intervals."""
+        for interval in getattr(self, 'tournament_rotation_intervals', []):
+            interval.pause()
+        self.tournament_rotation_intervals = []
 
     def _tint_object(self, node_path, on: bool):
         """Apply or clear a green tint on the given object NodePath."""
@@ -0,0 +1,62 @@
+"""
+Background jobs for work that must not block the Panda3D main loop
+(plotting, rating updates, GP training).
+Jobs run on a worker thread and return a concurrent.futures.Future. Callbacks
+registered with when_done() are called back on the main thread, from a task
+that polls the pending futures a few times per second.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import traceback
+
+from direct.task import Task
+
+
+class BackgroundJobs:
+    """Small job runner that hands results back to the main thread."""
+
+    poll_task_name = "background-jobs-poll"
+
+    def __init__(self, showbase, max_workers=1, poll_interval=0.05, name=None):
+        self.showbase = showbase
+        self.poll_interval = poll_interval
+        # Separate runners need their own poll task
+        if name:
+            self.poll_task_name = f"{name}-poll"
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name or "background-job")
+        self._callbacks = []   # [(future, callback)]
+
+    def submit(self, name, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) on the worker thread; returns its Future."""
+        def _run():
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                print(f"[Jobs] {name} failed:\n{traceback.format_exc()}")
+                raise
+        future = self._executor.submit(_run)
+        future.job_name = name
+        return future
+
+    def when_done(self, future, callback):
+        """Call callback(future) on the main thread once future has resolved."""
+        self._callbacks.append((future, callback))
+        # doMethodLater keeps the poller off the per-frame task list while waiting
+        if not self.showbase.taskMgr.hasTaskNamed(self.poll_task_name):
+            self.showbase.taskMgr.doMethodLater(self.poll_interval, self._poll_task, self.poll_task_name)
+
+    def _poll_task(self, task):
+        ready = [(f, cb) for f, cb in self._callbacks if f.done()]
+        if ready:
+            self._callbacks = [(f, cb) for f, cb in self._callbacks if not f.done()]
+            for future, callback in ready:
+                try:
+                    callback(future)
+                except Exception as e:
+                    print(f"[Jobs] Callback for {getattr(future, 'job_name', 'job')} failed: {e}")
+        return Task.again if self._callbacks else Task.done
+
+    def shutdown(self, wait=False):
+        self.showbase.taskMgr.remove(self.poll_task_name)
+        self._callbacks = []
+        self._executor.shutdown(wait=wait)
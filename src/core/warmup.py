@@ -0,0 +1,138 @@
+"""
+Warm-up scheduler: runs small preparation jobs in idle frames after startup.
+Jobs are generators; each next() is one slice of work (a mesh build, starting
+an import thread, ...). The scheduler runs slices until its per-frame budget is
+used up, and skips frames entirely while the user is interacting. The budget
+is checked between slices, so a slice longer than the budget (a Table mesh
+build, ~40-90 ms) still runs whole and makes that one frame late.
+"""
+
+import time
+
+from direct.task import Task
+from panda3d.core import ClockObject, MouseButton
+
+
+class WarmupScheduler:
+    """Run warm-up jobs in idle frames, yielding to user input."""
+
+    task_name = "warmup-task"
+
+    def __init__(self, showbase, frame_budget=0.006, input_cooldown=0.5, start_after_frames=2):
+        self.showbase = showbase
+        self.frame_budget = frame_budget            # seconds of work per frame
+        self.input_cooldown = input_cooldown        # seconds to wait after the last input
+        self.start_after_frames = start_after_frames
+        self._jobs = []                             # [name, generator, start time or None]
+        self._clock = ClockObject.getGlobalClock()
+        self._last_input_time = 0.0
+        self._last_mouse = None
+        self._running = False
+        self._start_frame = 0
+
+    def add_job(self, name, job):
+        """Queue a job: a generator, or a plain callable run as a single slice."""
+        if callable(job):
+            func = job
+
+            def _single():
+                func()
+                yield
+            job = _single()
+        self._jobs.append([name, job, None])
+
+    def start(self):
+        if self._running or not self._jobs:
+            return
+        self._running = True
+        self._start_frame = self._clock.getFrameCount()
+        self.showbase.taskMgr.add(self._warmup_task, self.task_name, sort=40)
+
+    def cancel(self):
+        self.showbase.taskMgr.remove(self.task_name)
+        self._jobs = []
+        self._running = False
+
+    @property
+    def pending(self):
+        return [name for name, _job, _t in self._jobs]
+
+    def _user_busy(self):
+        """True while the user is interacting or did so very recently."""
+        now = self._clock.getRealTime()
+        watcher = getattr(self.showbase, "mouseWatcherNode", None)
+        if watcher is not None:
+            mouse = None
+            if watcher.hasMouse():
+                m = watcher.getMouse()
+                mouse = (m.getX(), m.getY())
+            buttons_down = any(watcher.isButtonDown(b) for b in (MouseButton.one(), MouseButton.two(), MouseButton.three()))
+            if buttons_down or mouse != self._last_mouse:
+                self._last_input_time = now
+            self._last_mouse = mouse
+        camera = getattr(self.showbase, "camera_controller", None)
+        if camera is not None and getattr(camera, "_dragging", False):
+            self._last_input_time = now
+        return now - self._last_input_time < self.input_cooldown
+
+    def _warmup_task(self, task):
+        # Let the first frames (the builder view) appear before any warm-up
+        if self._clock.getFrameCount() - self._start_frame < self.start_after_frames:
+            return Task.cont
+        if self._user_busy():
+            return Task.cont
+
+        deadline = time.perf_counter() + self.frame_budget
+        while self._jobs and time.perf_counter() < deadline:
+            entry = self._jobs[0]
+            name, job, started = entry
+            if started is None:
+                entry[2] = started = time.perf_counter()
+            try:
+                next(job)
+            except StopIteration:
+                self._jobs.pop(0)
+                print(f"[Warmup] {name} done in {(time.perf_counter() - started) * 1000.0:.0f} ms")
+            except Exception as e:
+                self._jobs.pop(0)
+                print(f"[Warmup] {name} failed: {e}")
+
+        if not self._jobs:
+            self._running = False
+            return Task.done
+        return Task.cont
+
+
+def prebuild_default_meshes():
+    """Build the default design of every object type into the shared geom registry.
+
+    One mesh per slice: the vase takes a few ms, the Table (built vertex by
+    vertex in Python) ~40-90 ms, well over the frame budget.
+    """
+    from geometry.registry import get_geom_registry
+    from geometry.vase.config import vaseDefaults
+    from geometry.table.config import tableDefaults
+
+    registry = get_geom_registry()
+    for object_type, defaults in (("Vase", vaseDefaults), ("Table", tableDefaults)):
+        registry.get(defaults(), object_type)
+        yield
+
+
+def precompute_vase_topology():
+    """Fill the vase grid topology cache, one topology (< 1 ms) per slice."""
+    from geometry.vase import geometry as vase
+
+    yield
+    # Every band count the inner wall (and the rim, 1 band) can use, plus the outer wall
+    for bands in range(1, vase.height_segments + 1):
+        vase.gridQuadTopology(bands, vase.segments, True)
+        yield
+    vase.gridQuadTopology(vase.height_segments, vase.segments, False)
+    yield
+
+
+def start_explore_preload():
+    """Import the Explore/ML stack in the background (see utils/preload.py)."""
+    from utils.preload import preload_explore_modules
+    preload_explore_modules()
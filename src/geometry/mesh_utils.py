@@ -0,0 +1,105 @@
+"""
+Helpers shared by the preview geometry builders.
+Defines the compact preview vertex format and a bulk upload path that copies
+NumPy vertex/index buffers straight into Panda3D arrays.
+"""
+
+import numpy as np
+from panda3d.core import Geom, GeomTriangles, GeomVertexArrayFormat, GeomVertexData, GeomVertexFormat, InternalName
+
+
+# Largest vertex count that still fits 16-bit indices
+MAX_UINT16_VERTICES = 0xFFFF
+
+_preview_formats = {}
+
+
+def get_preview_vertex_format(packed_normals=False):
+    """Return the vertex format used for preview meshes.
+
+    Rows hold a float32 position, a normal and an RGBA8 color (the color only
+    encodes the white/yellow/red overhang status). With packed_normals the
+    normal is stored as normalized int16 instead of float32, taking the stride
+    from 28 to 24 bytes. CPU-side readers see the raw int16 values then, so
+    keep it off for meshes that get flattened or measured through normals.
+    """
+    if not packed_normals:
+        # Already float32 point/normal + 4 unsigned byte color
+        return GeomVertexFormat.getV3n3c4()
+
+    if packed_normals not in _preview_formats:
+        array_format = GeomVertexArrayFormat()
+        array_format.addColumn(InternalName.getVertex(), 3, Geom.NT_float32, Geom.C_point)
+        array_format.addColumn(InternalName.getNormal(), 3, Geom.NT_int16, Geom.C_normal)
+        array_format.addColumn(InternalName.getColor(), 4, Geom.NT_uint8, Geom.C_color)
+        _preview_formats[packed_normals] = GeomVertexFormat.registerFormat(GeomVertexFormat(array_format))
+    return _preview_formats[packed_normals]
+
+
+def _row_dtype(array_format):
+    """NumPy structured dtype matching one interleaved row of array_format."""
+    numpy_types = {
+        Geom.NT_float32: "<f4",
+        Geom.NT_int16: "<i2",
+        Geom.NT_uint8: "u1",
+    }
+    names, formats, offsets = [], [], []
+    for i in range(array_format.getNumColumns()):
+        column = array_format.getColumn(i)
+        names.append(column.getName().getName())
+        formats.append((numpy_types[column.getNumericType()], column.getNumComponents()))
+        offsets.append(column.getStart())
+    return np.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": array_format.getStride()})
+
+
+def pack_colors(colors):
+    """Convert float RGBA colors in [0, 1] to RGBA8."""
+    colors = np.asarray(colors, dtype=float)
+    return np.clip(np.rint(colors * 255.0), 0, 255).astype(np.uint8)
+
+
+def build_preview_geom(name, points, normals, colors, triangles, packed_normals=False):
+    """Upload NumPy mesh buffers into a static Geom in one copy per buffer.
+
+    Args:
+        name: Name of the GeomVertexData
+        points: (n, 3) float positions
+        normals: (n, 3) unit normals
+        colors: (n, 4) RGBA8 colors (see pack_colors)
+        triangles: (m, 3) vertex indices
+        packed_normals: Store normals as int16 (see get_preview_vertex_format)
+
+    Returns:
+        Geom with a single GeomTriangles primitive. Indices are 16-bit when
+        the vertex count allows, 32-bit otherwise.
+    """
+    vformat = get_preview_vertex_format(packed_normals)
+    vertex_count = len(points)
+
+    rows = np.zeros(vertex_count, dtype=_row_dtype(vformat.getArray(0)))
+    rows["vertex"] = points
+    if packed_normals:
+        rows["normal"] = np.rint(np.clip(normals, -1.0, 1.0) * 32767.0)
+    else:
+        rows["normal"] = normals
+    rows["color"] = colors
+
+    vdata = GeomVertexData(name, vformat, Geom.UHStatic)
+    vdata.uncleanSetNumRows(vertex_count)
+    memoryview(vdata.modifyArray(0)).cast("B")[:] = rows.view(np.uint8)
+
+    tris = GeomTriangles(Geom.UHStatic)
+    if vertex_count <= MAX_UINT16_VERTICES:
+        tris.setIndexType(Geom.NT_uint16)
+        index_dtype = np.uint16
+    else:
+        tris.setIndexType(Geom.NT_uint32)
+        index_dtype = np.uint32
+    index_data = np.ascontiguousarray(triangles, dtype=index_dtype).reshape(-1)
+    index_handle = tris.modifyVertices()
+    index_handle.uncleanSetNumRows(len(index_data))
+    memoryview(index_handle).cast("B")[:] = index_data.view(np.uint8)
+
+    geom = Geom(vdata)
+    geom.addPrimitive(tris)
+    return geom
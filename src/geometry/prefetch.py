@@ -0,0 +1,75 @@
+"""
+Background prefetch of preview meshes into the shared geom registry.
+Scenes that know which designs they will show next (tournament matches) queue
+them here. Meshes are built on a worker thread and handed to the registry on
+the main thread, so showing a prefetched design only costs a GeomNode.
+"""
+
+from concurrent.futures import CancelledError
+
+from geometry.registry import build_entry, get_geom_registry
+
+
+class GeomPrefetcher:
+    """Builds meshes for upcoming designs ahead of time.
+
+    Finished builds are put into the registry from a BackgroundJobs callback
+    on the main thread, or by ensure() when a design is needed before that
+    callback ran. The worker itself only shares the material attrib cache
+    with the main thread; that cache and the registry are locked.
+    """
+
+    def __init__(self, showbase, registry=None):
+        from core.jobs import BackgroundJobs
+
+        self.registry = registry or get_geom_registry()
+        self.jobs = BackgroundJobs(showbase, name="geom-prefetch")
+        self._pending = {}      # registry key -> Future of a GeomEntry
+        self.prefetched = 0
+
+    def prefetch(self, designs):
+        """Queue mesh builds for designs (dicts with "parameters" and "object_type"), in order."""
+        for design in designs:
+            params = design.get("parameters", {})
+            object_type = design.get("object_type", "Vase")
+            key = self.registry.key_for(params, object_type)
+            if key in self.registry or key in self._pending:
+                continue
+            future = self.jobs.submit("geom prefetch", build_entry, dict(params), object_type)
+            self._pending[key] = future
+            self.jobs.when_done(future, lambda f, key=key: self._store(key, f))
+
+    def _store(self, key, future):
+        """Main thread: move a finished build into the registry."""
+        if self._pending.get(key) is not future:
+            return
+        del self._pending[key]
+        try:
+            entry = future.result()
+        except (CancelledError, Exception):
+            return
+        if key not in self.registry:
+            self.registry.put(key, entry)
+            self.prefetched += 1
+
+    def ensure(self, params, object_type="Vase"):
+        """Main thread, right before params is shown: collect its prefetched mesh.
+
+        A build that is already running is waited for (it has less left to do
+        than a fresh build); one still queued is cancelled, and the registry
+        then builds the mesh itself as usual.
+        """
+        key = self.registry.key_for(params, object_type)
+        future = self._pending.get(key)
+        if future is None:
+            return
+        if future.done() or future.running():
+            self._store(key, future)
+        elif future.cancel():
+            del self._pending[key]
+
+    def cancel(self):
+        """Drop builds that have not started yet (e.g. when leaving the scene)."""
+        for key, future in list(self._pending.items()):
+            if future.cancel():
+                del self._pending[key]
@@ -0,0 +1,162 @@
+"""
+Registry of preview meshes shared between scenes.
+Favorites, generated designs, tournament pairs and RoundFinal often show the
+same parameter set several times. The registry builds each mesh once and hands
+out the same Geom and MaterialAttrib, so duplicates only cost a GeomNode.
+"""
+
+import threading
+from collections import OrderedDict
+
+from panda3d.core import GeomNode, MaterialAttrib
+
+from utils.param_hash import normalize_object_type, param_hash
+
+
+_material_attribs = {}
+_material_attribs_lock = threading.Lock()
+
+
+def shared_material_attrib(material):
+    """MaterialAttrib for material, reusing one attrib per distinct set of material values.
+
+    Every build creates a fresh Material, and Panda3D compares MaterialAttribs
+    by Material identity. Sharing the attrib keeps equal-looking objects on the
+    same RenderState, so they sort and flatten together. Called from
+    prefetch worker threads too, hence the lock.
+    """
+    key = (
+        tuple(material.getAmbient()), tuple(material.getDiffuse()),
+        tuple(material.getSpecular()), tuple(material.getEmission()),
+        material.getShininess(), material.hasAmbient(), material.hasDiffuse(),
+        material.hasSpecular(), material.hasEmission(),
+    )
+    with _material_attribs_lock:
+        attrib = _material_attribs.get(key)
+        if attrib is None:
+            attrib = MaterialAttrib.make(material)
+            _material_attribs[key] = attrib
+        return attrib
+
+
+class GeomEntry:
+    """One built mesh: the shared Geom, its material attrib and overhang flag."""
+
+    def __init__(self, object_type, geom, material, has_overhang):
+        self.object_type = object_type
+        self.geom = geom
+        self.material = material
+        self.material_attrib = shared_material_attrib(material) if material else None
+        self.has_overhang = has_overhang
+
+
+class GeomRegistry:
+    """LRU cache of GeomEntry objects keyed by object type and quantized parameters.
+
+    Evicting an entry only drops the registry's reference; nodes that already
+    use the Geom keep it alive. The LRU is guarded by a lock, so entries
+    built on other threads (geometry/prefetch.py) can be put safely; meshes
+    are built outside the lock.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def key_for(self, params, object_type="Vase"):
+        return param_hash(params, object_type)
+
+    def get(self, params, object_type="Vase"):
+        """Return the GeomEntry for params, building the mesh on first use."""
+        key = self.key_for(params, object_type)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+            self.misses += 1
+
+        entry = build_entry(params, object_type)
+        self.put(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        """Store an already built entry (e.g. from a prefetch)."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def make_node(self, params, object_type="Vase", name=None):
+        """Create a new GeomNode that references the shared mesh for params.
+
+        Each caller gets its own node, so transforms and color scales set on
+        the returned node do not leak into other instances.
+        """
+        entry = self.get(params, object_type)
+        node = GeomNode(name or f"favorite_object_{entry.object_type}")
+        node.addGeom(entry.geom)
+        if entry.material_attrib is not None:
+            node.setAttrib(entry.material_attrib)
+        return node, entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def build_entry(params, object_type="Vase"):
+    """Build the preview mesh for params with the matching geometry builder."""
+    kwargs = dict(
+        segment_count=int(params["Segment Count"]),
+        object_width=params["Object Width"],
+        twist_angle=params["Twist Angle"],
+        twist_groove_depth=params["Twist Groove Depth"],
+        vertical_wave_freq=params["Vertical Wave Frequency"],
+        vertical_wave_depth=params["Vertical Wave Depth"],
+    )
+    if normalize_object_type(object_type) == "Table":
+        from geometry.table.geometry import tableGeometry
+        result = tableGeometry(**kwargs)
+    else:
+        from geometry.vase.geometry import vaseGeometry
+        result = vaseGeometry(**kwargs)
+
+    if isinstance(result, tuple) and len(result) == 4:
+        actual_object_type, geom, material, has_overhang = result
+    elif isinstance(result, tuple) and len(result) == 3:
+        actual_object_type, geom, material = result
+        has_overhang = False
+    elif isinstance(result, tuple) and len(result) == 2:
+        actual_object_type, geom = result
+        material = None
+        has_overhang = False
+    else:
+        actual_object_type, geom = object_type, result
+        material = None
+        has_overhang = False
+    return GeomEntry(actual_object_type, geom, material, has_overhang)
+
+
+_registry = None
+
+
+def get_geom_registry():
+    """Process-wide registry used by the viewer scenes."""
+    global _registry
+    if _registry is None:
+        _registry = GeomRegistry()
+    return _registry
@@ -1,4 +1,6 @@
-from panda3d.core import Geom, GeomTriangles, GeomVertexData, GeomVertexFormat, GeomVertexWriter, Material
+import functools
+
+from panda3d.core import Geom, Material
 
 ######## GLOBAL VARIABLES
 
@@ -12,15 +14,24 @@ objectHeight = 7.0 #inches
 segments = 50 #number of segments around the circumference
 height_segments = 40 #number of segments along the height
 
+# Preview vertex format: store normals as int16 instead of float32 (24 vs 28 byte rows)
+compactNormals = False
+
 
 
 
 def vaseGeometry(segment_count=16, object_width=1.0, twist_angle=0.0, 
                            twist_groove_depth=1.0, vertical_wave_freq=3.0, 
                            vertical_wave_depth=1.0, wall_thickness=0.5, 
-                           max_overhang_angle=overhangAngle) -> Geom:
+                           max_overhang_angle=overhangAngle, return_overhang_map=False) -> Geom:
 
     """Build a modulated pipe geometry with inner and outer surface variations.
+
+    The side walls are a welded indexed mesh: one vertex per (height row, angle)
+    grid node, shared by all neighbouring quads, with smooth analytic surface
+    normals. Separate vertices are only kept for the flat-shaded caps (bottom
+    disks and the top rim). Vertices and indices are assembled as NumPy
+    buffers and uploaded in one copy (see geometry.mesh_utils).
     
     Args:
         radius: Base radius of the cylinder
@@ -34,9 +45,12 @@ def vaseGeometry(segment_count=16, object_width=1.0, twist_angle=0.0,
         vertical_wave_freq: Frequency of vertical waves
         vertical_wave_depth: Depth of vertical waves
         wall_thickness: Thickness of the pipe wall (offset between inner and outer radius)
+        return_overhang_map: Also return the per-face overhang angles (see overhangAnglesFromGrid)
     """
     
     import math
+    import numpy as np
+    from geometry.mesh_utils import build_preview_geom, pack_colors
 
     ObjectType = "Vase"
 
@@ -52,260 +66,310 @@ def vaseGeometry(segment_count=16, object_width=1.0, twist_angle=0.0,
     show_outer_surface = True
     show_inner_surface = True
     show_side_connect_walls = True
-    
-    vformat = GeomVertexFormat.getV3n3c4()
-    vdata = GeomVertexData("vase_modulated_vn", vformat, Geom.UHStatic)
 
-    vwriter = GeomVertexWriter(vdata, "vertex")
-    nwriter = GeomVertexWriter(vdata, "normal")
-    cwriter = GeomVertexWriter(vdata, "color")
-
-    indices = []
+    point_blocks = []
+    normal_blocks = []
+    vertex_count = 0
+    triangle_blocks = []
     half_height = height / 2.0
+    inner_z_top = -half_height + bottom_thickness
     
-    # Track vertex colors based on overhang angle
-    vertex_colors = {}  # vertex_idx -> (r, g, b, a)
-
-    def add_vertex(x, y, z, nx, ny, nz, r=1.0, g=1.0, b=1.0, a=1.0):
-        """Helper to add a vertex with its normal and color."""
-        vwriter.addData3f(x, y, z)
-        nwriter.addData3f(nx, ny, nz)
-        cwriter.addData4f(r, g, b, a)
-        vertex_idx = vwriter.getWriteRow() - 1
-        
-        # Check if this vertex should be red (will be updated later)
-        return vertex_idx
-
-    def get_surface_modulation(phi, length_ratio):
-        """Surface modulation function converted from C#."""
-        phi += twist_angle * 0.067 * math.pi * length_ratio
-        modulated_radius = object_width + (twist_groove_depth * 0.06) * math.cos(segment_count * phi) + (vertical_wave_depth * 0.15) * math.cos(vertical_wave_freq * length_ratio)
-        return modulated_radius
-
-    def get_inner_surface_modulation(phi, length_ratio):
-        """Inner surface modulation function with wall thickness offset."""
-        phi += twist_angle * 0.067 * math.pi * length_ratio
-        modulated_radius = (object_width - wall_thickness) + (twist_groove_depth * 0.06) * math.cos(segment_count * phi) + (vertical_wave_depth * 0.15) * math.cos(vertical_wave_freq * length_ratio)
-        return modulated_radius
-
-    # Generate vertices for bottom faces (cup bottom)
-    # Bottom face - outer ring (normals down)
-    bottom_outer_vertices = []
-    for i in range(segments):
-        angle = (2.0 * math.pi * i) / segments
-        bottom_radius = get_surface_modulation(angle, 0.0)  # Bottom face
-        bottom_v = add_vertex(bottom_radius * math.cos(angle), bottom_radius * math.sin(angle), -half_height, 0, 0, -1)
-        bottom_outer_vertices.append(bottom_v)
-    
-    # Bottom face - inner ring (normals up for interior bottom)
-    bottom_inner_vertices = []
-    for i in range(segments):
-        angle = (2.0 * math.pi * i) / segments
-        bottom_inner_radius = get_inner_surface_modulation(angle, 0.0)  # Bottom face
-        bottom_v = add_vertex(bottom_inner_radius * math.cos(angle), bottom_inner_radius * math.sin(angle), -half_height, 0, 0, 1)
-        bottom_inner_vertices.append(bottom_v)
+    # Per-face overhang angles of the outer wall (height_segments, segments)
+    overhang_map = None
+
+    def add_vertices(points, normals):
+        """Append a block of vertices (any leading shape); returns the matching index array."""
+        nonlocal vertex_count
+        points = np.asarray(points, dtype=float)
+        normals = np.broadcast_to(np.asarray(normals, dtype=float), points.shape)
+        point_blocks.append(points.reshape(-1, 3))
+        normal_blocks.append(normals.reshape(-1, 3))
+        first = vertex_count
+        vertex_count += point_blocks[-1].shape[0]
+        return first + np.arange(point_blocks[-1].shape[0]).reshape(points.shape[:-1])
+
+    def add_grid_quads(first, bands, flip=False):
+        """Quads for bands rings of consecutive vertex rows starting at vertex index first."""
+        triangle_blocks.append(first + gridQuadTopology(bands, segments, flip))
+
+    # Surface modulation (converted from C#), evaluated over the whole grid:
+    #   r(phi, L) = base + groove * cos(n * (phi + twist * L)) + wave * cos(f * L)
+    twist = twist_angle * 0.067 * math.pi
+    groove = twist_groove_depth * 0.06
+    wave = vertical_wave_depth * 0.15
+
+    angles = (2.0 * math.pi * np.arange(segments)) / segments
+    cos_a = np.cos(angles)
+    sin_a = np.sin(angles)
+
+    def get_surface_grid(base_radius, length_ratios):
+        """Radius and its analytic partial derivatives on a (len(length_ratios), segments) grid."""
+        length_ratios = np.asarray(length_ratios, dtype=float)[:, None]
+        phase = segment_count * (angles[None, :] + twist * length_ratios)
+        radius = base_radius + groove * np.cos(phase) + wave * np.cos(vertical_wave_freq * length_ratios)
+        d_phi = -groove * segment_count * np.sin(phase)
+        d_length = (-groove * segment_count * twist * np.sin(phase)
+                    - wave * vertical_wave_freq * np.sin(vertical_wave_freq * length_ratios))
+        # z = -half_height + height * L, so dr/dz = dr/dL / height
+        return radius, d_phi, d_length / height
+
+    def get_surface_points(radius, z_values):
+        z_grid = np.broadcast_to(np.asarray(z_values, dtype=float)[:, None], radius.shape)
+        return np.stack([radius * cos_a, radius * sin_a, z_grid], axis=-1)
+
+    def get_surface_normals(radius, d_phi, d_z):
+        """Outward unit normals of P(phi, z) = (r cos(phi), r sin(phi), z), i.e. dP/dphi x dP/dz."""
+        normals = np.stack([
+            radius * cos_a + d_phi * sin_a,
+            radius * sin_a - d_phi * cos_a,
+            -radius * d_z,
+        ], axis=-1)
+        return normals / np.linalg.norm(normals, axis=-1, keepdims=True)
+
+    # Grid rows from the top (row 0) to the bottom (row height_segments)
+    rows = np.arange(height_segments + 1)
+    row_z = half_height - (height * rows) / height_segments
+    row_length_ratio = 1.0 - rows / height_segments
+
+    # Bottom face - outer ring (normals down); flat-shaded cap keeps its own vertices
+    bottom_radius, _, _ = get_surface_grid(object_width, [0.0])
+    bottom_outer_vertices = add_vertices(get_surface_points(bottom_radius, [-half_height])[0], (0, 0, -1))
 
     # Create bottom faces as triangle fans to center (cup bottom)
     # Outer bottom (faces downward)
     if show_bottom_outer:
-        bottom_center_outer = add_vertex(0.0, 0.0, -half_height, 0, 0, -1)
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            indices.append((bottom_center_outer, bottom_outer_vertices[next_i], bottom_outer_vertices[i]))
+        bottom_center_outer = add_vertices([0.0, 0.0, -half_height], (0, 0, -1))
+        triangle_blocks.append(np.stack([
+            np.full(segments, bottom_center_outer),
+            np.roll(bottom_outer_vertices, -1),
+            bottom_outer_vertices,
+        ], axis=-1))
 
     # Inner bottom (faces upward inside the cup) at raised Z to create thickness
-    inner_bottom_top_ring = []
-    inner_z_top = -half_height + bottom_thickness
-    for i in range(segments):
-        angle = (2.0 * math.pi * i) / segments
-        r = get_inner_surface_modulation(angle, 0.0)
-        v = add_vertex(r * math.cos(angle), r * math.sin(angle), inner_z_top, 0, 0, 1)
-        inner_bottom_top_ring.append(v)
+    inner_bottom_radius, inner_bottom_d_phi, inner_bottom_d_z = get_surface_grid(object_width - wall_thickness, [0.0])
+    inner_bottom_top_ring = add_vertices(get_surface_points(inner_bottom_radius, [inner_z_top])[0], (0, 0, 1))
 
     if show_bottom_inner:
-        bottom_center_inner = add_vertex(0.0, 0.0, inner_z_top, 0, 0, 1)
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            indices.append((inner_bottom_top_ring[i], inner_bottom_top_ring[next_i], bottom_center_inner))
+        bottom_center_inner = add_vertices([0.0, 0.0, inner_z_top], (0, 0, 1))
+        triangle_blocks.append(np.stack([
+            inner_bottom_top_ring,
+            np.roll(inner_bottom_top_ring, -1),
+            np.full(segments, bottom_center_inner),
+        ], axis=-1))
 
     # (Inner vertical wall intentionally omitted)
     
     # Create side walls with height segments
     if not show_bottom_only:
-        for h in range(height_segments):
-            z1 = half_height - (height * h) / height_segments
-            z2 = half_height - (height * (h + 1)) / height_segments
-            length_ratio1 = 1.0 - (h / height_segments)
-            length_ratio2 = 1.0 - ((h + 1) / height_segments)
+        # Outer wall: one welded vertex per grid node
+        outer_radius, outer_d_phi, outer_d_z = get_surface_grid(object_width, row_length_ratio)
+        outer_points = get_surface_points(outer_radius, row_z)
+        outer_grid = add_vertices(outer_points, get_surface_normals(outer_radius, outer_d_phi, outer_d_z))
+
+        # Inner wall: rows above the inner bottom plane. The band that crosses the
+        # plane ends on the inner bottom ring, so its lower row sits at the ring
+        # position (with wall normals; the flat cap keeps its own ring vertices).
+        inner_rows = rows[row_z > inner_z_top]
+        inner_band_count = len(inner_rows)
+        inner_radius, inner_d_phi, inner_d_z = get_surface_grid(object_width - wall_thickness, row_length_ratio[inner_rows])
+        inner_points = get_surface_points(inner_radius, row_z[inner_rows])
+        inner_normals = -get_surface_normals(inner_radius, inner_d_phi, inner_d_z)
+        if inner_band_count and inner_rows[-1] < height_segments:
+            inner_points = np.concatenate([inner_points, get_surface_points(inner_bottom_radius, [inner_z_top])])
+            inner_normals = np.concatenate([inner_normals, -get_surface_normals(inner_bottom_radius, inner_bottom_d_phi, inner_bottom_d_z)])
+        else:
+            inner_band_count -= 1
+        inner_grid = add_vertices(inner_points, inner_normals)
+
+        # Create outer surface quads, with the overhang angle of every face
+        # computed in one vectorized pass over the grid
+        if show_outer_surface:
+            overhang_map = overhangAnglesFromGrid(outer_points)
+            add_grid_quads(outer_grid[0, 0], height_segments)
             
-            # Store vertices for this height level
-            outer_upper_vertices = []
-            outer_lower_vertices = []
-            inner_upper_vertices = []
-            inner_lower_vertices = []
-            # Determine if this band contributes to inner wall and whether it crosses inner_z_top
-            inner_band_has_geometry = not (z1 <= inner_z_top and z2 <= inner_z_top)
-            inner_band_crosses_inner_top = (z2 <= inner_z_top) and (z1 > inner_z_top)
+        # Create inner surface quads
+        if show_inner_surface and inner_band_count > 0:
+            add_grid_quads(inner_grid[0, 0], inner_band_count, flip=True)
             
-            for i in range(segments):
-                angle = (2.0 * math.pi * i) / segments
-                next_i = (i + 1) % segments
-                
-                # Get modulated radii for outer surface
-                outer_radius_upper = get_surface_modulation(angle, length_ratio1)
-                outer_radius_lower = get_surface_modulation(angle, length_ratio2)
-                
-                # Get modulated radii for inner surface
-                inner_radius_upper = get_inner_surface_modulation(angle, length_ratio1)
-                inner_radius_lower = get_inner_surface_modulation(angle, length_ratio2)
-                
-                # Calculate approximate normals
-                nx = math.cos(angle)
-                ny = math.sin(angle)
-                
-                # Add outer surface vertices
-                outer_upper_v = add_vertex(outer_radius_upper * math.cos(angle), outer_radius_upper * math.sin(angle), z1, nx, ny, 0)
-                outer_lower_v = add_vertex(outer_radius_lower * math.cos(angle), outer_radius_lower * math.sin(angle), z2, nx, ny, 0)
-                outer_upper_vertices.append(outer_upper_v)
-                outer_lower_vertices.append(outer_lower_v)
-                
-                # Add inner surface vertices (inverted normals), clamped to inner_z_top at the bottom
-                if inner_band_has_geometry:
-                    z1_inner = z1
-                    # If this band crosses the inner bottom top plane, weld the lower vertex to the inner bottom ring
-                    if inner_band_crosses_inner_top:
-                        inner_upper_v = add_vertex(inner_radius_upper * math.cos(angle), inner_radius_upper * math.sin(angle), z1_inner, -nx, -ny, 0)
-                        inner_lower_v = inner_bottom_top_ring[i]
-                    else:
-                        z2_inner = z2
-                        inner_upper_v = add_vertex(inner_radius_upper * math.cos(angle), inner_radius_upper * math.sin(angle), z1_inner, -nx, -ny, 0)
-                        inner_lower_v = add_vertex(inner_radius_lower * math.cos(angle), inner_radius_lower * math.sin(angle), z2_inner, -nx, -ny, 0)
-                    inner_upper_vertices.append(inner_upper_v)
-                    inner_lower_vertices.append(inner_lower_v)
-            
-            # Create outer surface quads
-            if show_outer_surface:
-                for i in range(segments):
-                    next_i = (i + 1) % segments
-                    
-                    # Calculate overhang angle for this face
-                    angle1 = (2.0 * math.pi * i) / segments
-                    angle2 = (2.0 * math.pi * next_i) / segments
-                    
-                    r1_upper = get_surface_modulation(angle1, length_ratio1)
-                    r1_lower = get_surface_modulation(angle1, length_ratio2)
-                    r2_lower = get_surface_modulation(angle2, length_ratio2)
-                    
-                    v0 = (r1_upper * math.cos(angle1), r1_upper * math.sin(angle1), z1)
-                    v1 = (r1_lower * math.cos(angle1), r1_lower * math.sin(angle1), z2)
-                    v2 = (r2_lower * math.cos(angle2), r2_lower * math.sin(angle2), z2)
-                    
-                    # Calculate face normal
-                    e1 = (v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2])
-                    e2 = (v2[0] - v0[0], v2[1] - v0[1], v2[2] - v0[2])
-                    cross = (e1[1]*e2[2] - e1[2]*e2[1], e1[2]*e2[0] - e1[0]*e2[2], e1[0]*e2[1] - e1[1]*e2[0])
-                    cross_len = math.sqrt(cross[0]*cross[0] + cross[1]*cross[1] + cross[2]*cross[2])
-                    
-                    # Calculate overhang angle and create gradient color
-                    if cross_len > 1e-9:
-                        nz = cross[2] / cross_len
-                        # Convert to overhang angle (negative = overhang, positive = no overhang)
-                        angle_deg = (90.0 - math.degrees(math.acos(max(-1, min(1, nz)))))
-                        
-                        # Create gradient based on max overhang angle
-                        # Yellow starts 5 degrees before max overhang
-                        yellow_start = max_overhang_angle - 0.0
-                        
-                        # Clamp angle between 0 and max overhang degrees
-                        clamped_angle = max(-max_overhang_angle, min(0.0, angle_deg))
-                        abs_angle = abs(clamped_angle)
-                        
-                        # Create gradient color
-                        if abs_angle < yellow_start:  # Below yellow start: white
-                            r = 1.0
-                            g = 1.0
-                            b = 1.0
-                        elif abs_angle < max_overhang_angle:  # Yellow start to max: yellow to red
-                            t = (abs_angle - yellow_start) / (max_overhang_angle - yellow_start)  # Full transition range
-                            r = 1.0
-                            g = 1.0 - t  # Start at yellow (1,1,0), end at red (1,0,0)
-                            b = 0.0
-                        else:  # At max overhang: red
-                            r = 1.0
-                            g = 0.0
-                            b = 0.0
-                        
-                        # Store color for all vertices of this face
-                        face_color = (r, g, b, 1.0)
-                        vertex_colors[outer_upper_vertices[i]] = face_color
-                        vertex_colors[outer_lower_vertices[i]] = face_color
-                        vertex_colors[outer_upper_vertices[next_i]] = face_color
-                        vertex_colors[outer_lower_vertices[next_i]] = face_color
-                        
-                        # (debug print removed)
-                    
-                    indices.extend([
-                        (outer_upper_vertices[i], outer_lower_vertices[i], outer_lower_vertices[next_i]),
-                        (outer_upper_vertices[i], outer_lower_vertices[next_i], outer_upper_vertices[next_i])
-                    ])
-            
-            # Create inner surface quads
-            if show_inner_surface and inner_band_has_geometry:
-                for i in range(segments):
-                    next_i = (i + 1) % segments
-                    indices.extend([
-                        (inner_upper_vertices[i], inner_upper_vertices[next_i], inner_lower_vertices[i]),
-                        (inner_lower_vertices[i], inner_upper_vertices[next_i], inner_lower_vertices[next_i])
-                    ])
-            
-            # Create wall faces connecting inner and outer surfaces (only at the very top band)
-            if show_side_connect_walls and h == 0:
-                # Use dedicated vertices with upward normals for flat shading on the top ring
-                wall_outer_top = []
-                wall_inner_top = []
-                for i in range(segments):
-                    # positions copied from the already computed top ring vertices
-                    ou_idx = outer_upper_vertices[i]
-                    in_idx = inner_upper_vertices[i]
-                    # fetch positions by recomputing from angle to avoid reading vdata
-                    angle = (2.0 * math.pi * i) / segments
-                    outer_r = get_surface_modulation(angle, length_ratio1)
-                    inner_r = get_inner_surface_modulation(angle, length_ratio1)
-                    # create new vertices with consistent normal up (0,0,1)
-                    wall_outer_top.append(add_vertex(outer_r * math.cos(angle), outer_r * math.sin(angle), z1, 0, 0, 1))
-                    wall_inner_top.append(add_vertex(inner_r * math.cos(angle), inner_r * math.sin(angle), z1, 0, 0, 1))
-                for i in range(segments):
-                    next_i = (i + 1) % segments
-                    indices.extend([
-                        (wall_outer_top[i], wall_outer_top[next_i], wall_inner_top[i]),
-                        (wall_inner_top[i], wall_outer_top[next_i], wall_inner_top[next_i])
-                    ])
+        # Create wall faces connecting inner and outer surfaces (only at the very top band)
+        if show_side_connect_walls and inner_band_count > 0:
+            # Use dedicated vertices with upward normals for flat shading on the top ring,
+            # positions copied from the already computed top ring of each wall
+            wall_outer_top = add_vertices(outer_points[0], (0, 0, 1))
+            add_vertices(inner_points[0], (0, 0, 1))
+            # The two rings are consecutive, so they form a one-band grid
+            add_grid_quads(wall_outer_top[0], 1, flip=True)
+
+    # Update vertex colors based on overhang gradient: each outer wall vertex
+    # takes the most severe of its adjacent faces
+    colors = np.ones((vertex_count, 4))
+    if overhang_map is not None:
+        colors[outer_grid.reshape(-1)] = overhangColorBuffer(
+            overhangVertexSeverity(overhang_map), max_overhang_angle
+        ).reshape(-1, 4)
 
     # Create main geometry with vertex colors
-    tris = GeomTriangles(Geom.UHStatic)
-    for a, b, c in indices:
-        tris.addVertices(a, b, c)
-        tris.closePrimitive()
-
-    geom = Geom(vdata)
-    geom.addPrimitive(tris)
-    
-    # Update vertex colors based on overhang gradient
-    for vertex_idx, color in vertex_colors.items():
-        cwriter.setRow(vertex_idx)
-        cwriter.setData4f(color[0], color[1], color[2], color[3])
+    geom = build_preview_geom(
+        "vase_modulated_vn",
+        np.concatenate(point_blocks),
+        np.concatenate(normal_blocks),
+        pack_colors(colors),
+        np.concatenate(triangle_blocks),
+        packed_normals=compactNormals,
+    )
     
     # Create simple material
     material = Material()
     material.setDiffuse((0.6, 0.8, 1.0, 1.0))  # Light blue color
     material.setShininess(32.0)
     
-    # Check if any overhang exists (any red areas)
-    has_overhang = any(color[0] == 1.0 and color[1] == 0.0 and color[2] == 0.0 for color in vertex_colors.values())
-    
+    # Check if any overhang exists (any face at or past the limit)
+    has_overhang = overhang_map is not None and hasOverhang(overhang_map, max_overhang_angle)
+
+    if return_overhang_map:
+        return ObjectType, geom, material, has_overhang, overhang_map
     return ObjectType, geom, material, has_overhang
 
 
+@functools.lru_cache(maxsize=64)
+def gridQuadTopology(bands, ring_size, flip=False):
+    """Triangle indices for a grid of bands + 1 consecutive rings of ring_size vertices.
+
+    Indices start at 0 (add the index of the first vertex), each quad wraps
+    around the ring and its two triangles stay adjacent. Cached per shape, so
+    the array is shared and read-only.
+    """
+    import numpy as np
+
+    grid = np.arange((bands + 1) * ring_size).reshape(bands + 1, ring_size)
+    upper, lower = grid[:-1], grid[1:]
+    upper_next = np.roll(upper, -1, axis=-1)
+    lower_next = np.roll(lower, -1, axis=-1)
+    if flip:
+        tris = [(upper, upper_next, lower), (lower, upper_next, lower_next)]
+    else:
+        tris = [(upper, lower, lower_next), (upper, lower_next, upper_next)]
+    topology = np.stack([np.stack(t, axis=-1) for t in tris], axis=-2).reshape(-1, 3)
+    topology.setflags(write=False)
+    return topology
+
+
+def overhangAnglesFromGrid(points):
+    """Per-face overhang angles of a (rows, segments, 3) outer wall grid.
+
+    Each quad (h, i) uses the face spanned by its upper-left, lower-left and
+    lower-right corners. Returns a (rows - 1, segments) float array in degrees:
+    negative = overhang, positive = no overhang. Degenerate faces read as 0.
+    Leading batch dimensions, (..., rows, segments, 3), are kept.
+    """
+    import numpy as np
+
+    v0 = points[..., :-1, :, :]
+    v1 = points[..., 1:, :, :]
+    v2 = np.roll(v1, -1, axis=-2)
+    cross = np.cross(v1 - v0, v2 - v0)
+    cross_len = np.linalg.norm(cross, axis=-1)
+    safe_len = np.where(cross_len > 1e-9, cross_len, 1.0)
+    nz = np.clip(cross[..., 2] / safe_len, -1.0, 1.0)
+    angles = 90.0 - np.degrees(np.arccos(nz))
+    return np.where(cross_len > 1e-9, angles, 0.0)
+
+
+def overhangVertexSeverity(overhang_map):
+    """Per-vertex overhang angle of the grid: the worst (most negative) adjacent face."""
+    import numpy as np
+
+    faces = np.minimum(overhang_map, np.roll(overhang_map, 1, axis=1))  # faces i-1 and i
+    severity = np.zeros((overhang_map.shape[0] + 1, overhang_map.shape[1]))
+    severity[:-1] = faces
+    severity[1:] = np.minimum(severity[1:], faces)
+    return severity
+
+
+def overhangColorBuffer(overhang_map, max_overhang_angle=overhangAngle):
+    """White/yellow/red RGBA colors (float, shape (..., 4)) for overhang angles."""
+    import numpy as np
+
+    # Yellow starts this many degrees before max overhang
+    yellow_start = max_overhang_angle - 0.0
+    # Clamp angle between 0 and max overhang degrees
+    abs_angle = np.abs(np.clip(overhang_map, -max_overhang_angle, 0.0))
+
+    colors = np.ones(np.shape(overhang_map) + (4,))
+    # Yellow start to max: yellow (1,1,0) to red (1,0,0)
+    ramp = (abs_angle >= yellow_start) & (abs_angle < max_overhang_angle)
+    if np.any(ramp):
+        colors[ramp, 1] = 1.0 - (abs_angle[ramp] - yellow_start) / (max_overhang_angle - yellow_start)
+        colors[ramp, 2] = 0.0
+    # At max overhang: red
+    red = abs_angle >= max_overhang_angle
+    colors[red, 1] = 0.0
+    colors[red, 2] = 0.0
+    return colors
+
+
+def hasOverhang(overhang_map, max_overhang_angle=overhangAngle):
+    """True if any face reaches the max_overhang_angle threshold."""
+    import numpy as np
+
+    return bool(np.any(overhang_map <= -max_overhang_angle))
+
+
+def overhangMask(overhang_maps, max_overhang_angle=overhangAngle):
+    """hasOverhang for each map of a (..., rows, segments) stack; returns a bool array."""
+    import numpy as np
+
+    return np.any(overhang_maps <= -max_overhang_angle, axis=(-2, -1))
+
+
+def vaseOverhangMap(
+    segment_count=16,
+    object_width=1.0,
+    twist_angle=0.0,
+    twist_groove_depth=1.0,
+    vertical_wave_freq=3.0,
+    vertical_wave_depth=1.0,
+):
+    """Per-face overhang angles of the vase outer wall without building Panda3D geometry.
+
+    Uses the same sampling resolution and modulation formulas as vaseGeometry.
+    Parameters may also be arrays of shape (n,), giving (n, rows, segments)
+    maps for n designs at once.
+    """
+    import math
+    import numpy as np
+
+    height = objectHeight
+    half_height = height / 2.0
+
+    def per_design(value):
+        # scalar -> (1, 1), (n,) -> (n, 1, 1), to broadcast against the (rows, segments) grid
+        return np.asarray(value, dtype=float)[..., None, None]
+
+    segment_count, object_width, twist_angle, twist_groove_depth, vertical_wave_freq, vertical_wave_depth = map(
+        per_design,
+        (segment_count, object_width, twist_angle, twist_groove_depth, vertical_wave_freq, vertical_wave_depth),
+    )
+
+    rows = np.arange(height_segments + 1)
+    z = half_height - (height * rows) / height_segments
+    length_ratio = (1.0 - rows / height_segments)[:, None]
+    angles = ((2.0 * math.pi * np.arange(segments)) / segments)[None, :]
+
+    phi = angles + twist_angle * 0.067 * math.pi * length_ratio
+    radius = (
+        object_width
+        + (twist_groove_depth * 0.06) * np.cos(segment_count * phi)
+        + (vertical_wave_depth * 0.15) * np.cos(vertical_wave_freq * length_ratio)
+    )
+    points = np.stack([
+        radius * np.cos(angles),
+        radius * np.sin(angles),
+        np.broadcast_to(z[:, None], radius.shape),
+    ], axis=-1)
+    return overhangAnglesFromGrid(points)
+
+
 def overhangVaseCheck(
     segment_count=16,
     object_width=1.0,
@@ -320,79 +384,15 @@ def overhangVaseCheck(
 
     Uses the same sampling resolution and modulation formulas as vaseGeometry,
     but avoids building Panda3D geometry. Returns True if any sampled face
-    exceeds the max_overhang_angle threshold.
+    exceeds the max_overhang_angle threshold. Only the outer wall is sampled,
+    so wall_thickness does not change the result.
     """
-    import math
-
-    # Match vaseGeometry's internal resolution exactly
-    height = 7.0
-    bottom_thickness = 0.2
-
-    half_height = height / 2.0
-
-    def get_surface_modulation(phi, length_ratio):
-        phi += twist_angle * 0.067 * math.pi * length_ratio
-        return (
-            object_width
-            + (twist_groove_depth * 0.06) * math.cos(segment_count * phi)
-            + (vertical_wave_depth * 0.15) * math.cos(vertical_wave_freq * length_ratio)
-        )
-
-    def get_inner_surface_modulation(phi, length_ratio):
-        phi += twist_angle * 0.067 * math.pi * length_ratio
-        return (
-            (object_width - wall_thickness)
-            + (twist_groove_depth * 0.06) * math.cos(segment_count * phi)
-            + (vertical_wave_depth * 0.15) * math.cos(vertical_wave_freq * length_ratio)
-        )
-
-    # Determine inner bottom top plane (to match thickness treatment)
-    inner_z_top = -half_height + bottom_thickness
-
-    # Scan side walls only (same region as vaseGeometry outer surface quads)
-    for h in range(height_segments):
-        z1 = half_height - (height * h) / height_segments
-        z2 = half_height - (height * (h + 1)) / height_segments
-        length_ratio1 = 1.0 - (h / height_segments)
-        length_ratio2 = 1.0 - ((h + 1) / height_segments)
-
-        # Skip bands entirely below the inner top plane (no outer wall difference, consistent with geometry)
-        # We still evaluate outer surface across full height like in geometry; this check mainly
-        # guards inner wall creation logic but does not affect outer wall sampling.
-
-        for i in range(segments):
-            next_i = (i + 1) % segments
-
-            angle1 = (2.0 * math.pi * i) / segments
-            angle2 = (2.0 * math.pi * next_i) / segments
-
-            r1_upper = get_surface_modulation(angle1, length_ratio1)
-            r1_lower = get_surface_modulation(angle1, length_ratio2)
-            r2_lower = get_surface_modulation(angle2, length_ratio2)
-
-            v0 = (r1_upper * math.cos(angle1), r1_upper * math.sin(angle1), z1)
-            v1 = (r1_lower * math.cos(angle1), r1_lower * math.sin(angle1), z2)
-            v2 = (r2_lower * math.cos(angle2), r2_lower * math.sin(angle2), z2)
-
-            # Face normal via cross product
-            e1 = (v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2])
-            e2 = (v2[0] - v0[0], v2[1] - v0[1], v2[2] - v0[2])
-            cross = (
-                e1[1] * e2[2] - e1[2] * e2[1],
-                e1[2] * e2[0] - e1[0] * e2[2],
-                e1[0] * e2[1] - e1[1] * e2[0],
-            )
-            cross_len = math.sqrt(cross[0] * cross[0] + cross[1] * cross[1] + cross[2] * cross[2])
-            if cross_len <= 1e-9:
-                continue
-
-            nz = cross[2] / cross_len
-            # Convert to overhang angle (negative = overhang, positive = no overhang), same as geometry
-            angle_deg = 90.0 - math.degrees(math.acos(max(-1.0, min(1.0, nz))))
-
-            # If magnitude exceeds threshold on the negative side, it's an overhang
-            # Geometry clamps to [-max_overhang, 0] for coloring; here we just check threshold
-            if angle_deg <= 0.0 and abs(angle_deg) >= max_overhang_angle:
-                return True
-
-    return False
+    overhang_map = vaseOverhangMap(
+        segment_count=segment_count,
+        object_width=object_width,
+        twist_angle=twist_angle,
+        twist_groove_depth=twist_groove_depth,
+        vertical_wave_freq=vertical_wave_freq,
+        vertical_wave_depth=vertical_wave_depth,
+    )
+    return hasOverhang(overhang_map, max_overhang_angle)
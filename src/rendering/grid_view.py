@@ -0,0 +1,75 @@
+from direct.interval.LerpInterval import LerpHprInterval
+
+
+# The old per-frame rotation tasks were tuned in degrees per frame at this rate
+ROTATION_REFERENCE_FPS = 60.0
+
+
+def spin_interval(node_path, degrees_per_frame, name=None):
+    """Looping heading spin for node_path, driven by the C++ interval manager.
+
+    The speed is given in the old per-frame units and converted to a fixed
+    duration per turn, so the spin no longer depends on the frame rate.
+    """
+    start = node_path.getHpr()
+    duration = 360.0 / (abs(degrees_per_frame) * ROTATION_REFERENCE_FPS)
+    direction = 1.0 if degrees_per_frame >= 0 else -1.0
+    interval = LerpHprInterval(
+        node_path,
+        duration,
+        hpr=(start[0] + 360.0 * direction, start[1], start[2]),
+        startHpr=start,
+        name=name,
+    )
+    interval.loop()
+    return interval
+
+
+class GridView:
+    """Root node for a grid of designs.
+
+    All objects hang off one root, so render state set on the root is shared.
+    Spinning grids rotate through intervals instead of Python tasks, and static
+    grids can be flattened into a handful of batched Geoms.
+    """
+
+    def __init__(self, parent, name="design_grid"):
+        self.root = parent.attachNewNode(name)
+        self.objects = []
+        self._intervals = []
+        self.flattened = False
+
+    def add(self, node_path):
+        """Move node_path (keeping its transform) under the grid root."""
+        node_path.reparentTo(self.root)
+        self.objects.append(node_path)
+        return node_path
+
+    def spin(self, degrees_per_frame):
+        """Spin every object around its own axis."""
+        self.stop_spin()
+        if self.flattened:
+            return
+        for i, obj in enumerate(self.objects):
+            self._intervals.append(spin_interval(obj, degrees_per_frame, name=f"{self.root.getName()}-spin-{i}"))
+
+    def stop_spin(self):
+        for interval in self._intervals:
+            interval.pause()
+        self._intervals = []
+
+    def flatten(self):
+        """Bake object transforms into the vertices and merge the Geoms.
+
+        Only for grids that stay static: individual objects can no longer be
+        moved, tinted or spun afterwards.
+        """
+        self.stop_spin()
+        self.root.flattenStrong()
+        self.objects = []
+        self.flattened = True
+
+    def remove(self):
+        self.stop_spin()
+        self.root.removeNode()
+        self.objects = []
@@ -0,0 +1,162 @@
+from direct.interval.IntervalManager import ivalMgr
+from direct.task import Task
+from panda3d.core import ClockObject, ConfigVariableBool, ConfigVariableDouble
+
+
+# Set "on-demand-rendering #f" in a prc file to render every frame again
+on_demand_rendering = ConfigVariableBool(
+    "on-demand-rendering", True,
+    "Only render frames when the camera, the scene or an animation changed.")
+on_demand_idle_frame_rate = ConfigVariableDouble(
+    "on-demand-idle-frame-rate", 20.0,
+    "Frame rate the main loop is throttled to while nothing needs rendering.")
+on_demand_heartbeat = ConfigVariableDouble(
+    "on-demand-heartbeat", 1.0,
+    "Seconds between safety redraws while idle.")
+
+# Tasks that run every frame anyway and do not mean anything is animating
+IDLE_TASK_NAMES = {
+    "resetPrevTransform", "dataLoop", "eventManager", "ivalLoop", "collisionLoop",
+    "garbageCollectStates", "igLoop", "audioLoop", "shadowCollisionLoop",
+    "simpleGarbageCollect", "on-demand-render",
+    # Camera movement is picked up from the camera transform instead
+    "orbit-mouse-task",
+}
+
+# Events that may change what is on screen
+DIRTY_EVENTS = ("window-event", "on-demand-button-down", "on-demand-button-up")
+
+
+class OnDemandRenderer:
+    """Dirty-flag rendering: the window is only drawn when something changed.
+
+    Something changed when the camera moved, the mouse moved or a button was
+    pressed, mark_dirty() was called (e.g. after a rebuild), an interval is
+    playing, or a task that is not in IDLE_TASK_NAMES is running (fades and
+    other task driven animations). Otherwise the window is deactivated - it
+    still processes events - and the main loop is throttled to
+    on-demand-idle-frame-rate. A redraw every on-demand-heartbeat seconds
+    covers anything that changes the screen without going through the above.
+    """
+
+    def __init__(self, showbase, idle_frame_rate=None, heartbeat=None):
+        self.showbase = showbase
+        self.idle_frame_rate = idle_frame_rate if idle_frame_rate is not None else on_demand_idle_frame_rate.getValue()
+        self.heartbeat = heartbeat if heartbeat is not None else on_demand_heartbeat.getValue()
+        self.idle_task_names = set(IDLE_TASK_NAMES)
+
+        self._pending_frames = 0
+        self._holds = set()
+        self._last_camera_transform = None
+        self._last_mouse = None
+        self._last_draw_time = 0.0
+        self._idle = False
+        self._installed = False
+        self._clock = ClockObject.getGlobalClock()
+        self._active_clock_mode = self._clock.getMode()
+
+    def install(self):
+        """Start managing the main window; no-op if already installed."""
+        if self._installed:
+            return
+        self._installed = True
+        self._active_clock_mode = self._clock.getMode()
+
+        # Route every button press/release through a single event we can watch
+        for thrower in getattr(self.showbase, "buttonThrowers", None) or []:
+            node = thrower.node()
+            if not node.getButtonDownEvent():
+                node.setButtonDownEvent("on-demand-button-down")
+            if not node.getButtonUpEvent():
+                node.setButtonUpEvent("on-demand-button-up")
+        for event in DIRTY_EVENTS:
+            self.showbase.accept(event, self._on_dirty_event)
+
+        self.mark_dirty()
+        # Runs after events and intervals, right before the frame is drawn
+        self.showbase.taskMgr.add(self._render_task, "on-demand-render", sort=45)
+
+    def uninstall(self):
+        """Go back to continuous rendering."""
+        if not self._installed:
+            return
+        self._installed = False
+        self.showbase.taskMgr.remove("on-demand-render")
+        for event in DIRTY_EVENTS:
+            self.showbase.ignore(event)
+        self._set_idle(False)
+
+    def mark_dirty(self, frames=2):
+        """Render at least the next frames frames (two, so both buffers are current)."""
+        self._pending_frames = max(self._pending_frames, frames)
+
+    def hold(self, key):
+        """Keep rendering every frame until release(key) is called."""
+        self._holds.add(key)
+
+    def release(self, key):
+        self._holds.discard(key)
+        self.mark_dirty()
+
+    def _on_dirty_event(self, *args):
+        self.mark_dirty()
+
+    def _animating(self):
+        if self._holds or ivalMgr.getNumIntervals() > 0:
+            return True
+        for task in self.showbase.taskMgr.getTasks():
+            if task.getName() not in self.idle_task_names:
+                return True
+        return False
+
+    def _camera_moved(self):
+        cam = getattr(self.showbase, "cam", None)
+        if cam is None or cam.isEmpty():
+            return False
+        transform = cam.getNetTransform()
+        moved = transform != self._last_camera_transform
+        self._last_camera_transform = transform
+        return moved
+
+    def _mouse_moved(self):
+        watcher = getattr(self.showbase, "mouseWatcherNode", None)
+        if watcher is None or not watcher.hasMouse():
+            mouse = None
+        else:
+            m = watcher.getMouse()
+            mouse = (m.getX(), m.getY())
+        moved = mouse != self._last_mouse
+        self._last_mouse = mouse
+        return moved
+
+    def _render_task(self, task):
+        now = self._clock.getRealTime()
+        # Evaluate every check so the cached camera/mouse state stays current
+        camera_moved = self._camera_moved()
+        mouse_moved = self._mouse_moved()
+        if camera_moved or mouse_moved:
+            self.mark_dirty()
+        draw = (
+            self._pending_frames > 0
+            or self._animating()
+            or now - self._last_draw_time >= self.heartbeat
+        )
+        if draw:
+            self._pending_frames = max(0, self._pending_frames - 1)
+            self._last_draw_time = now
+        self._set_idle(not draw)
+        return Task.cont
+
+    def _set_idle(self, idle):
+        win = getattr(self.showbase, "win", None)
+        if win is not None:
+            win.setActive(not idle)
+        if idle == self._idle:
+            return
+        self._idle = idle
+        if idle:
+            self._active_clock_mode = self._clock.getMode()
+            self._clock.setMode(ClockObject.MLimited)
+            self._clock.setFrameRate(self.idle_frame_rate)
+        else:
+            self._clock.setMode(self._active_clock_mode)
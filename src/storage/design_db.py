@@ -0,0 +1,330 @@
+"""
+Embedded SQLite database of designs, ratings, comparisons and exports.
+One file (WAL mode) replaces scanning the per-feature JSON lists when a
+question spans them, e.g. "all rated vases" or "the training matrix for
+Table": designs are indexed by object type, parameter hash and session, and
+the geometry parameters are real columns, so those are index lookups.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from utils.param_hash import GEOMETRY_PARAM_NAMES, param_hash
+
+
+# src/tmp/designs.db, wherever the app is started from
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tmp", "designs.db")
+
+# Column for each geometry parameter, in GEOMETRY_PARAM_NAMES order
+PARAM_COLUMNS = (
+    "segment_count",
+    "object_width",
+    "twist_angle",
+    "twist_groove_depth",
+    "vertical_wave_frequency",
+    "vertical_wave_depth",
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    object_type TEXT,
+    started_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS designs (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER REFERENCES sessions(id),
+    object_type TEXT NOT NULL,
+    param_hash TEXT NOT NULL,
+    name TEXT,
+    source TEXT,
+    {", ".join(f"{c} REAL" for c in PARAM_COLUMNS)},
+    parameters TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ratings (
+    id INTEGER PRIMARY KEY,
+    design_id INTEGER NOT NULL REFERENCES designs(id),
+    session_id INTEGER REFERENCES sessions(id),
+    rating REAL NOT NULL,
+    source TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS comparisons (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER REFERENCES sessions(id),
+    winner_id INTEGER NOT NULL REFERENCES designs(id),
+    loser_id INTEGER NOT NULL REFERENCES designs(id),
+    match_id INTEGER,
+    round INTEGER,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS exports (
+    id INTEGER PRIMARY KEY,
+    design_id INTEGER NOT NULL REFERENCES designs(id),
+    session_id INTEGER REFERENCES sessions(id),
+    path TEXT NOT NULL,
+    format TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_designs_object_type ON designs(object_type);
+CREATE INDEX IF NOT EXISTS idx_designs_param_hash ON designs(param_hash);
+CREATE INDEX IF NOT EXISTS idx_designs_session ON designs(session_id);
+CREATE INDEX IF NOT EXISTS idx_ratings_design ON ratings(design_id, id);
+CREATE INDEX IF NOT EXISTS idx_ratings_session ON ratings(session_id);
+CREATE INDEX IF NOT EXISTS idx_comparisons_session ON comparisons(session_id);
+CREATE INDEX IF NOT EXISTS idx_exports_design ON exports(design_id);
+"""
+
+# Latest rating of each design d (found through idx_ratings_design, so a
+# query filtered on object type only visits designs of that type)
+_LATEST_RATING = "JOIN ratings r ON r.id = (SELECT MAX(id) FROM ratings WHERE design_id = d.id)"
+
+
+def _now():
+    return datetime.now().isoformat()
+
+
+def normalize_db_object_type(object_type):
+    """Stored spelling of an object type ("vase" and "Vase" are the same)."""
+    return str(object_type or "Vase").strip().capitalize()
+
+
+class DesignDB:
+    """Connection to the design database; safe to share between threads.
+
+    Bulk methods (add_designs, add_ratings, add_comparisons) insert all rows
+    in one transaction.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql, args=(), tuples=False):
+        with self._lock:
+            cur = self._conn.cursor()
+            if tuples:
+                cur.row_factory = None
+            return cur.execute(sql, args).fetchall()
+
+    # ---------------------------
+    # Writing
+    # ---------------------------
+    def start_session(self, name=None, object_type=None):
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO sessions (name, object_type, started_at) VALUES (?, ?, ?)",
+                (name, normalize_db_object_type(object_type) if object_type else None, _now()),
+            )
+            return cur.lastrowid
+
+    def add_designs(self, designs, session_id=None, source=None):
+        """Insert designs in the JSON list format ({"Name", "parameters", "object_type", "Rating"}).
+
+        A design's "Rating", when set, is stored as its first rating.
+        Returns the new design ids, in input order.
+        """
+        now = _now()
+        rows, rated = [], []
+        for i, design in enumerate(designs):
+            params = design.get("parameters", {}) or {}
+            object_type = normalize_db_object_type(design.get("object_type"))
+            rows.append((
+                session_id, object_type, param_hash(params, object_type), design.get("Name"), source,
+                *(params.get(name) for name in GEOMETRY_PARAM_NAMES),
+                json.dumps(params), now,
+            ))
+            if design.get("Rating") is not None:
+                rated.append((i, float(design["Rating"])))
+        columns = ", ".join(("session_id", "object_type", "param_hash", "name", "source") + PARAM_COLUMNS
+                            + ("parameters", "created_at"))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO designs ({columns}) VALUES ({', '.join('?' * (len(PARAM_COLUMNS) + 7))})", rows
+            )
+            # Rows inserted in one transaction get consecutive ids
+            last = self._conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            ids = list(range(last - len(rows) + 1, last + 1)) if rows else []
+            self._conn.executemany(
+                "INSERT INTO ratings (design_id, session_id, rating, source, created_at) VALUES (?, ?, ?, ?, ?)",
+                [(ids[i], session_id, rating, source, now) for i, rating in rated],
+            )
+        return ids
+
+    def add_ratings(self, ratings, session_id=None, source=None):
+        """Insert (design_id, rating) pairs; a design's latest rating is the one that counts."""
+        now = _now()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO ratings (design_id, session_id, rating, source, created_at) VALUES (?, ?, ?, ?, ?)",
+                [(int(d), session_id, float(r), source, now) for d, r in ratings],
+            )
+
+    def add_comparisons(self, comparisons, session_id=None):
+        """Insert (winner_id, loser_id) or (winner_id, loser_id, match_id, round) tuples."""
+        now = _now()
+        rows = []
+        for c in comparisons:
+            winner, loser, match_id, rnd = (tuple(c) + (None, None))[:4]
+            rows.append((session_id, int(winner), int(loser), match_id, rnd, now))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO comparisons (session_id, winner_id, loser_id, match_id, round, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def record_rated_design(self, params, object_type, rating, source=None, session_id=None):
+        """Add a rating to the design from source with these parameters, creating it on first use."""
+        object_type = normalize_db_object_type(object_type)
+        rows = self._query(
+            "SELECT id FROM designs WHERE param_hash = ? AND object_type = ? AND source IS ? ORDER BY id DESC LIMIT 1",
+            (param_hash(params, object_type), object_type, source),
+        )
+        if rows:
+            self.add_ratings([(rows[0]["id"], rating)], session_id=session_id, source=source)
+            return rows[0]["id"]
+        design = {"parameters": params, "object_type": object_type, "Rating": rating}
+        return self.add_designs([design], session_id=session_id, source=source)[0]
+
+    def remove_designs(self, params, object_type, source=None):
+        """Delete the designs from source with these parameters, with their ratings and comparisons."""
+        object_type = normalize_db_object_type(object_type)
+        rows = self._query(
+            "SELECT id FROM designs WHERE param_hash = ? AND object_type = ? AND source IS ?",
+            (param_hash(params, object_type), object_type, source),
+        )
+        self._delete_designs([row["id"] for row in rows])
+        return len(rows)
+
+    def clear_source(self, source):
+        """Delete every design from source (e.g. all favorites of a user)."""
+        rows = self._query("SELECT id FROM designs WHERE source IS ?", (source,))
+        self._delete_designs([row["id"] for row in rows])
+        return len(rows)
+
+    def _delete_designs(self, ids):
+        if not ids:
+            return
+        args = [(i,) for i in ids]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM ratings WHERE design_id = ?", args)
+            self._conn.executemany("DELETE FROM exports WHERE design_id = ?", args)
+            self._conn.executemany("DELETE FROM comparisons WHERE winner_id = ? OR loser_id = ?", [(i, i) for i in ids])
+            self._conn.executemany("DELETE FROM designs WHERE id = ?", args)
+
+    def record_export(self, design_id, path, fmt=None, session_id=None):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO exports (design_id, session_id, path, format, created_at) VALUES (?, ?, ?, ?, ?)",
+                (int(design_id), session_id, path, fmt, _now()),
+            )
+
+    def import_design_file(self, path, source=None, session_id=None):
+        """Bulk-import one of the JSON design lists (favorites.txt, designs.txt, ...); returns the ids."""
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read().strip()
+        designs = json.loads(content) if content else []
+        return self.add_designs(designs, session_id=session_id, source=source or os.path.basename(path))
+
+    # ---------------------------
+    # Queries
+    # ---------------------------
+    def designs_by_hash(self, params, object_type=None):
+        """Stored designs with the same (quantized) parameters."""
+        if object_type is None:
+            return self._query("SELECT * FROM designs WHERE param_hash = ?", (param_hash(params),))
+        object_type = normalize_db_object_type(object_type)
+        return self._query(
+            "SELECT * FROM designs WHERE param_hash = ? AND object_type = ?",
+            (param_hash(params, object_type), object_type),
+        )
+
+    def session_designs(self, session_id):
+        return self._query("SELECT * FROM designs WHERE session_id = ? ORDER BY id", (session_id,))
+
+    def rated_designs(self, object_type, session_id=None):
+        """Designs of object_type with their latest rating, as dicts in the JSON list format."""
+        sql = f"SELECT d.*, r.rating FROM designs d {_LATEST_RATING} WHERE d.object_type = ?"
+        args = [normalize_db_object_type(object_type)]
+        if session_id is not None:
+            sql += " AND d.session_id = ?"
+            args.append(session_id)
+        return [
+            {
+                "id": row["id"],
+                "Name": row["name"],
+                "object_type": row["object_type"],
+                "parameters": json.loads(row["parameters"]),
+                "Rating": row["rating"],
+            }
+            for row in self._query(sql + " ORDER BY d.id", args)
+        ]
+
+    def training_matrix(self, object_type, session_id=None, bounds=None, source=None):
+        """(X, y) of every rated design of object_type, like BayesTrain.load_data().
+
+        Columns are the geometry parameters in slider order; with bounds
+        ({name: (min, max)}, e.g. from the slider config) they are
+        normalized to [0, 1]. session_id / source restrict the designs.
+        """
+        import numpy as np
+
+        sql = f"SELECT {', '.join('d.' + c for c in PARAM_COLUMNS)}, r.rating FROM designs d {_LATEST_RATING}" \
+              " WHERE d.object_type = ?"
+        args = [normalize_db_object_type(object_type)]
+        if session_id is not None:
+            sql += " AND d.session_id = ?"
+            args.append(session_id)
+        if source is not None:
+            sql += " AND d.source = ?"
+            args.append(source)
+        rows = self._query(sql + " ORDER BY d.id", args, tuples=True)
+        data = np.array(rows, dtype=float).reshape(-1, len(PARAM_COLUMNS) + 1)
+        X, y = data[:, :-1], data[:, -1]
+        if bounds is not None:
+            low = np.array([bounds[name][0] for name in GEOMETRY_PARAM_NAMES], dtype=float)
+            high = np.array([bounds[name][1] for name in GEOMETRY_PARAM_NAMES], dtype=float)
+            X = (X - low) / (high - low)
+        return X, y
+
+    def session_comparisons(self, session_id):
+        """(winner_id, loser_id) pairs of a session, in the order they were recorded."""
+        return [
+            (row["winner_id"], row["loser_id"])
+            for row in self._query(
+                "SELECT winner_id, loser_id FROM comparisons WHERE session_id = ? ORDER BY id", (session_id,)
+            )
+        ]
+
+
+_db = None
+_db_lock = threading.Lock()
+
+
+def get_design_db(path=DEFAULT_DB_PATH):
+    """Process-wide database connection."""
+    global _db
+    with _db_lock:
+        if _db is None:
+            _db = DesignDB(path)
+        return _db
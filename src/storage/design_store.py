@@ -0,0 +1,277 @@
+"""
+Append-only store for the JSON design/result lists the UI edits click by click.
+The list file itself (a JSON array, e.g. designs.txt or
+Batch1TournamentResults.txt) stays the format other modules read. Changes go
+to a sidecar log next to it (<file>.log, one JSON operation per line), are
+written behind in small batches, and are folded back into the list file by
+compaction. A click therefore costs one short append instead of a rewrite.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+
+
+LOG_SUFFIX = ".log"
+
+
+class DesignStoreConflict(RuntimeError):
+    """The files changed on disk while the store still had unsaved changes."""
+
+
+class DesignStore:
+    """A JSON list file plus an append-only operation log.
+
+    Entries are addressed by their position (the design id used by the UI).
+    Operations:
+        {"op": "append", "item": {...}}
+        {"op": "update", "id": 3, "fields": {"Rating": 4}}
+        {"op": "remove", "id": 3}          (later ids shift down, like del list[3])
+
+    Writes are buffered and appended to the log once flush_every operations
+    are pending or flush_interval seconds have passed (and at exit). The log
+    is compacted into the list file after compact_every operations, or when
+    compact() is called before handing the file to another reader. Changes
+    made to the files by someone else (e.g. the tmp folder being cleared) are
+    noticed on the next access and the store reloads. Unsaved changes made
+    before that belonged to the replaced file and cannot be applied to the
+    new one; they are dropped and the access raises DesignStoreConflict, so
+    the caller learns that they were lost.
+    """
+
+    def __init__(self, path, flush_every=16, flush_interval=1.0, compact_every=512):
+        self.path = path
+        self.log_path = path + LOG_SUFFIX
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.compact_every = compact_every
+        self._lock = threading.RLock()
+        self._items = []
+        self._by_name = {}          # "Name" -> id, for entries that have one
+        self._pending = []          # operations not yet in the log
+        self._log_ops = 0           # operations in the log file
+        self._last_flush = time.monotonic()
+        self._timer = None
+        self._signature = None
+        # Bumped whenever ids may have changed (reload, removal, clear), for
+        # callers that keep their own index over the entries
+        self.generation = 0
+        self._load()
+
+    # ---------------------------
+    # Loading
+    # ---------------------------
+    def _stat(self):
+        """(list file mtime, size, log size) as last seen on disk."""
+        try:
+            st = os.stat(self.path)
+            snapshot = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            snapshot = None
+        try:
+            log_size = os.path.getsize(self.log_path)
+        except OSError:
+            log_size = None
+        return snapshot, log_size
+
+    def _load(self):
+        items = []
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    items = json.load(f)
+            except (OSError, ValueError):
+                items = []
+        self._items = items if isinstance(items, list) else []
+        self._log_ops = 0
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self._apply(json.loads(line))
+                        self._log_ops += 1
+                    except (ValueError, KeyError, TypeError, IndexError):
+                        continue    # cut-off last line
+        self._reindex()
+        self._signature = self._stat()
+        self.generation += 1
+
+    def _sync(self):
+        """Reload if the files were changed behind the store's back (the new contents win)."""
+        if self._stat() != self._signature:
+            dropped = len(self._pending)
+            self._pending = []
+            self._load()
+            if dropped:
+                raise DesignStoreConflict(f"{self.path} changed on disk; {dropped} unsaved changes were lost")
+
+    def _reindex(self):
+        self._by_name = {
+            item["Name"]: i for i, item in enumerate(self._items) if isinstance(item, dict) and "Name" in item
+        }
+
+    def _apply(self, op):
+        if op["op"] == "append":
+            self._items.append(op["item"])
+            item = op["item"]
+            if isinstance(item, dict) and "Name" in item:
+                self._by_name[item["Name"]] = len(self._items) - 1
+        elif op["op"] == "update":
+            self._items[op["id"]].update(op["fields"])
+        elif op["op"] == "remove":
+            del self._items[op["id"]]
+            self._reindex()
+            self.generation += 1
+
+    # ---------------------------
+    # Reading
+    # ---------------------------
+    def __len__(self):
+        with self._lock:
+            self._sync()
+            return len(self._items)
+
+    def get(self, design_id):
+        with self._lock:
+            self._sync()
+            return self._items[design_id]
+
+    def id_for_name(self, name):
+        with self._lock:
+            self._sync()
+            return self._by_name.get(name)
+
+    def items(self):
+        """Current entries (a shallow copy of the list)."""
+        with self._lock:
+            self._sync()
+            return list(self._items)
+
+    # ---------------------------
+    # Writing
+    # ---------------------------
+    def append(self, item):
+        """Add an entry; returns its id."""
+        with self._lock:
+            self._sync()
+            self._record({"op": "append", "item": dict(item) if isinstance(item, dict) else item})
+            return len(self._items) - 1
+
+    def extend(self, items):
+        with self._lock:
+            self._sync()
+            for item in items:
+                self._record({"op": "append", "item": dict(item) if isinstance(item, dict) else item})
+
+    def update(self, design_id, **fields):
+        """Set fields of one entry (e.g. update(3, Rating=4))."""
+        with self._lock:
+            self._sync()
+            if not 0 <= design_id < len(self._items):
+                raise IndexError(f"design id {design_id} out of range ({len(self._items)} entries)")
+            self._record({"op": "update", "id": design_id, "fields": fields})
+
+    def remove(self, design_id):
+        """Delete one entry; the ids of the entries after it shift down by one."""
+        with self._lock:
+            self._sync()
+            if not 0 <= design_id < len(self._items):
+                raise IndexError(f"design id {design_id} out of range ({len(self._items)} entries)")
+            self._record({"op": "remove", "id": design_id})
+
+    def clear(self):
+        """Empty the list (file and log); use this rather than overwriting the file."""
+        with self._lock:
+            self._pending = []
+            self._items = []
+            self._reindex()
+            self.generation += 1
+            self._write_list()
+
+    def _record(self, op):
+        self._apply(op)
+        self._pending.append(op)
+        if len(self._pending) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+        elif self._timer is None:
+            # Write-behind: the rest of the batch follows within flush_interval
+            self._timer = threading.Timer(self.flush_interval, self._timed_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timed_flush(self):
+        try:
+            self.flush()
+        except DesignStoreConflict as e:
+            print(f"[DesignStore] {e}")
+
+    def flush(self):
+        """Append the pending operations to the log (one write)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._sync()
+            if self._pending:
+                directory = os.path.dirname(self.log_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(op, separators=(",", ":")) + "\n" for op in self._pending))
+                self._log_ops += len(self._pending)
+                self._pending = []
+                self._signature = self._stat()
+            self._last_flush = time.monotonic()
+            if self._log_ops >= self.compact_every:
+                self.compact()
+
+    def compact(self):
+        """Write the full list file and empty the log, so plain JSON readers see every change."""
+        with self._lock:
+            self._sync()
+            if not self._pending and not self._log_ops and os.path.exists(self.path):
+                return
+            self._write_list()
+
+    def _write_list(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._items, f, indent=2)
+        os.replace(tmp_path, self.path)
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        self._pending = []
+        self._log_ops = 0
+        self._last_flush = time.monotonic()
+        self._signature = self._stat()
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_design_store(path):
+    """Process-wide store for a list file, so every caller shares one in-memory copy."""
+    key = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = DesignStore(path)
+        return store
+
+
+@atexit.register
+def _flush_all():
+    for store in list(_stores.values()):
+        try:
+            store.flush()
+        except Exception:
+            pass
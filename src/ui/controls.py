@@ -19,7 +19,7 @@ from utils.ui_utils import (
 	get_all_parameters_from_sliders,
 	show_temporary_status,
 )
-from ui.favorites import save_favorite_to_file, FavoritesLabel
+from ui.favorites import save_favorite_to_file, load_favorites_from_file, get_favorites_index, remove_favorite, clear_favorites, FavoritesLabel
 from ui.favorites_tab_utils import format_favorite_header, create_remove_button, create_edit_button, create_similar_designs_button, create_back_to_favorites_button, create_save_generated_design_button
 from ExploreTab.explore_ui import ExplorePanel
 
@@ -452,9 +452,9 @@ class ParametricControls:
             # Path to AllDesigns.txt
             alldesigns_path = os.path.join("src", "ExploreTab", "Bayesian", "tmp_explore", "AllDesigns.txt")
             
-            # Create empty file or clear existing file
-            with open(alldesigns_path, 'w', encoding='utf-8') as f:
-                json.dump([], f, indent=2)
+            # Create empty file or clear existing file (and its append log)
+            from storage.design_store import get_design_store
+            get_design_store(alldesigns_path).clear()
             
             
         except Exception as e:
@@ -503,11 +503,8 @@ class ParametricControls:
         try:
             self.favorites_list = []
             self.current_favorite_index = 0
-            if os.path.exists("src/tmp/favorites.txt"):
-                with open("src/tmp/favorites.txt", "r") as f:
-                    loaded = json.load(f)
-                if isinstance(loaded, list):
-                    self.favorites_list = loaded
+            # The store also returns favorites that are only in favorites.txt.log
+            self.favorites_list = load_favorites_from_file("src/tmp/favorites.txt")
             
             # Display all favorites at once
             if callable(self.on_display_all_favorites):
@@ -600,6 +597,10 @@ class ParametricControls:
     def _open_explore(self):
         """Open the Explore tab UI and hide builder/favorites controls."""
         try:
+            # Start loading the ML/plotting modules in the background (first open only)
+            from utils.preload import preload_explore_modules
+            preload_explore_modules()
+
             # Clear AllDesigns.txt for fresh exploration session
             # Skip AllDesigns.txt clearing - not needed
 			
@@ -655,13 +656,14 @@ class ParametricControls:
         """Clear the favorites.txt file for new user."""
         try:
             favorites_path = "src/tmp/favorites.txt"
-            if os.path.exists(favorites_path):
-                with open(favorites_path, 'w') as f:
-                    f.write("")  # Clear the file
+            had_favorites = bool(load_favorites_from_file(favorites_path))
+            # Clear the file and its log (favorites may exist only in the log)
+            clear_favorites(favorites_path)
+            if had_favorites:
                 print(f"Cleared favorites file: {favorites_path}")
                 show_temporary_status(self.status_text, "Favorites cleared for new user!", (0, 0.8, 0, 1), 3)
             else:
-                print(f"Favorites file not found: {favorites_path}")
+                print(f"No favorites in {favorites_path}")
                 show_temporary_status(self.status_text, "No favorites to clear", (0.8, 0.8, 0, 1), 2)
         except Exception as e:
             print(f"Error clearing favorites file: {e}")
@@ -675,8 +677,8 @@ class ParametricControls:
             path = os.path.join(base, 'Designs.txt')
             if not os.path.exists(path):
                 return
-            with open(path, 'r', encoding='utf-8') as f:
-                designs = json.load(f)
+            from storage.design_store import get_design_store
+            designs = get_design_store(path).items()
             # Prefer explore-specific display if available
             if callable(self.on_display_round1_designs):
                 self.on_display_round1_designs(designs)
@@ -792,6 +794,8 @@ class ParametricControls:
         # Run genetic algorithm
         from GeneticAlgorithm.GA_proto import run_genetic_algorithm
         print("Running genetic algorithm...")
+        # The GA reads the favorites file itself
+        get_favorites_index("src/tmp/favorites.txt").store.compact()
         result = run_genetic_algorithm("src/tmp/favorites.txt", "src/tmp/designsGA.txt", verbose=True)
         print(f"Genetic algorithm result: {result}")
         if result:
@@ -854,21 +858,19 @@ class ParametricControls:
         
         # Reload favorites.txt back into the viewer
         try:
-            if os.path.exists("src/tmp/favorites.txt"):
-                with open("src/tmp/favorites.txt", "r") as f:
-                    loaded = json.load(f)
-                if isinstance(loaded, list):
-                    self.favorites_list = loaded
-                    self.current_favorite_index = 0
-                    
-                    # Display all favorites at once
-                    if callable(self.on_display_all_favorites):
-                        self.on_display_all_favorites(self.favorites_list)
-                    
-                    # Highlight the first favorite if available
-                    if self.favorites_list:
-                        self._highlight_current_favorite()
-                        self._update_favorites_header()
+            loaded = load_favorites_from_file("src/tmp/favorites.txt")
+            if isinstance(loaded, list):
+                self.favorites_list = loaded
+                self.current_favorite_index = 0
+                
+                # Display all favorites at once
+                if callable(self.on_display_all_favorites):
+                    self.on_display_all_favorites(self.favorites_list)
+                
+                # Highlight the first favorite if available
+                if self.favorites_list:
+                    self._highlight_current_favorite()
+                    self._update_favorites_header()
         except Exception as e:
             show_temporary_status(self.status_text, f"Failed to reload favorites: {e}", (1, 0, 0, 1), 3)
         
@@ -889,12 +891,7 @@ class ParametricControls:
 
             # Read current persisted favorites
             file_path = "src/tmp/favorites.txt"
-            persisted = []
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        persisted = json.loads(content)
+            persisted = load_favorites_from_file(file_path)
 
             if not persisted:
                 show_temporary_status(self.status_text, "Favorites file empty", (1, 1, 0, 1), 2)
@@ -903,15 +900,11 @@ class ParametricControls:
             if idx >= len(persisted):
                 idx = len(persisted) - 1
 
-            # Remove entry at index
-            del persisted[idx]
-
-            # Save back
-            with open(file_path, 'w') as f:
-                json.dump(persisted, f, indent=2)
+            # Remove entry at index (one log append)
+            remove_favorite(file_path, idx)
 
             # Update in-memory list
-            self.favorites_list = persisted
+            self.favorites_list = load_favorites_from_file(file_path)
 
             if not self.favorites_list:
                 # Clear scene if none remain
@@ -1053,9 +1046,16 @@ class ParametricControls:
         self.favorites_list = favorites_list
         self.current_favorite_index = 0
 
-    def show_overhang_warning(self):
-        """Show the persistent overhang warning message."""
-        self.overhang_warning_text.setText("Pull back on parameters, overhang is occurring")
+    def show_overhang_warning(self, severity=None):
+        """Show the persistent overhang warning message.
+
+        Args:
+            severity: Optional worst overhang angle in degrees, appended to the message
+        """
+        message = "Pull back on parameters, overhang is occurring"
+        if severity is not None:
+            message += f" ({severity:.0f}\N{DEGREE SIGN})"
+        self.overhang_warning_text.setText(message)
         self.overhang_warning_text.show()
 
     def hide_overhang_warning(self):
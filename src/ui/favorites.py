@@ -3,7 +3,6 @@ Favorites management system for the parametric design tool.
 Handles saving, loading, and managing favorite object configurations.
 """
 
-import json
 import os
 import builtins
 from datetime import datetime
@@ -52,10 +51,67 @@ class FavoritesLabel:
         self.button.hide()
 
 
+class FavoritesIndex:
+    """Favorites of one file, keyed by object type and quantized parameter hash.
+
+    Entries live in the shared append-only store for the file (see
+    storage/design_store.py), so saving, deduplicating and re-rating a
+    favorite is a dict lookup plus one log append.
+    """
+
+    def __init__(self, filename):
+        from storage.design_store import get_design_store
+
+        self.store = get_design_store(filename)
+        self._ids = {}
+        self._generation = None
+        self._indexed = 0
+
+    @staticmethod
+    def key(params, object_type):
+        from utils.param_hash import param_hash
+
+        # The hash alone would fold Stool into Vase (see normalize_object_type)
+        return object_type or "Unknown", param_hash(params or {})
+
+    def _refresh(self):
+        """Rebuild after the store reloaded or removed entries; otherwise index only new entries."""
+        count = len(self.store)     # picks up changes on disk first
+        if self._generation != self.store.generation:
+            self._ids = {}
+            self._generation = self.store.generation
+            entries = enumerate(self.store.items())
+        else:
+            entries = ((i, self.store.get(i)) for i in range(self._indexed, count))
+        for i, entry in entries:
+            # First match wins, like the old linear scan
+            self._ids.setdefault(self.key(entry.get("parameters"), entry.get("object_type")), i)
+        self._indexed = count
+
+    def find(self, params, object_type):
+        """Id of the favorite with these parameters, or None."""
+        self._refresh()
+        return self._ids.get(self.key(params, object_type))
+
+    def __len__(self):
+        return len(self.store)
+
+
+_favorites_indexes = {}
+
+
+def get_favorites_index(filename):
+    key = os.path.abspath(filename)
+    if key not in _favorites_indexes:
+        _favorites_indexes[key] = FavoritesIndex(filename)
+    return _favorites_indexes[key]
+
+
 def save_favorite_to_file(filename: str = "src/tmp/favorites.txt", params: dict = None, object_type: str = None, rating: int = None) -> int:
     """
     Save a favorite configuration to file.
     If parameters match an existing favorite, update the rating instead of creating a duplicate.
+    Parameters are matched by their quantized hash (utils/param_hash.py).
     
     Args:
         filename: File to save to
@@ -67,26 +123,12 @@ def save_favorite_to_file(filename: str = "src/tmp/favorites.txt", params: dict
         Total number of favorites
     """
     try:
-        # Load existing favorites
-        existing_favorites = []
-        if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                content = f.read().strip()
-                if content:
-                    existing_favorites = json.loads(content)
-        
-        # Check if there's an existing favorite with the same parameters and object type
-        existing_index = None
-        for i, existing_favorite in enumerate(existing_favorites):
-            if (existing_favorite.get("object_type") == object_type and 
-                existing_favorite.get("parameters") == params):
-                existing_index = i
-                break
+        favorites = get_favorites_index(filename)
+        existing_index = favorites.find(params, object_type)
         
         if existing_index is not None:
             # Update existing favorite's rating and timestamp
-            existing_favorites[existing_index]["Rating"] = rating
-            existing_favorites[existing_index]["timestamp"] = datetime.now().isoformat()
+            favorites.store.update(existing_index, Rating=rating, timestamp=datetime.now().isoformat())
             print(f"Updated existing favorite rating to {rating} stars")
         else:
             # Create new favorite entry
@@ -96,29 +138,54 @@ def save_favorite_to_file(filename: str = "src/tmp/favorites.txt", params: dict
                 "Rating": rating,
                 "parameters": params
             }
-            existing_favorites.append(favorite)
+            favorites.store.append(favorite)
             print(f"Created new favorite with {rating} stars")
         
-        # Save back to file
-        with open(filename, 'w') as f:
-            json.dump(existing_favorites, f, indent=2)
+        # Also record it in the design database (indexed queries across sessions)
+        if rating is not None:
+            try:
+                from storage.design_db import get_design_db
+                get_design_db().record_rated_design(params or {}, object_type, rating, source="favorites")
+            except Exception as e:
+                print(f"Error recording favorite in design database: {e}")
         
-        return len(existing_favorites)
+        return len(favorites)
         
     except Exception as e:
         print(f"Error saving favorite: {e}")
         return 0
 
 
+def remove_favorite(filename: str, index: int):
+    """Remove one favorite (one log append) and drop it from the design database."""
+    store = get_favorites_index(filename).store
+    favorite = store.get(index)
+    store.remove(index)
+    try:
+        from storage.design_db import get_design_db
+        get_design_db().remove_designs(favorite.get("parameters") or {}, favorite.get("object_type"), source="favorites")
+    except Exception as e:
+        print(f"Error removing favorite from design database: {e}")
+
+
+def clear_favorites(filename: str):
+    """Remove every favorite (file and log) and the favorites in the design database."""
+    get_favorites_index(filename).store.clear()
+    try:
+        from storage.design_db import get_design_db
+        get_design_db().clear_source("favorites")
+    except Exception as e:
+        print(f"Error clearing favorites in design database: {e}")
+
+
 def load_favorites_from_file(filename: str) -> list:
-    """Load favorites from file."""
+    """Load favorites from file (including changes not yet compacted into it).
+
+    The store is asked even if the file does not exist yet: new favorites
+    may only be in its log so far.
+    """
     try:
-        if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                content = f.read().strip()
-                if content:
-                    return json.loads(content)
-        return []
+        return get_favorites_index(filename).store.items()
     except Exception as e:
         print(f"Error loading favorites: {e}")
         return []
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+Helpers to identify designs by their parameters.
+Two parameter sets that only differ below the quantization step map to the
+same key, so callers can share meshes and deduplicate stored designs.
+"""
+
+import hashlib
+import json
+
+
+# Parameters that define the shape of a design, in a fixed order
+GEOMETRY_PARAM_NAMES = (
+    "Segment Count",
+    "Object Width",
+    "Twist Angle",
+    "Twist Groove Depth",
+    "Vertical Wave Frequency",
+    "Vertical Wave Depth",
+)
+
+# Parameters are compared after rounding to this many decimals
+PARAM_DECIMALS = 4
+
+
+def normalize_object_type(object_type):
+    """Map an object type string to the geometry builder that handles it."""
+    return "Table" if object_type == "Table" else "Vase"
+
+
+def quantize_params(params, decimals=PARAM_DECIMALS):
+    """Return the geometry parameters as a tuple of rounded values.
+
+    Segment Count is an integer slider, so it is truncated the same way the
+    geometry builders do. Missing parameters read as None.
+    """
+    values = []
+    for name in GEOMETRY_PARAM_NAMES:
+        value = params.get(name)
+        if value is None:
+            values.append(None)
+        elif name == "Segment Count":
+            values.append(int(value))
+        else:
+            # + 0.0 folds -0.0 into 0.0
+            values.append(round(float(value), decimals) + 0.0)
+    return tuple(values)
+
+
+def param_hash(params, object_type=None, decimals=PARAM_DECIMALS):
+    """Stable hex digest of the quantized parameters (and object type, if given)."""
+    key = {"params": quantize_params(params, decimals)}
+    if object_type is not None:
+        key["object_type"] = normalize_object_type(object_type)
+    payload = json.dumps(key, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,65 @@
+"""
+Background loading of the heavy modules used by the Explore tab.
+The builder view only needs Panda3D and NumPy; sklearn, scipy and matplotlib
+are imported in a daemon thread the first time Explore is opened, so they are
+usually ready by the time the first training run needs them.
+"""
+
+import importlib
+import threading
+import time
+
+
+# Imported in this order; the Explore modules last so their own imports are warm
+EXPLORE_MODULES = (
+    "numpy",
+    "scipy.stats",
+    "sklearn.gaussian_process",
+    "matplotlib.pyplot",
+    "ExploreTab.ExpErrorCheck.ExploreErrorCheck",
+    "ExploreTab.BayesTrain",
+    "ExploreTab.Extra.LatentMetric",
+    "ExploreTab.Extra.TournamentPlot",
+)
+
+# module name -> import time in ms (filled in by the preload thread)
+preload_timings = {}
+
+_preload_thread = None
+_preload_lock = threading.Lock()
+
+
+def _preload(modules):
+    start = time.perf_counter()
+    for name in modules:
+        t0 = time.perf_counter()
+        try:
+            if name.startswith("matplotlib"):
+                # Figures are only written to files; Agg also works off the main thread
+                import matplotlib
+                matplotlib.use("Agg")
+            importlib.import_module(name)
+            preload_timings[name] = (time.perf_counter() - t0) * 1000.0
+        except Exception as e:
+            print(f"[Preload] Failed to import {name}: {e}")
+    total_ms = (time.perf_counter() - start) * 1000.0
+    print(f"[Preload] Explore modules ready in {total_ms:.0f} ms")
+
+
+def preload_explore_modules(modules=EXPLORE_MODULES):
+    """Start importing modules in a daemon thread; only the first call starts it."""
+    global _preload_thread
+    with _preload_lock:
+        if _preload_thread is None:
+            _preload_thread = threading.Thread(target=_preload, args=(tuple(modules),), name="explore-preload", daemon=True)
+            _preload_thread.start()
+        return _preload_thread
+
+
+def wait_for_preload(timeout=None):
+    """Block until the preload thread (if started) is done. Returns True when done."""
+    thread = _preload_thread
+    if thread is None:
+        return True
+    thread.join(timeout)
+    return not thread.is_alive()
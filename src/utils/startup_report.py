@@ -0,0 +1,58 @@
+"""
+Startup-time report based on Python's -X importtime instrumentation.
+Imports a module in a fresh interpreter and lists the slowest imports, e.g.
+
+    python run.py --startup-report
+"""
+
+import os
+import subprocess
+import sys
+
+
+def measure_import_times(module="core.app", src_dir=None):
+    """Import module in a fresh interpreter with -X importtime.
+
+    Returns a list of (name, self_us, cumulative_us) in import order.
+    """
+    src_dir = src_dir or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = f"import sys; sys.path.insert(0, {src_dir!r}); import {module}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(src_dir),
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr.strip()}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return rows
+
+
+def format_import_report(rows, module="core.app", top=20):
+    """Text table of the slowest imports by cumulative time."""
+    total = next((cumulative for name, _self, cumulative in rows if name == module), 0)
+    lines = [
+        f"Startup import report for {module}: {total / 1000.0:.1f} ms total, {len(rows)} modules",
+        f"{'cumulative ms':>14} {'self ms':>9}  module",
+    ]
+    for name, self_us, cumulative_us in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        lines.append(f"{cumulative_us / 1000.0:14.1f} {self_us / 1000.0:9.1f}  {name}")
+
+    heavy = [name for name, _s, _c in rows if name.split(".")[0] in ("sklearn", "scipy", "matplotlib")]
+    if heavy:
+        lines.append(f"WARNING: {len(heavy)} heavy Explore modules imported at startup (e.g. {heavy[0]})")
+    return "\n".join(lines)
+
+
+def print_startup_report(module="core.app", top=20):
+    print(format_import_report(measure_import_times(module), module, top))
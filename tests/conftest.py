@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The app imports its packages from src/ (see run.py)
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+
+@pytest.fixture(autouse=True)
+def _repo_root_cwd(monkeypatch):
+    # Config paths (src/ExploreTab/Configuration.JSON, ...) are relative to the repo root
+    monkeypatch.chdir(REPO_ROOT)
@@ -0,0 +1,72 @@
+import itertools
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+pytest.importorskip("sklearn")
+
+from ExploreTab.ActivePairing import ActivePairingScheduler, expected_information_gain
+
+
+def _play(scheduler, strength):
+    """Run the tournament with the stronger design always winning; returns the number of picks."""
+    while True:
+        match = scheduler.next_match()
+        if match is None:
+            return len(scheduler.matches)
+        a, b = match["a_index"], match["b_index"]
+        winner, loser = (a, b) if strength[a] > strength[b] else (b, a)
+        scheduler.record(winner, loser)
+
+
+def test_defaults_allow_stopping_before_the_bracket_count():
+    scheduler = ActivePairingScheduler(12)
+    assert scheduler.max_matches == 11
+    assert scheduler.min_matches == 6
+    assert ActivePairingScheduler.from_config(12, {}).min_matches == 6
+
+
+def test_confident_ranking_stops_early():
+    n = 8
+    strength = np.arange(n)[::-1]
+    scheduler = ActivePairingScheduler(n, seed=0)
+    # Earlier evidence that already orders every pair
+    scheduler.engine.add_comparisons([(i, j) for i, j in itertools.combinations(range(n), 2)] * 4)
+    assert scheduler.ranking_confidence() >= scheduler.confidence
+
+    assert _play(scheduler, strength) == scheduler.min_matches < n - 1
+    assert scheduler.stop_reason == "confidence"
+
+
+def test_consistent_picks_stop_on_confidence():
+    n = 8
+    scheduler = ActivePairingScheduler(n, max_matches=6 * n, confidence=0.8, seed=0)
+    played = _play(scheduler, np.arange(n)[::-1])
+    assert scheduler.stop_reason == "confidence"
+    assert scheduler.min_matches <= played < 6 * n
+
+
+def test_uncertain_ranking_plays_up_to_max_matches():
+    scheduler = ActivePairingScheduler(8, seed=0)
+    assert _play(scheduler, np.arange(8)) == 7
+    assert scheduler.stop_reason == "max_matches"
+
+
+def test_never_the_same_pair_twice_in_a_row():
+    scheduler = ActivePairingScheduler(6, max_matches=20, min_matches=20, seed=1)
+    strength = np.arange(6)
+    last = None
+    while (match := scheduler.next_match()) is not None:
+        pair = tuple(sorted((match["a_index"], match["b_index"])))
+        assert pair != last
+        last = pair
+        a, b = pair
+        scheduler.record(*((a, b) if strength[a] > strength[b] else (b, a)))
+
+
+def test_information_gain():
+    # A certain outcome carries no information; an open one does
+    assert expected_information_gain(0.0, 0.0) == pytest.approx(0.0, abs=1e-9)
+    assert expected_information_gain(0.0, 4.0) > expected_information_gain(3.0, 4.0) > 0.0
+    assert expected_information_gain(1.5, 2.0) == pytest.approx(expected_information_gain(-1.5, 2.0))
@@ -0,0 +1,52 @@
+import threading
+import time
+from concurrent.futures import Future
+
+from ExploreTab import Artifacts
+
+
+class _SlowPool:
+    """Stands in for the artifact process; submit() is slow so racing callers overlap."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, *args):
+        time.sleep(0.01)
+        self.submitted += 1
+        return Future()
+
+
+def test_concurrent_submits_of_one_render_queue_it_once(monkeypatch, tmp_path):
+    pool = _SlowPool()
+    monkeypatch.setattr(Artifacts, "_get_pool", lambda: pool)
+    monkeypatch.setattr(Artifacts, "artifact_enabled", lambda kind: True)
+    monkeypatch.setattr(Artifacts, "_in_flight", {})
+    output_path = str(tmp_path / "plot.png")
+    barrier = threading.Barrier(8)
+    futures = []
+
+    def submit():
+        barrier.wait()
+        futures.append(Artifacts.submit_artifact("plot", "module:function", output_path=output_path, input_hash="h"))
+
+    threads = [threading.Thread(target=submit) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert pool.submitted == 1
+    assert len({id(f) for f in futures}) == 1
+
+
+def test_changed_inputs_are_rendered_again(monkeypatch, tmp_path):
+    pool = _SlowPool()
+    monkeypatch.setattr(Artifacts, "_get_pool", lambda: pool)
+    monkeypatch.setattr(Artifacts, "artifact_enabled", lambda kind: True)
+    monkeypatch.setattr(Artifacts, "_in_flight", {})
+    output_path = str(tmp_path / "plot.png")
+    first = Artifacts.submit_artifact("plot", "module:function", output_path=output_path, input_hash="a")
+    assert Artifacts.submit_artifact("plot", "module:function", output_path=output_path, input_hash="a") is first
+    assert Artifacts.submit_artifact("plot", "module:function", output_path=output_path, input_hash="b") is not first
+    assert pool.submitted == 2
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.gaussian_process import GaussianProcessRegressor
+
+from ExploreTab.BatchAcquisition import BatchAcquisition, load_slider_config
+from ExploreTab.BayesTrain import _make_kernel
+
+# Random toy data pushes some length scales to their bounds; that is expected here
+pytestmark = pytest.mark.filterwarnings("ignore", category=ConvergenceWarning)
+
+
+@pytest.fixture(scope="module")
+def model():
+    rng = np.random.RandomState(0)
+    X = rng.uniform(size=(20, 6))
+    y = 3.0 + np.sin(3.0 * X[:, 0]) - X[:, 2]
+    return GaussianProcessRegressor(kernel=_make_kernel(), normalize_y=True, random_state=0).fit(X, y)
+
+
+@pytest.mark.parametrize("batch_scheme", ["local_penalization", "kriging_believer"])
+def test_proposals_are_new_unrated_designs_in_slider_range(model, batch_scheme):
+    acquisition = BatchAcquisition(model, "Vase", batch_scheme=batch_scheme, n_candidates=512, seed=0)
+    designs = acquisition.propose_designs(6)
+
+    assert len(designs) == 6
+    assert len({tuple(d["parameters"].values()) for d in designs}) == 6
+    for design in designs:
+        # The Designs.txt format the next round reads
+        assert design["object_type"] == "Vase"
+        assert design["Rating"] is None
+        for name, (low, high), _default in load_slider_config("Vase"):
+            assert low <= design["parameters"][name] <= high
+        assert isinstance(design["parameters"]["Segment Count"], int)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.gaussian_process import GaussianProcessRegressor
+
+from ExploreTab import BayesTrain
+
+# Random toy data pushes some length scales to their bounds; that is expected here
+pytestmark = pytest.mark.filterwarnings("ignore", category=ConvergenceWarning)
+
+
+def _ratings(n, seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.uniform(size=(n, 6))
+    y = 3.0 + np.sin(3.0 * X[:, 0]) + X[:, 1] ** 2 - X[:, 2] + 0.05 * rng.normal(size=n)
+    return X, y
+
+
+@pytest.fixture
+def restart_pool(monkeypatch):
+    # Two workers even on a single-core machine, so the pool path runs
+    monkeypatch.setattr(BayesTrain.os, "cpu_count", lambda: 2)
+    yield
+    if BayesTrain._restart_pool is not None:
+        BayesTrain._restart_pool.shutdown()
+        BayesTrain._restart_pool = None
+
+
+def test_parallel_restarts_match_the_serial_sklearn_fit(restart_pool, capsys):
+    X, y = _ratings(30)
+    serial = GaussianProcessRegressor(
+        kernel=BayesTrain._make_kernel(),
+        normalize_y=True,
+        n_restarts_optimizer=BayesTrain.N_RESTARTS_OPTIMIZER,
+        random_state=BayesTrain.RANDOM_STATE,
+    ).fit(X, y)
+
+    parallel = BayesTrain.train_bayesian_gp(X, y, parallel=True)
+    assert BayesTrain._restart_pool is not None
+    assert "parallel restarts failed" not in capsys.readouterr().out
+    in_process = BayesTrain.train_bayesian_gp(X, y, parallel=False)
+
+    np.testing.assert_array_equal(parallel.kernel_.theta, serial.kernel_.theta)
+    np.testing.assert_array_equal(in_process.kernel_.theta, serial.kernel_.theta)
+    assert parallel.log_marginal_likelihood_value_ == serial.log_marginal_likelihood_value_
+    np.testing.assert_array_equal(parallel.predict(X), serial.predict(X))
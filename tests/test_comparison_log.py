@@ -0,0 +1,64 @@
+import json
+
+import numpy as np
+
+from ExploreTab.ComparisonLog import (
+    append_comparison,
+    iter_comparisons,
+    load_comparisons,
+    read_comparisons,
+    read_legacy_comparisons,
+    write_comparisons,
+)
+
+
+def test_append_and_read(tmp_path):
+    path = str(tmp_path / "sub" / "designsRatings.jsonl")
+    append_comparison(path, 3, 9, match_id=2, round=1)
+    append_comparison(path, np.int64(4), 1)
+
+    with open(path, "r", encoding="utf-8") as f:
+        first = json.loads(f.readline())
+    assert first == {"winner": 3, "loser": 9, "match_id": 2, "round": 1}
+
+    pairs = read_comparisons(path)
+    assert pairs.dtype == np.int64
+    np.testing.assert_array_equal(pairs, [[3, 9], [4, 1]])
+    assert list(iter_comparisons(path)) == [(3, 9), (4, 1)]
+
+
+def test_cut_off_last_line_is_skipped(tmp_path):
+    path = str(tmp_path / "designsRatings.jsonl")
+    write_comparisons(path, [(0, 1), (2, 3)])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"winner": 5, "lo')
+    np.testing.assert_array_equal(read_comparisons(path), [[0, 1], [2, 3]])
+
+
+def test_empty_log(tmp_path):
+    path = str(tmp_path / "designsRatings.jsonl")
+    write_comparisons(path, [])
+    assert read_comparisons(path).shape == (0, 2)
+
+
+def test_legacy_file_is_parsed_without_exec(tmp_path):
+    path = str(tmp_path / "designsRatings.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("comparisons = [(1, 0), (2, 5)]\n")
+    np.testing.assert_array_equal(read_legacy_comparisons(path), [[1, 0], [2, 5]])
+    np.testing.assert_array_equal(load_comparisons(path), [[1, 0], [2, 5]])
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("comparisons = __import__('os').getcwd()\n")
+    try:
+        read_legacy_comparisons(path)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("code in a legacy ratings file was evaluated")
+
+
+def test_load_comparisons_reads_json_lines(tmp_path):
+    path = str(tmp_path / "designsRatings.jsonl")
+    write_comparisons(path, [(7, 8)])
+    np.testing.assert_array_equal(load_comparisons(path), [[7, 8]])
@@ -0,0 +1,117 @@
+import json
+import os
+
+import pytest
+
+from storage.design_store import LOG_SUFFIX, DesignStore, DesignStoreConflict
+
+
+def _read_list(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def list_path(tmp_path):
+    path = str(tmp_path / "designs.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([{"Name": "a", "Rating": None}, {"Name": "b", "Rating": None}], f)
+    return path
+
+
+def _store(path):
+    # No timer-driven flushes during a test
+    return DesignStore(path, flush_every=1000, flush_interval=3600)
+
+
+def test_append_update_remove(list_path):
+    store = _store(list_path)
+    assert store.append({"Name": "c", "Rating": None}) == 2
+    store.update(1, Rating=4)
+    assert store.get(1)["Rating"] == 4
+    store.remove(0)
+    assert [item["Name"] for item in store.items()] == ["b", "c"]
+    assert store.id_for_name("c") == 1
+    assert store.id_for_name("a") is None
+    with pytest.raises(IndexError):
+        store.update(5, Rating=1)
+
+
+def test_flush_appends_to_the_log_and_a_new_store_replays_it(list_path):
+    store = _store(list_path)
+    store.extend([{"Name": "c"}, {"Name": "d"}])
+    store.update(0, Rating=2)
+    store.remove(1)
+    # Nothing written before the flush
+    assert not os.path.exists(list_path + LOG_SUFFIX)
+    store.flush()
+
+    with open(list_path + LOG_SUFFIX, "r", encoding="utf-8") as f:
+        assert len(f.read().splitlines()) == 4
+    # The list file itself is untouched until compaction
+    assert len(_read_list(list_path)) == 2
+    assert _store(list_path).items() == store.items()
+
+
+def test_compact_folds_the_log_into_the_list(list_path):
+    store = _store(list_path)
+    store.append({"Name": "c"})
+    store.update(2, Rating=5)
+    store.flush()
+    store.compact()
+
+    assert not os.path.exists(list_path + LOG_SUFFIX)
+    assert _read_list(list_path) == store.items()
+    assert _read_list(list_path)[2] == {"Name": "c", "Rating": 5}
+
+
+def test_compact_every_compacts_on_flush(list_path):
+    store = DesignStore(list_path, flush_every=1, flush_interval=3600, compact_every=3)
+    for name in "cde":
+        store.append({"Name": name})
+    assert not os.path.exists(list_path + LOG_SUFFIX)
+    assert [item["Name"] for item in _read_list(list_path)] == list("abcde")
+
+
+def test_cut_off_log_line_is_skipped(list_path):
+    store = _store(list_path)
+    store.append({"Name": "c"})
+    store.flush()
+    with open(list_path + LOG_SUFFIX, "a", encoding="utf-8") as f:
+        f.write('{"op": "append", "item": {"Na')
+    assert [item["Name"] for item in _store(list_path).items()] == ["a", "b", "c"]
+
+
+def test_clear(list_path):
+    store = _store(list_path)
+    store.append({"Name": "c"})
+    store.flush()
+    generation = store.generation
+    store.clear()
+    assert len(store) == 0
+    assert store.generation > generation
+    assert _read_list(list_path) == []
+    assert not os.path.exists(list_path + LOG_SUFFIX)
+
+
+def test_external_rewrite_reloads(list_path):
+    store = _store(list_path)
+    generation = store.generation
+    with open(list_path, "w", encoding="utf-8") as f:
+        json.dump([{"Name": "x"}, {"Name": "y"}, {"Name": "z"}], f)
+    assert [item["Name"] for item in store.items()] == ["x", "y", "z"]
+    assert store.generation > generation
+
+
+def test_external_rewrite_with_unsaved_changes_raises(list_path):
+    store = _store(list_path)
+    store.update(0, Rating=3)
+    with open(list_path, "w", encoding="utf-8") as f:
+        json.dump([{"Name": "x"}], f)
+    with pytest.raises(DesignStoreConflict):
+        store.flush()
+    # The new contents win and the store keeps working
+    assert store.items() == [{"Name": "x"}]
+    store.update(0, Rating=1)
+    store.flush()
+    assert _store(list_path).get(0) == {"Name": "x", "Rating": 1}
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.gaussian_process import GaussianProcessRegressor
+
+from ExploreTab.BayesTrain import _make_kernel
+from ExploreTab.IncrementalGP import _GPR_ALPHA, IncrementalGP, incremental_state_path
+
+# Random toy data pushes some length scales to their bounds; that is expected here
+pytestmark = pytest.mark.filterwarnings("ignore", category=ConvergenceWarning)
+
+
+def _ratings(n, seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.uniform(size=(n, 6))
+    y = 3.0 + np.sin(3.0 * X[:, 0]) + X[:, 1] ** 2 - X[:, 2] + 0.05 * rng.normal(size=n)
+    return X, y
+
+
+def _exact_gp(kernel, X, y):
+    # What GaussianProcessRegressor.fit() gives with the hyperparameters held fixed
+    return GaussianProcessRegressor(kernel=kernel, optimizer=None, normalize_y=True, alpha=_GPR_ALPHA).fit(X, y)
+
+
+def test_extended_factor_matches_a_full_fit(tmp_path):
+    X, y = _ratings(35)
+    X_test, _ = _ratings(50, seed=1)
+    gp = IncrementalGP(str(tmp_path / "gp_state.npz"), full_refit_every=4, parallel=False)
+
+    gp.update(X[:30], y[:30])
+    assert gp.last_update == "full"
+    theta = gp.theta.copy()
+
+    # Earlier ratings are re-estimated between runs; only the new rows extend the factor
+    y2 = y + 0.1
+    model = gp.update(X, y2)
+    assert gp.last_update == "incremental"
+    np.testing.assert_array_equal(gp.theta, theta)
+
+    reference = _exact_gp(_make_kernel().clone_with_theta(theta), X, y2)
+    np.testing.assert_allclose(model.L_, reference.L_, rtol=1e-6, atol=1e-8)
+    mean, std = model.predict(X_test, return_std=True)
+    ref_mean, ref_std = reference.predict(X_test, return_std=True)
+    np.testing.assert_allclose(mean, ref_mean, rtol=1e-6, atol=1e-6)
+    np.testing.assert_allclose(std, ref_std, rtol=1e-6, atol=1e-6)
+    assert model.log_marginal_likelihood_value_ == pytest.approx(reference.log_marginal_likelihood_value_, rel=1e-6)
+
+
+def test_state_survives_a_restart_and_refits_on_schedule(tmp_path):
+    X, y = _ratings(40)
+    state_path = str(tmp_path / "gp_state.npz")
+    IncrementalGP(state_path, full_refit_every=2, parallel=False).update(X[:30], y[:30])
+
+    gp = IncrementalGP(state_path, full_refit_every=2, parallel=False)
+    assert gp.load()
+    gp.update(X[:35], y[:35])
+    assert gp.last_update == "incremental"
+    gp.update(X, y)
+    assert gp.last_update == "full"
+
+
+def test_changed_earlier_rows_force_a_full_refit(tmp_path):
+    X, y = _ratings(35)
+    gp = IncrementalGP(str(tmp_path / "gp_state.npz"), parallel=False)
+    gp.update(X[:30], y[:30])
+    X_changed = X.copy()
+    X_changed[0] = 0.5
+    gp.update(X_changed, y)
+    assert gp.last_update == "full"
+
+
+def test_state_is_kept_outside_the_explore_tmp_folder():
+    explore_tmp = os.path.abspath(os.path.join("src", "ExploreTab", "tmp"))
+    path = incremental_state_path("Vase")
+    assert os.path.commonpath([explore_tmp, path]) != explore_tmp
+    assert incremental_state_path(None) == path
+    assert incremental_state_path("Table") != path
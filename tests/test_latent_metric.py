@@ -0,0 +1,139 @@
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+pytest.importorskip("sklearn")
+
+from scipy.optimize import minimize
+
+from ExploreTab.ComparisonLog import write_comparisons
+from ExploreTab.Extra.LatentMetric import LatentRatingEngine, compute_latent_values
+
+
+def _comparisons(num_designs, count, seed=0):
+    rng = np.random.RandomState(seed)
+    strength = rng.normal(size=num_designs)
+    pairs = []
+    for _ in range(count):
+        a, b = rng.choice(num_designs, 2, replace=False)
+        p = 1.0 / (1.0 + np.exp(strength[b] - strength[a]))
+        pairs.append((a, b) if rng.uniform() < p else (b, a))
+    return np.array(pairs, dtype=np.int64)
+
+
+def _dense_map_fit(num_designs, pairs, prior_precision=1.0):
+    """Bradley-Terry MAP estimate by a generic dense optimizer."""
+    w, l = pairs[:, 0], pairs[:, 1]
+
+    def objective(f):
+        d = f[w] - f[l]
+        p = 1.0 / (1.0 + np.exp(-d))
+        grad = prior_precision * f
+        np.add.at(grad, w, p - 1.0)
+        np.add.at(grad, l, 1.0 - p)
+        return np.logaddexp(0.0, -d).sum() + 0.5 * prior_precision * f @ f, grad
+
+    result = minimize(objective, np.zeros(num_designs), jac=True, method="L-BFGS-B", options={"gtol": 1e-10, "ftol": 1e-15})
+    return result.x
+
+
+def test_engine_matches_a_dense_fit():
+    pairs = _comparisons(12, 80)
+    engine = LatentRatingEngine(12)
+    engine.add_comparisons(pairs)
+    np.testing.assert_allclose(engine.scores, _dense_map_fit(12, pairs), atol=1e-5)
+
+
+def test_incremental_comparisons_match_a_single_fit():
+    pairs = _comparisons(10, 60, seed=1)
+    engine = LatentRatingEngine(10)
+    for start in range(0, len(pairs), 7):
+        engine.add_comparisons(pairs[start:start + 7])
+    assert engine.num_comparisons == len(pairs)
+    np.testing.assert_allclose(engine.scores, _dense_map_fit(10, pairs), atol=1e-5)
+
+
+def test_perfectly_separated_tournament_has_finite_scores():
+    # 0 beats everyone, 1 beats everyone but 0, ...
+    pairs = np.array([(i, j) for i in range(5) for j in range(i + 1, 5)])
+    engine = LatentRatingEngine(5)
+    engine.add_comparisons(pairs)
+    assert np.isfinite(engine.scores).all()
+    assert (np.diff(engine.scores) < 0).all()
+    np.testing.assert_allclose(engine.scores, _dense_map_fit(5, pairs), atol=1e-5)
+
+
+def test_new_designs_and_invalid_pairs():
+    pairs = _comparisons(8, 40, seed=2)
+    engine = LatentRatingEngine(6)
+    engine.add_designs(2)
+    # Self-comparisons and unknown ids are counted but ignored
+    engine.add_comparisons(np.vstack([pairs, [(3, 3), (0, 99)]]))
+    assert engine.num_comparisons == len(pairs) + 2
+    np.testing.assert_allclose(engine.scores, _dense_map_fit(8, pairs), atol=1e-5)
+
+
+def test_reset_matches_a_fresh_engine():
+    engine = LatentRatingEngine(10)
+    engine.add_comparisons(_comparisons(10, 50, seed=3))
+    pairs = _comparisons(6, 30, seed=4)
+    engine.reset(6)
+    engine.add_comparisons(pairs)
+    fresh = LatentRatingEngine(6)
+    fresh.add_comparisons(pairs)
+    assert engine.num_comparisons == len(pairs)
+    np.testing.assert_allclose(engine.scores, fresh.scores, atol=1e-10)
+
+
+def test_compute_latent_values_warm_start_and_reset(tmp_path):
+    designs_file = str(tmp_path / "designs.txt")
+    ratings_file = str(tmp_path / "designsRatings.jsonl")
+    with open(designs_file, "w", encoding="utf-8") as f:
+        json.dump([{"Name": f"d{i}"} for i in range(8)], f)
+
+    pairs = _comparisons(8, 40, seed=5)
+    write_comparisons(ratings_file, pairs[:20])
+    engine = LatentRatingEngine(8)
+    compute_latent_values(designs_file, ratings_file, engine)
+    write_comparisons(ratings_file, pairs)
+    names, f = compute_latent_values(designs_file, ratings_file, engine)
+    _names, f_fresh = compute_latent_values(designs_file, ratings_file)
+    assert names == [f"d{i}" for i in range(8)]
+    np.testing.assert_allclose(f, f_fresh, atol=1e-6)
+
+    # A shorter log (tmp folder cleared) refits from scratch
+    write_comparisons(ratings_file, pairs[:10])
+    _names, f = compute_latent_values(designs_file, ratings_file, engine)
+    _names, f_fresh = compute_latent_values(designs_file, ratings_file)
+    np.testing.assert_allclose(f, f_fresh, atol=1e-10)
+
+
+def test_refilled_log_is_not_mixed_with_the_previous_session(tmp_path):
+    designs_file = str(tmp_path / "designs.txt")
+    ratings_file = str(tmp_path / "designsRatings.jsonl")
+    with open(designs_file, "w", encoding="utf-8") as f:
+        json.dump([{"Name": f"d{i}"} for i in range(8)], f)
+
+    engine = LatentRatingEngine(8)
+    write_comparisons(ratings_file, _comparisons(8, 20, seed=6))
+    compute_latent_values(designs_file, ratings_file, engine)
+    # A new session: the log was cleared and refilled past the old length
+    write_comparisons(ratings_file, _comparisons(8, 30, seed=7))
+    _names, f = compute_latent_values(designs_file, ratings_file, engine)
+    _names, f_fresh = compute_latent_values(designs_file, ratings_file)
+    assert engine.num_comparisons == 30
+    np.testing.assert_allclose(f, f_fresh, atol=1e-10)
+
+
+def test_has_seen():
+    pairs = _comparisons(6, 10, seed=8)
+    engine = LatentRatingEngine(6)
+    assert engine.has_seen(pairs)
+    engine.add_comparisons(pairs[:4])
+    engine.add_comparison(*pairs[4])
+    assert engine.has_seen(pairs)
+    assert engine.has_seen(pairs[:5])
+    assert not engine.has_seen(pairs[:4])
+    assert not engine.has_seen(pairs[::-1])
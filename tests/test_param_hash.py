@@ -0,0 +1,49 @@
+from utils.param_hash import GEOMETRY_PARAM_NAMES, normalize_object_type, param_hash, quantize_params
+
+
+def _params(**overrides):
+    params = {
+        "Segment Count": 12,
+        "Object Width": 1.25,
+        "Twist Angle": 30.0,
+        "Twist Groove Depth": 0.0,
+        "Vertical Wave Frequency": 2.5,
+        "Vertical Wave Depth": 0.1,
+    }
+    params.update(overrides)
+    return params
+
+
+def test_differences_below_the_quantization_step_hash_equal():
+    assert param_hash(_params(**{"Object Width": 1.25 + 1e-7})) == param_hash(_params())
+    assert param_hash(_params(**{"Object Width": 1.2501})) != param_hash(_params())
+
+
+def test_negative_zero_folds_into_zero():
+    assert param_hash(_params(**{"Twist Groove Depth": -0.0})) == param_hash(_params())
+    assert param_hash(_params(**{"Twist Groove Depth": -1e-9})) == param_hash(_params())
+
+
+def test_segment_count_is_truncated_like_the_builders():
+    assert quantize_params(_params(**{"Segment Count": 12.7}))[0] == 12
+    assert param_hash(_params(**{"Segment Count": 12.7})) == param_hash(_params())
+
+
+def test_missing_parameters_read_as_none():
+    params = _params()
+    del params["Vertical Wave Depth"]
+    values = quantize_params(params)
+    assert len(values) == len(GEOMETRY_PARAM_NAMES)
+    assert values[-1] is None
+
+
+def test_extra_parameters_are_ignored():
+    assert param_hash(_params(Color="red")) == param_hash(_params())
+
+
+def test_object_type():
+    assert normalize_object_type("Table") == "Table"
+    assert normalize_object_type("Stool") == "Vase"
+    assert param_hash(_params(), "Stool") == param_hash(_params(), "Vase")
+    assert param_hash(_params(), "Table") != param_hash(_params(), "Vase")
+    assert param_hash(_params(), "Vase") != param_hash(_params())
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.gaussian_process import GaussianProcessRegressor
+
+from ExploreTab.SparseGP import SparseGPRegressor
+
+# Random toy data pushes some length scales to their bounds; that is expected here
+pytestmark = pytest.mark.filterwarnings("ignore", category=ConvergenceWarning)
+
+
+def _ratings(n, seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.uniform(size=(n, 6))
+    y = 3.0 + np.sin(3.0 * X[:, 0]) + X[:, 1] ** 2 - X[:, 2] + 0.05 * rng.normal(size=n)
+    return X, y
+
+
+def test_every_point_inducing_is_the_exact_gp():
+    X, y = _ratings(60)
+    X_test, _ = _ratings(40, seed=1)
+    model = SparseGPRegressor(n_inducing=60, hyper_subset=60).fit(X, y, parallel=False)
+
+    reference = GaussianProcessRegressor(kernel=model.kernel_, optimizer=None, normalize_y=True).fit(X, y)
+    mean, std = model.predict(X_test, return_std=True)
+    ref_mean, ref_std = reference.predict(X_test, return_std=True)
+    np.testing.assert_allclose(mean, ref_mean, rtol=1e-4, atol=1e-4)
+    np.testing.assert_allclose(std, ref_std, rtol=1e-4, atol=1e-4)
+
+
+def test_chunking_does_not_change_the_result():
+    X, y = _ratings(120)
+    X_test, _ = _ratings(30, seed=1)
+    whole = SparseGPRegressor(n_inducing=40, hyper_subset=60).fit(X, y, parallel=False)
+    chunked = SparseGPRegressor(n_inducing=40, hyper_subset=60, chunk_size=7).fit(X, y, parallel=False)
+    for a, b in zip(whole.predict(X_test, return_std=True), chunked.predict(X_test, return_std=True)):
+        np.testing.assert_allclose(a, b, rtol=1e-8, atol=1e-10)
+    assert chunked.score(X, y) > 0.5
@@ -0,0 +1,140 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from ExploreTab.BatchAcquisition import load_slider_config
+from ExploreTab.TrainingCache import TrainingMatrixCache, training_cache_path
+
+
+def _designs(n, seed=0, object_type="Vase"):
+    rng = np.random.RandomState(seed)
+    designs = []
+    for i in range(n):
+        params = {name: float(rng.uniform(*bounds)) for name, bounds, _default in load_slider_config(object_type)}
+        rating = None if i % 4 == 3 else float(rng.randint(1, 6))
+        designs.append({"Name": f"d{seed}_{i}", "object_type": object_type, "parameters": params, "Rating": rating})
+    return designs
+
+
+def _expected(designs):
+    slider = load_slider_config(designs[0]["object_type"])
+    low = np.array([rng[0] for _name, rng, _default in slider])
+    high = np.array([rng[1] for _name, rng, _default in slider])
+    rated = [d for d in designs if d["Rating"] is not None]
+    X = np.array([[d["parameters"][name] for name, _rng, _default in slider] for d in rated])
+    return (X - low) / (high - low), np.array([d["Rating"] for d in rated])
+
+
+def _write(path, designs, age=None):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(designs, f, indent=2)
+    if age is not None:
+        # Old enough that its signature is trusted without a hash check
+        mtime = os.stat(path).st_mtime - age
+        os.utime(path, (mtime, mtime))
+
+
+def _assert_loads(cache, designs):
+    X, y = cache.load()
+    X_ref, y_ref = _expected(designs)
+    np.testing.assert_allclose(X, X_ref)
+    np.testing.assert_array_equal(y, y_ref)
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    return str(tmp_path / "designs.txt")
+
+
+def test_matches_a_direct_normalization(data_path):
+    designs = _designs(20)
+    _write(data_path, designs)
+    cache = TrainingMatrixCache(data_path)
+    _assert_loads(cache, designs)
+    assert cache.status == "rebuilt"
+    assert cache.object_type == "Vase"
+    assert os.path.exists(training_cache_path(data_path))
+
+
+def test_untouched_old_file_is_not_read_again(data_path):
+    designs = _designs(12)
+    _write(data_path, designs, age=60)
+    cache = TrainingMatrixCache(data_path)
+    cache.load()
+    _assert_loads(cache, designs)
+    assert cache.status == "cached"
+
+
+def test_recent_file_is_confirmed_by_hash(data_path):
+    designs = _designs(12)
+    _write(data_path, designs)
+    cache = TrainingMatrixCache(data_path)
+    cache.load()
+    _assert_loads(cache, designs)
+    assert cache.status == "unchanged"
+
+
+def test_returned_arrays_are_copies(data_path):
+    _write(data_path, _designs(8), age=60)
+    cache = TrainingMatrixCache(data_path)
+    X, y = cache.load()
+    X[:] = -1.0
+    y[:] = -1.0
+    assert (cache.load()[1] >= 1).all()
+
+
+def test_appended_designs_are_parsed_alone(data_path):
+    designs = _designs(12)
+    _write(data_path, designs)
+    cache = TrainingMatrixCache(data_path)
+    cache.load()
+
+    designs += _designs(5, seed=1)
+    _write(data_path, designs)
+    _assert_loads(cache, designs)
+    assert cache.status == "appended 5 entries"
+
+
+def test_rewritten_ratings_are_picked_up(data_path):
+    designs = _designs(12)
+    _write(data_path, designs, age=60)
+    cache = TrainingMatrixCache(data_path)
+    cache.load()
+    mtime_ns = os.stat(data_path).st_mtime_ns
+
+    # Same size and the old mtime restored: only ctime/inode give it away
+    designs[0]["Rating"] = 1.0 if designs[0]["Rating"] != 1.0 else 2.0
+    _write(data_path, designs)
+    os.utime(data_path, ns=(mtime_ns, mtime_ns))
+    _assert_loads(cache, designs)
+    assert cache.status == "rebuilt"
+
+
+def test_cache_file_is_reused_by_a_new_process(data_path):
+    designs = _designs(12)
+    _write(data_path, designs, age=60)
+    TrainingMatrixCache(data_path).load()
+
+    cache = TrainingMatrixCache(data_path)
+    _assert_loads(cache, designs)
+    assert cache.status == "loaded from disk"
+
+
+def test_stale_cache_file_is_ignored(data_path):
+    _write(data_path, _designs(12), age=60)
+    TrainingMatrixCache(data_path).load()
+
+    designs = _designs(6, seed=2)
+    _write(data_path, designs, age=30)
+    cache = TrainingMatrixCache(data_path)
+    _assert_loads(cache, designs)
+    assert cache.status == "rebuilt"
+
+
+def test_empty_list(data_path):
+    _write(data_path, [])
+    X, y = TrainingMatrixCache(data_path).load()
+    assert X.shape == (0,)
+    assert y.shape == (0,)
@@ -0,0 +1,120 @@
+import itertools
+import threading
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.gaussian_process import GaussianProcessRegressor
+
+from ExploreTab.BayesTrain import _make_kernel
+from ExploreTab.UncertaintyMap import (
+    cell_index,
+    cell_std,
+    coverage,
+    grid_chunks,
+    predict_std_chunked,
+    sobol_chunks,
+    summarize_uncertainty,
+    uncertainty_map,
+)
+
+# Random toy data pushes some length scales to their bounds; that is expected here
+pytestmark = pytest.mark.filterwarnings("ignore", category=ConvergenceWarning)
+
+
+@pytest.fixture(scope="module")
+def model():
+    rng = np.random.RandomState(0)
+    X = rng.uniform(size=(25, 6))
+    y = 3.0 + np.sin(3.0 * X[:, 0]) - X[:, 2]
+    return GaussianProcessRegressor(kernel=_make_kernel(), normalize_y=True, random_state=0).fit(X, y)
+
+
+class _CountingModel:
+    """Wraps a model and counts finished predict() calls."""
+
+    def __init__(self, model):
+        self.model = model
+        self.finished = 0
+        self._lock = threading.Lock()
+
+    def predict(self, X, return_std=False):
+        result = self.model.predict(X, return_std=return_std)
+        with self._lock:
+            self.finished += 1
+        return result
+
+
+def test_chunked_std_matches_one_predict_call(model):
+    points = np.concatenate(list(sobol_chunks(1000, 6, 1024, seed=3)))
+    chunks = (points[start:start + 100] for start in range(0, len(points), 100))
+    chunk_points, chunk_std = predict_std_chunked(model, chunks, workers=3, max_in_flight=2)
+
+    _mean, std = model.predict(points, return_std=True)
+    # Chunks come back in order, stored as float32
+    np.testing.assert_array_equal(chunk_points, points.astype(np.float32))
+    assert chunk_std.dtype == np.float32
+    np.testing.assert_allclose(chunk_std, std, rtol=1e-5, atol=1e-6)
+
+
+def test_at_most_max_in_flight_chunks_are_queued(model):
+    counting = _CountingModel(model)
+    max_in_flight = 3
+    backlog = []
+
+    def chunks():
+        for k, chunk in enumerate(grid_chunks(3, 6, 50)):
+            # Chunks handed out so far minus the ones already predicted
+            backlog.append(k - counting.finished)
+            yield chunk
+
+    points, _std = predict_std_chunked(counting, chunks(), workers=2, max_in_flight=max_in_flight)
+    assert len(points) == 3 ** 6
+    assert max(backlog) <= max_in_flight - 1
+
+
+def test_grid_and_sobol_points():
+    grid = np.concatenate(list(grid_chunks(3, 2, 4)))
+    expected = np.array(list(itertools.product([1 / 6, 1 / 2, 5 / 6], repeat=2)))
+    np.testing.assert_allclose(grid, expected)
+
+    sobol = list(sobol_chunks(1000, 6, 300))
+    assert [len(c) for c in sobol] == [300, 300, 300, 124]
+    sobol = np.concatenate(sobol)
+    assert ((sobol >= 0) & (sobol < 1)).all()
+
+
+def test_cell_index_and_coverage():
+    # Boundaries belong to the lower cell, like the "> 0.5" binning of the 64-cell plot
+    np.testing.assert_array_equal(cell_index(np.array([[0.0, 0.5], [0.5, 0.51], [1.0, 1.0]]), 2), [0, 1, 3])
+    X = np.array([[0.1, 0.1], [0.2, 0.3], [0.9, 0.1]])
+    assert coverage(X, 2) == (2, 4, 50.0)
+    assert coverage(np.zeros((0, 2)), 2) == (0, 4, 0.0)
+
+
+def test_cell_std_and_summary():
+    points = np.array([[0.1, 0.1], [0.2, 0.2], [0.9, 0.9]])
+    std = np.array([1.0, 3.0, 5.0])
+    per_cell = cell_std(points, std, 2)
+    np.testing.assert_array_equal(per_cell[[0, 3]], [2.0, 5.0])
+    assert np.isnan(per_cell[[1, 2]]).all()
+
+    summary = summarize_uncertainty(points, std, points[:1], quantiles=(0.5, 0.99), levels=(2,), std_threshold=4.0)
+    assert summary["n_points"] == 3
+    assert summary["std_quantiles"] == {"0.5": 3.0, "0.99": pytest.approx(np.quantile(std, 0.99))}
+    assert summary["fraction_below_threshold"] == pytest.approx(2 / 3)
+    assert summary["levels"]["2"] == {
+        "cells": 4, "occupied": 1, "coverage_pct": 25.0, "max_cell_std": 5.0, "median_cell_std": 3.5,
+    }
+
+
+def test_uncertainty_map_grid(model):
+    points, std, summary = uncertainty_map(model, model.X_train_, method="grid", grid_levels=3, chunk_size=100)
+    assert points.shape == (3 ** 6, 6)
+    _mean, expected = model.predict(points.astype(float), return_std=True)
+    np.testing.assert_allclose(std, expected, rtol=1e-4, atol=1e-5)
+    assert summary["method"] == "grid"
+    assert summary["n_points"] == 3 ** 6
@@ -0,0 +1,118 @@
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("panda3d")
+
+from panda3d.core import GeomVertexReader
+
+from geometry.vase import geometry as vase
+
+# Slider values (see vase/config.py), with and without overhangs
+DESIGNS = [
+    {"segment_count": 9, "object_width": 2.5, "twist_angle": 20, "twist_groove_depth": 1.0,
+     "vertical_wave_freq": 3.0, "vertical_wave_depth": 1.0},
+    {"segment_count": 2, "object_width": 2.0, "twist_angle": 45, "twist_groove_depth": 8.0,
+     "vertical_wave_freq": 0.0, "vertical_wave_depth": 0.0},
+    {"segment_count": 5, "object_width": 3.0, "twist_angle": 0, "twist_groove_depth": 0.0,
+     "vertical_wave_freq": 15.0, "vertical_wave_depth": 5.0},
+    {"segment_count": 9, "object_width": 2.5, "twist_angle": 45, "twist_groove_depth": 8.0,
+     "vertical_wave_freq": 12.0, "vertical_wave_depth": 4.0},
+]
+
+
+def _baseline_has_overhang(segment_count=16, object_width=1.0, twist_angle=0.0, twist_groove_depth=1.0,
+                           vertical_wave_freq=3.0, vertical_wave_depth=1.0, max_overhang_angle=vase.overhangAngle):
+    """The per-face check of the original quad-by-quad builder (any outer wall face colored red)."""
+    segments, height_segments, height = vase.segments, vase.height_segments, vase.objectHeight
+
+    def radius(phi, length_ratio):
+        phi += twist_angle * 0.067 * math.pi * length_ratio
+        return (object_width + (twist_groove_depth * 0.06) * math.cos(segment_count * phi)
+                + (vertical_wave_depth * 0.15) * math.cos(vertical_wave_freq * length_ratio))
+
+    for h in range(height_segments):
+        z1 = height / 2.0 - (height * h) / height_segments
+        z2 = height / 2.0 - (height * (h + 1)) / height_segments
+        l1 = 1.0 - h / height_segments
+        l2 = 1.0 - (h + 1) / height_segments
+        for i in range(segments):
+            a1 = (2.0 * math.pi * i) / segments
+            a2 = (2.0 * math.pi * ((i + 1) % segments)) / segments
+            v0 = np.array([radius(a1, l1) * math.cos(a1), radius(a1, l1) * math.sin(a1), z1])
+            v1 = np.array([radius(a1, l2) * math.cos(a1), radius(a1, l2) * math.sin(a1), z2])
+            v2 = np.array([radius(a2, l2) * math.cos(a2), radius(a2, l2) * math.sin(a2), z2])
+            cross = np.cross(v1 - v0, v2 - v0)
+            cross_len = np.linalg.norm(cross)
+            if cross_len > 1e-9:
+                angle_deg = 90.0 - math.degrees(math.acos(max(-1.0, min(1.0, cross[2] / cross_len))))
+                if angle_deg <= -max_overhang_angle:
+                    return True
+    return False
+
+
+def _inner_band_count():
+    # Bands whose upper row lies above the inner bottom plane (0.2 above the base)
+    height = vase.objectHeight
+    return sum(
+        height / 2.0 - (height * h) / vase.height_segments > -height / 2.0 + 0.2
+        for h in range(vase.height_segments)
+    )
+
+
+def _mesh(geom):
+    vdata = geom.getVertexData()
+    reader = GeomVertexReader(vdata, "normal")
+    normals = []
+    while not reader.isAtEnd():
+        n = reader.getData3()
+        normals.append((n[0], n[1], n[2]))
+    prim = geom.getPrimitive(0)
+    indices = np.array([prim.getVertex(i) for i in range(prim.getNumVertices())])
+    return vdata.getNumRows(), np.array(normals), indices.reshape(-1, 3)
+
+
+@pytest.mark.parametrize("params", DESIGNS)
+def test_welded_grid(params):
+    _ot, geom, _material, _has_overhang = vase.vaseGeometry(**params)
+    vertex_count, normals, triangles = _mesh(geom)
+    segments, height_segments, inner_bands = vase.segments, vase.height_segments, _inner_band_count()
+
+    # Same triangles as the quad-by-quad builder: two fans, both walls and the top rim
+    assert len(triangles) == 2 * segments + 2 * segments * (height_segments + inner_bands) + 2 * segments
+    # Wall vertices are shared: one per grid node instead of two per band and angle
+    assert vertex_count == (
+        2 * (segments + 1)                      # bottom caps
+        + (height_segments + 1) * segments      # outer wall grid
+        + (inner_bands + 1) * segments          # inner wall grid
+        + 2 * segments                          # top rim
+    )
+    assert set(np.unique(triangles)) == set(range(vertex_count))
+    np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0, atol=1e-5)
+
+
+def test_outer_wall_normals_point_outward():
+    _ot, geom, _material, _has_overhang = vase.vaseGeometry(**DESIGNS[3])
+    vdata = geom.getVertexData()
+    points, normals = [], []
+    for column, out in (("vertex", points), ("normal", normals)):
+        reader = GeomVertexReader(vdata, column)
+        while not reader.isAtEnd():
+            v = reader.getData3()
+            out.append((v[0], v[1], v[2]))
+    start = 2 * (vase.segments + 1)
+    stop = start + (vase.height_segments + 1) * vase.segments
+    points, normals = np.array(points)[start:stop], np.array(normals)[start:stop]
+    assert (np.sum(points[:, :2] * normals[:, :2], axis=1) > 0).all()
+
+
+@pytest.mark.parametrize("params", DESIGNS)
+def test_has_overhang_matches_the_original_builder(params):
+    _ot, _geom, _material, has_overhang = vase.vaseGeometry(**params)
+    assert has_overhang == _baseline_has_overhang(**params)
+
+
+def test_designs_cover_both_overhang_outcomes():
+    outcomes = {_baseline_has_overhang(**params) for params in DESIGNS}
+    assert outcomes == {True, False}